@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bisect as-of index vs the reverse linear scan in get_value_on_date.
+
+Checks that both agree (including None before the first observation) on a
+random sample of targets, then times single and batched multi-horizon lookups.
+Also checks that building the index on a 1M-row series allocates next to
+nothing (it bisects the ordinal column in place rather than copying it).
+
+Usage: python3 benchmarks/bench_asof.py [observations] [lookups]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import get_value_on_date, get_values_on_dates
+from market_series import Series
+
+
+def make_series(n):
+    """Business-day series with random holiday gaps"""
+    rng = random.Random(7)
+    series = Series(name="SYNTH")
+    day = datetime(1990, 1, 2)
+    value = 1000.0
+    while len(series) < n:
+        if day.weekday() < 5 and rng.random() > 0.03:
+            value *= 1 + rng.gauss(0, 0.01)
+            series.append(day, value)
+        day += timedelta(days=1)
+    return series
+
+
+def linear_value_on_date(data, target_date):
+    """The original reverse scan, kept as the reference implementation"""
+    for d, v in reversed(data):
+        if d <= target_date:
+            return v
+    return None
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    series = make_series(n)
+    pairs = list(series)
+    first, last = pairs[0][0], pairs[-1][0]
+    span = (last - first).days
+
+    rng = random.Random(11)
+    targets = [first + timedelta(days=rng.randint(-30, span + 30), hours=rng.randint(0, 23))
+               for _ in range(lookups)]
+
+    for t in targets:
+        assert get_value_on_date(series, t) == linear_value_on_date(pairs, t), t
+
+    start = time.perf_counter()
+    for t in targets:
+        linear_value_on_date(pairs, t)
+    t_linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for t in targets:
+        get_value_on_date(series, t)
+    t_index = time.perf_counter() - start
+
+    # Multi-horizon anchors for the latest date: week, month, quarter, 3-week, YTD
+    now = last
+    horizons = [now - timedelta(days=7), now - timedelta(days=30), now - timedelta(days=91),
+                now - timedelta(days=21), datetime(now.year - 1, 12, 31)]
+    assert get_values_on_dates(series, horizons) == [linear_value_on_date(pairs, h) for h in horizons]
+    reps = 20_000
+    start = time.perf_counter()
+    for _ in range(reps):
+        get_values_on_dates(series, horizons)
+    t_batch = (time.perf_counter() - start) / reps
+
+    # The index must not copy the ordinal column (a list of 1M ints is ~38 MiB)
+    big = Series(range(700_000, 1_700_000), [1.0] * 1_000_000, name="BIG")
+    tracemalloc.start()
+    big.asof_index().value_on(datetime(2000, 1, 1))
+    index_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert index_bytes < 64 * 1024, index_bytes
+
+    print(f"Observations: {n:,}, random lookups: {lookups:,} (results match)")
+    print(f"  linear scan:   {t_linear / lookups * 1e6:10.2f} us/lookup")
+    print(f"  as-of index:   {t_index / lookups * 1e6:10.2f} us/lookup")
+    print(f"  batched 5 horizons: {t_batch * 1e6:7.2f} us/call")
+    print(f"  index on 1M rows: {index_bytes / 1024:.1f} KiB allocated building it and looking up once")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: calc_changes matrix vs a loop of scalar get_value_on_date/calc_change calls.
+
+Screens a universe of synthetic series over 1d, 1w, 1m, 3w, QTD, YTD and 1y,
+checks the approaches agree, and times them, including calc_changes with a
+shared CalendarIndex resolving the anchors.
+
+Usage: python3 benchmarks/bench_changes.py [series] [rows_per_series]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import CHANGE_HORIZONS, calc_change, calc_changes, get_value_on_date
+from market_calendar import CalendarIndex
+from market_series import Series
+
+
+def make_universe(count, rows):
+    rng = random.Random(9)
+    universe = []
+    for i in range(count):
+        series = Series(name=f"S{i:03d}")
+        day = date(2026, 2, 20) - timedelta(days=int(rows * 1.45))
+        value = rng.uniform(10, 5000)
+        while len(series) < rows:
+            if day.weekday() < 5 and rng.random() > 0.03:
+                value *= 1 + rng.gauss(0, 0.01)
+                series.append(day, value)
+            day += timedelta(days=1)
+        universe.append(series)
+    return universe
+
+
+def scalar_loop(universe):
+    """One get_value_on_date + calc_change call per series per horizon"""
+    points, pct = [], []
+    for series in universe:
+        as_of = series.date_at(-1)
+        current = get_value_on_date(series, as_of)
+        row_points, row_pct = [], []
+        for spec in CHANGE_HORIZONS.values():
+            if spec is None:
+                base = series.values[-2] if len(series) > 1 else None
+            else:
+                base = get_value_on_date(series, spec(as_of))
+            p, c = calc_change(current, base)
+            row_points.append(p)
+            row_pct.append(c)
+        points.append(row_points)
+        pct.append(row_pct)
+    return points, pct
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    universe = make_universe(count, rows)
+    for series in universe:
+        series.asof_index()
+
+    reps = 20
+    start = time.perf_counter()
+    for _ in range(reps):
+        loop_points, loop_pct = scalar_loop(universe)
+    t_loop = (time.perf_counter() - start) / reps
+
+    start = time.perf_counter()
+    for _ in range(reps):
+        matrix = calc_changes(universe)
+    t_matrix = (time.perf_counter() - start) / reps
+
+    calendar = CalendarIndex(universe)
+    start = time.perf_counter()
+    for _ in range(reps):
+        aligned = calc_changes(universe, calendar=calendar)
+    t_calendar = (time.perf_counter() - start) / reps
+
+    assert matrix["points"] == loop_points and matrix["pct"] == loop_pct
+    assert aligned == matrix
+    cells = count * len(CHANGE_HORIZONS)
+    print(f"{count} series x {len(CHANGE_HORIZONS)} horizons ({cells:,} cells)")
+    print(f"  scalar loop:  {t_loop * 1000:8.2f} ms")
+    print(f"  calc_changes: {t_matrix * 1000:8.2f} ms ({t_loop / t_matrix:.1f}x)")
+    print(f"  + calendar:   {t_calendar * 1000:8.2f} ms ({t_loop / t_calendar:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
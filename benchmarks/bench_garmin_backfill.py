@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Garmin backfill throughput, sequential vs the concurrent pipeline.
+
+Backfills a date range from FakeGarminClient (simulated latency, a few
+transient failures) with one worker, the way garmin.main fetches one day,
+and with bounded thread pools of increasing size, saving into a HealthStore.
+Checks every run stores the same records, then runs once under the default
+per-endpoint rate limits and checks the observed request rate stays within
+them (on at most 20 days, to keep the run short).
+
+Usage: python3 benchmarks/bench_garmin_backfill.py [days] [latency_ms]
+"""
+
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import garmin_sync
+from fake_garmin import FakeGarminClient
+from health_store import HealthStore
+
+UNLIMITED = {name: (10_000.0, 10_000) for name in garmin_sync.ENDPOINTS}
+
+
+def parse(day, summary, sleep, stress):
+    """Raw payloads per day under their record sections; field mapping is garmin.parse_garmin_data's job"""
+    return {"date": str(day), "source": "garmin", "activity": summary, "sleep": sleep, "recovery": stress}
+
+
+def run(tmp, label, days, latency, workers, rate_limits=UNLIMITED):
+    store = HealthStore(Path(tmp) / f"{label}.db")
+    client = FakeGarminClient(latency=latency, jitter=latency / 4)
+    end = date(2026, 2, 23)
+    stats = garmin_sync.backfill(client, end - timedelta(days=days - 1), end, parse, store,
+                                 workers=workers, rate_limits=rate_limits, backoff=0.01, log=lambda m: None)
+    records = store.range(end - timedelta(days=days - 1), end)
+    store.close()
+    return stats, records
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 40) / 1000
+
+    with tempfile.TemporaryDirectory(prefix="bench_backfill_") as tmp:
+        baseline, expected = run(tmp, "sequential", days, latency, workers=1)
+        assert baseline["saved"] == days and not baseline["failed"] and len(expected) == days
+        print(f"{days} days x {len(garmin_sync.ENDPOINTS)} endpoints, {latency * 1000:.0f} ms latency, "
+              f"{baseline['retries']} transient failures retried")
+        print(f"  sequential:  {baseline['seconds']:6.2f} s "
+              f"({baseline['requests'] / baseline['seconds']:6.1f} req/s)")
+        for workers in (4, 8, 16, 32):
+            stats, records = run(tmp, f"w{workers}", days, latency, workers)
+            assert records == expected and stats["saved"] == days
+            print(f"  {workers:2d} workers:  {stats['seconds']:6.2f} s "
+                  f"({stats['requests'] / stats['seconds']:6.1f} req/s, {baseline['seconds'] / stats['seconds']:.1f}x)")
+
+        limited_days = min(days, 20)
+        stats, records = run(tmp, "limited", limited_days, latency, 32, garmin_sync.RATE_LIMITS)
+        assert records == expected[-limited_days:]
+        rate, burst = garmin_sync.RATE_LIMITS["summary"]
+        per_endpoint = stats["requests"] / len(garmin_sync.ENDPOINTS)
+        ceiling = rate * stats["seconds"] + burst
+        assert per_endpoint <= ceiling, (per_endpoint, ceiling)
+        print(f"  32 workers, {limited_days} days under default limits ({rate:.0f}/s, burst {burst} per endpoint): "
+              f"{stats['seconds']:6.2f} s "
+              f"({per_endpoint / stats['seconds']:.1f} req/s per endpoint)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Garmin session cache across repeated sync runs.
+
+Simulates a day of 15-minute syncs, each a fresh "process" that loads the
+credentials file, gets its client from a GarminSession and fetches summary,
+sleep and stress. FakeGarminClient counts logins, issues tokens with a
+one-hour lifetime on a simulated clock, and rejects fetches without a valid
+token. Compares logins and wall time with a fresh login on every run.
+tests/test_garmin_session.py checks the login counts and that concurrent
+callers in one process share a single client and login.
+
+Usage: python3 benchmarks/bench_garmin_session.py [runs] [login_ms]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import garmin_session
+from fake_garmin import FakeGarminClient
+from garmin_session import GarminSession
+
+INTERVAL = 15 * 60
+TOKEN_TTL = 3600
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_760_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_factory(clock, login_latency, built):
+    def factory(email, password):
+        client = FakeGarminClient(email, password, latency=0, jitter=0, fail_every=0, login_latency=login_latency,
+                                  token_ttl=TOKEN_TTL, require_auth=True, clock=clock)
+        built.append(client)
+        return client
+    return factory
+
+
+def sync_runs(runs, login_latency, cached):
+    clock = Clock()
+    built = []
+    factory = make_factory(clock, login_latency, built)
+    with tempfile.TemporaryDirectory(prefix="bench_session_") as tmp:
+        creds_file = Path(tmp) / "garmin-credentials.json"
+        creds_file.write_text(json.dumps({"email": "me@example.com", "password": "pw"}))
+
+        def save(creds):
+            creds_file.write_text(json.dumps(creds))
+
+        t0 = time.perf_counter()
+        for run in range(runs):
+            creds = json.loads(creds_file.read_text())
+            session = GarminSession(creds, factory, save=save if cached else None, clock=clock)
+            for fetch in ("get_daily_summary_data", "get_sleep_data", "get_stress_details"):
+                getattr(session.client(), fetch)(date(2026, 2, 23))
+            clock.now += INTERVAL
+        elapsed = time.perf_counter() - t0
+    return sum(c.logins for c in built), elapsed
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 96
+    login_latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+    fresh_logins, fresh_time = sync_runs(runs, login_latency, cached=False)
+    cached_logins, cached_time = sync_runs(runs, login_latency, cached=True)
+    print(f"{runs} syncs every {INTERVAL // 60} min, {TOKEN_TTL // 60}-min tokens "
+          f"(refreshed {garmin_session.EXPIRY_MARGIN} s early), {login_latency * 1000:.0f} ms login")
+    print(f"  fresh login per run: {fresh_logins:4d} logins, {fresh_time:6.2f} s")
+    print(f"  session cache:       {cached_logins:4d} logins, {cached_time:6.2f} s "
+          f"({fresh_logins / cached_logins:.1f}x fewer logins)")
+
+
+if __name__ == "__main__":
+    main()
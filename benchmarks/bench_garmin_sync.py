@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: conditional Garmin sync vs a full refetch/rewrite every run.
+
+Runs a day of 15-minute syncs against FakeGarminClient while upstream data
+changes now and then (sleep once in the morning, activity hourly, stress
+every two hours). The full sync fetches, parses and writes all three
+endpoints and rebuilds the brief on every run, as garmin.main did.
+garmin_sync.sync_day skips parsing, writing and the brief for unchanged
+payloads and writes only the changed sections. Checks both end with the same
+record, then replays the day itself and a settled past day and reports the
+fetches, parses and writes saved.
+
+Usage: python3 benchmarks/bench_garmin_sync.py [runs]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import garmin_sync
+from fake_garmin import FakeGarminClient
+from health_store import HealthStore
+
+DAY = date(2026, 2, 23)
+INTERVAL = timedelta(minutes=15)
+
+
+def parse(day, summary, sleep, stress):
+    """Section mapping of garmin.parse_garmin_data (which needs the Garmin deps)"""
+    data = {"date": str(day), "source": "garmin", "sleep": {}, "recovery": {}, "activity": {}, "vo2": None}
+    if sleep:
+        data["sleep"] = {"duration_seconds": sleep["sleepDurationSeconds"], "score": sleep["sleepScore"]}
+    if summary:
+        data["activity"] = {"steps": summary["steps"], "calories": summary["calories"]}
+    if stress:
+        data["recovery"] = {"body_battery_avg": stress["bodyBatteryAverage"],
+                            "recovery_percent": max(0, min(100, 100 - stress["averageStressLevel"]))}
+    return data
+
+
+def brief(data):
+    return f"{data['date']}: sleep {data['sleep']} recovery {data['recovery']} activity {data['activity']}"
+
+
+def upstream(client, run):
+    """Advance the fake's data: sleep at 07:00, activity hourly, stress every 2h"""
+    if run == 28:
+        client.revisions["sleep"] = 1
+    if run % 4 == 0:
+        client.revisions["summary"] = run // 4
+    if run % 8 == 0:
+        client.revisions["stress"] = run // 8
+
+
+def full_sync(client, store, counts):
+    payloads = [getattr(client, m)(DAY) for m in garmin_sync.ENDPOINTS.values()]
+    data = parse(DAY, *payloads)
+    store.put(data, keep=("workouts",))
+    brief(store.get(DAY))
+    counts["fetched"] += 3
+    counts["parsed"] += 3
+    counts["written"] += 3
+    counts["briefs"] += 1
+
+
+def main():
+    # Stay before the day settles: upstream data doesn't change after that
+    runs = min(int(sys.argv[1]) if len(sys.argv) > 1 else 96, 2 * 96)
+    start = datetime.combine(DAY, datetime.min.time())
+
+    with tempfile.TemporaryDirectory(prefix="bench_sync_") as tmp:
+        full_store = HealthStore(Path(tmp) / "full.db")
+        cond_store = HealthStore(Path(tmp) / "cond.db")
+        full_client = FakeGarminClient(latency=0, jitter=0, fail_every=0)
+        cond_client = FakeGarminClient(latency=0, jitter=0, fail_every=0)
+
+        full = {"fetched": 0, "parsed": 0, "written": 0, "briefs": 0}
+        t0 = time.perf_counter()
+        for run in range(runs):
+            upstream(full_client, run)
+            full_sync(full_client, full_store, full)
+        t_full = time.perf_counter() - t0
+
+        cond = {"fetched": 0, "parsed": 0, "written": 0, "briefs": 0}
+        t0 = time.perf_counter()
+        for run in range(runs):
+            upstream(cond_client, run)
+            stats = garmin_sync.sync_day(cond_client, DAY, cond_store, parse, now=start + run * INTERVAL)
+            for key in ("fetched", "parsed", "written"):
+                cond[key] += stats[key]
+            if stats["changed"]:
+                brief(cond_store.get(DAY))
+                cond["briefs"] += 1
+        t_cond = time.perf_counter() - t0
+        assert cond_store.get(DAY) == full_store.get(DAY)
+
+        same_day = garmin_sync.sync_day(cond_client, DAY, cond_store, parse, now=start + runs * INTERVAL)
+        settled = start + timedelta(days=2, hours=1)
+        garmin_sync.sync_day(cond_client, DAY, cond_store, parse, now=settled)
+        past_day = garmin_sync.sync_day(cond_client, DAY, cond_store, parse, now=settled + INTERVAL)
+        assert same_day["parsed"] == same_day["written"] == 0 and past_day["fetched"] == 0
+        full_store.close()
+        cond_store.close()
+
+    print(f"{runs} syncs of one day, every {INTERVAL.seconds // 60} min")
+    print(f"  full sync:        fetch {full['fetched']:4d}  parse {full['parsed']:4d}  write {full['written']:4d}  "
+          f"brief {full['briefs']:3d}  {t_full * 1000:7.1f} ms")
+    print(f"  conditional sync: fetch {cond['fetched']:4d}  parse {cond['parsed']:4d}  write {cond['written']:4d}  "
+          f"brief {cond['briefs']:3d}  {t_cond * 1000:7.1f} ms")
+    for label, stats in (("replayed day (same day)", same_day), ("replayed day (settled)", past_day)):
+        print(f"  {label}: saved {stats['fetch_skipped']} fetches, {stats['parse_skipped']} parses, "
+              f"{stats['write_skipped']} writes")
+
+
+if __name__ == "__main__":
+    main()
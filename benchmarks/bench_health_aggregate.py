@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one-pass health aggregation vs per-metric list loops.
+
+Builds a multi-year synthetic daily history, then computes last 30/90/365-day
+summaries, month-over-month averages and rolling 7-day averages for sleep,
+recovery, steps and workout minutes two ways: the format_weekly_summary
+style (a list comprehension per metric per period, re-sliced per day for the
+rolling window) and health_aggregate.aggregate. Checks they agree and times
+them.
+
+Usage: python3 benchmarks/bench_health_aggregate.py [years]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+from health_aggregate import aggregate
+
+PERIODS = (30, 90, 365)
+
+
+def make_history(days, rng):
+    end = date(2026, 2, 23)
+    history = []
+    for i in range(days):
+        if rng.random() < 0.1:
+            continue
+        d = end - timedelta(days=days - 1 - i)
+        record = {"date": str(d), "source": "garmin", "workouts": []}
+        if rng.random() < 0.95:
+            record["sleep"] = {"duration_seconds": rng.randint(18000, 32000), "score": rng.randint(40, 95)}
+            record["recovery"] = {"recovery_percent": rng.randint(10, 100)}
+            record["activity"] = {"steps": rng.randint(2000, 20000)}
+        if rng.random() < 0.4:
+            record["workouts"].append({"type": "Run", "duration_min": rng.randint(20, 90)})
+        history.append(record)
+    return history
+
+
+def metric_lists(data):
+    """The format_weekly_summary approach: one list per metric"""
+    sleep = [d.get("sleep", {}).get("score", 0) for d in data if d.get("sleep")]
+    recovery = [d.get("recovery", {}).get("recovery_percent", 0) for d in data if d.get("recovery")]
+    steps = [d["activity"]["steps"] for d in data if d.get("activity") and "steps" in d["activity"]]
+    minutes = [sum(w.get("duration_min", 0) for w in d.get("workouts", [])) for d in data]
+    avg = lambda xs: sum(xs) / len(xs) if xs else None
+    return {"sleep": avg(sleep), "recovery": avg(recovery), "steps": avg(steps), "workout_min": avg(minutes)}
+
+
+def loop_approach(history, end):
+    periods = {}
+    for days in PERIODS:
+        start = str(end - timedelta(days=days - 1))
+        periods[days] = metric_lists([d for d in history if start <= d["date"] <= str(end)])
+    months = {}
+    for key in sorted({d["date"][:7] for d in history}):
+        months[key] = metric_lists([d for d in history if d["date"][:7] == key])
+    rolling = []
+    for d in history:
+        lo = str(date.fromisoformat(d["date"]) - timedelta(days=6))
+        rolling.append(metric_lists([x for x in history if lo <= x["date"] <= d["date"]]))
+    return periods, months, rolling
+
+
+def aggregate_approach(history, end):
+    full = aggregate(history)
+    periods = {}
+    for days in PERIODS:
+        start = str(end - timedelta(days=days - 1))
+        periods[days] = aggregate(d for d in history if d["date"] >= start)
+    return full, periods
+
+
+def close(a, b):
+    return a is None and b is None or a is not None and b is not None and abs(a - b) < 1e-9
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rng = random.Random(12)
+    history = make_history(years * 365, rng)
+    end = date.fromisoformat(history[-1]["date"])
+
+    t0 = time.perf_counter()
+    periods, months, rolling = loop_approach(history, end)
+    t_loop = time.perf_counter() - t0
+
+    reps = 5
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        full, agg_periods = aggregate_approach(history, end)
+    t_agg = (time.perf_counter() - t0) / reps
+
+    for days in PERIODS:
+        got = {m: s["avg"] for m, s in agg_periods[days]["metrics"].items()}
+        assert all(close(got[m], periods[days][m]) for m in got), days
+    for key, expected in months.items():
+        got = {m: s["avg"] for m, s in full["months"][key].items()}
+        assert all(close(got[m], expected[m]) for m in got), key
+    for metric, series in full["rolling"].items():
+        expected = [r[metric] for r in rolling if r[metric] is not None]
+        assert len(series) == len(expected) and all(close(v, e) for (_, v), e in zip(series, expected)), metric
+
+    print(f"{len(history)} days of history ({years} years): {len(PERIODS)} periods, "
+          f"{len(months)} months, {len(rolling)} rolling windows")
+    print(f"  per-metric loops:  {t_loop * 1000:9.2f} ms")
+    print(f"  aggregate passes:  {t_agg * 1000:9.2f} ms ({t_loop / t_agg:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
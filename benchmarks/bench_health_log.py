@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 100k health-tracker log calls, open/append per call vs BufferedLog.
+
+Times the old garmin.log file write (format a UTC timestamp, open the log in
+append mode, write, close) against BufferedLog in text and JSON-lines mode,
+both for the caller (enqueue only) and until everything is on disk. Checks
+the buffered text log holds the same messages in the legacy format, the JSON
+log parses, and a small max_bytes rotates into backups without losing lines.
+Console echo is left off in those variants.
+
+Then times garmin.log as callers use it (get_log lookup + echoed log call,
+stdout sent to /dev/null) against the old print + open/append. When garmin.py
+can't be imported (it needs requests), its one-line body is timed instead.
+
+Usage: python3 benchmarks/bench_health_log.py [calls]
+"""
+
+import contextlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+from health_log import BufferedLog, get_log
+
+LEGACY_LINE = re.compile(r"\[\d{4}-\d\d-\d\d \d\d:\d\d:\d\d UTC\] (.*)")
+
+
+def legacy_log(path, message):
+    """garmin.log before the buffered writer, minus the print"""
+    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    msg = f"[{timestamp}] {message}"
+    with open(path, "a") as f:
+        f.write(msg + "\n")
+
+
+def legacy_garmin_log(path, message):
+    """garmin.log before the buffered writer: print, then open/append"""
+    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    msg = f"[{timestamp}] {message}"
+    print(msg)
+    with open(path, "a") as f:
+        f.write(msg + "\n")
+
+
+def garmin_logger(path):
+    """(label, log(message)) for garmin.log writing to path"""
+    try:
+        import garmin
+    except ImportError:
+        return ("get_log(...).log", lambda message: get_log(path, fmt="text", echo=True).log(message))
+    garmin.LOG_FILE = path
+    return ("garmin.log", garmin.log)
+
+
+def timed_calls(log, messages):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        t0 = time.perf_counter()
+        for message in messages:
+            log(message)
+        return time.perf_counter() - t0
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def read_rotated(directory, name):
+    """Messages from name and its backups (name.N ... name.1), oldest first"""
+    files = sorted(directory.glob(name + "*"), key=lambda p: -int(p.suffix[1:]) if p.suffix[1:].isdigit() else 0)
+    return files, [LEGACY_LINE.fullmatch(line).group(1) for p in files for line in read_lines(p)]
+
+
+def timed_buffered(path, messages, **options):
+    log = BufferedLog(path, **options)
+    t0 = time.perf_counter()
+    for i, message in enumerate(messages):
+        log.log(message, day=i % 365)
+    t_call = time.perf_counter() - t0
+    log.close()
+    return t_call, time.perf_counter() - t0
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    messages = [f"Fetching Garmin data for 2026-{1 + i % 12:02d}-{1 + i % 28:02d}... ✅ {i}" for i in range(calls)]
+
+    with tempfile.TemporaryDirectory(prefix="bench_log_") as tmp:
+        tmp = Path(tmp)
+        t0 = time.perf_counter()
+        for message in messages:
+            legacy_log(tmp / "legacy.log", message)
+        t_legacy = time.perf_counter() - t0
+
+        text_call, text_total = timed_buffered(tmp / "text.log", messages, max_bytes=0)
+        json_call, json_total = timed_buffered(tmp / "json.log", messages, fmt="json", max_bytes=0)
+        timed_buffered(tmp / "rotated.log", messages, max_bytes=256 * 1024, backups=1000)
+
+        legacy = [LEGACY_LINE.fullmatch(line).group(1) for line in read_lines(tmp / "legacy.log")]
+        text = [LEGACY_LINE.fullmatch(line).group(1) for line in read_lines(tmp / "text.log")]
+        records = [json.loads(line) for line in read_lines(tmp / "json.log")]
+        rotated, rotated_lines = read_rotated(tmp, "rotated.log")
+
+        # garmin.log as called: a cached writer per path, looked up without touching the filesystem
+        label, garmin_log = garmin_logger(tmp / "garmin.log")
+        t_garmin_legacy = timed_calls(lambda m: legacy_garmin_log(tmp / "garmin_legacy.log", m), messages)
+        t_garmin = timed_calls(garmin_log, messages)
+        get_log(tmp / "garmin.log").close()
+        garmin_files, garmin_lines = read_rotated(tmp, "garmin.log")
+        alias = tmp / "sub" / ".." / "garmin.log"
+        same_writer = get_log(alias) is get_log(tmp / "garmin.log")
+
+    assert legacy == text == messages
+    assert [r["msg"] for r in records] == messages and records[1]["day"] == 1
+    assert rotated_lines == messages and len(rotated) > 1
+    assert garmin_lines == messages and same_writer
+    print(f"{calls:,} log calls")
+    print(f"  open/append per call: {t_legacy * 1000:8.1f} ms")
+    print(f"  BufferedLog text:     {text_call * 1000:8.1f} ms in callers, {text_total * 1000:8.1f} ms until written "
+          f"({t_legacy / text_total:.1f}x)")
+    print(f"  BufferedLog json:     {json_call * 1000:8.1f} ms in callers, {json_total * 1000:8.1f} ms until written "
+          f"({t_legacy / json_total:.1f}x)")
+    print(f"  rotation at 256 KiB kept all lines across {len(rotated)} files")
+    print(f"  {label} (echo to /dev/null): {t_garmin / calls * 1e6:6.2f} us/call vs print + open/append "
+          f"{t_garmin_legacy / calls * 1e6:6.2f} us/call ({t_garmin_legacy / t_garmin:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
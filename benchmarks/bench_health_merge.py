@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: merging Garmin and Strava records over years of history.
+
+Generates a synthetic multi-year history where most days have a Garmin
+record, many have a Strava record, and sessions both devices recorded show
+up in both with shifted start times and slightly different durations (plus
+conflicting calories/distance/duration). Times incremental per-day writes,
+a bulk write and a streaming HealthStore.merge_range, and reports the peak
+memory of the streaming pass. tests/test_health_merge.py checks dedupe,
+precedence and that the three write paths agree on the same data.
+
+Usage: python3 benchmarks/bench_health_merge.py [years]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+import health_store
+from health_merge import merge_day
+from health_store import HealthStore
+
+START = date(2020, 1, 1)
+TYPES = ("Run", "Ride", "Swim", "Strength")
+
+
+def generate(days, seed=7):
+    """(garmin, strava, sessions): per-source records and session ids per day"""
+    rng = random.Random(seed)
+    garmin, strava, sessions = [], [], {}
+    for i in range(days):
+        day = START + timedelta(days=i)
+        g_workouts, s_workouts, ids = [], [], []
+        for n in range(rng.choice((0, 1, 1, 2, 3))):
+            start = datetime.combine(day, datetime.min.time()) + timedelta(hours=6 + 5 * n, minutes=rng.randrange(60))
+            minutes = rng.randrange(20, 120)
+            sid = f"{day}#{n}"
+            ids.append(sid)
+            where = rng.choice(("both", "both", "garmin", "strava"))
+            if where in ("both", "garmin"):
+                # Garmin times are naive local time, Strava's are UTC
+                local = start.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+                g_workouts.append({"type": TYPES[n % 4].lower(), "duration_min": minutes + rng.randrange(-3, 4),
+                                   "timestamp": (local + timedelta(minutes=rng.randrange(-4, 5))).isoformat(),
+                                   "calories": rng.randrange(200, 900), "id": sid})
+            if where in ("both", "strava"):
+                s_workouts.append({"type": TYPES[n % 4], "duration_min": minutes,
+                                   "distance": rng.randrange(1000, 40000),
+                                   "timestamp": start.isoformat() + "Z", "id": sid})
+        sessions[str(day)] = ids
+        if rng.random() < 0.9:
+            garmin.append({"date": str(day), "source": "garmin",
+                           "sleep": {"duration_seconds": rng.randrange(18000, 32000), "score": rng.randrange(40, 100)},
+                           "recovery": {"body_battery_avg": rng.randrange(20, 100)},
+                           "activity": {"steps": rng.randrange(2000, 20000), "calories": rng.randrange(1800, 3500),
+                                        "distance_meters": rng.choice((None, rng.randrange(1000, 20000)))},
+                           "vo2": None, "workouts": g_workouts})
+        if s_workouts or rng.random() < 0.2:
+            strava.append({"date": str(day), "source": "strava", "sleep": {}, "recovery": {},
+                           "activity": {"distance_meters": sum(w["distance"] for w in s_workouts),
+                                        "duration_seconds": sum(w["duration_min"] for w in s_workouts) * 60,
+                                        "calories": rng.randrange(0, 1500), "activity_count": len(s_workouts)},
+                           "workouts": s_workouts, "note": "Strava data only."})
+    return garmin, strava, sessions
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    days = 365 * years
+    garmin, strava, _ = generate(days)
+    end = START + timedelta(days=days - 1)
+
+    # Reference: group everything in memory, merge each day
+    grouped = {}
+    for record in garmin + strava:
+        grouped.setdefault(record["date"], []).append(record)
+    reference = [merge_day(grouped[d]) for d in sorted(grouped)]
+    conflicts = len({r["date"] for r in garmin} & {r["date"] for r in strava})
+
+    with tempfile.TemporaryDirectory(prefix="bench_merge_") as tmp:
+        incremental = HealthStore(Path(tmp) / "incremental.db")
+        t0 = time.perf_counter()
+        for record in garmin + strava:
+            incremental.put(record)
+        t_incremental = time.perf_counter() - t0
+        incremental.close()
+
+        bulk = HealthStore(Path(tmp) / "bulk.db")
+        t0 = time.perf_counter()
+        bulk.put_many(garmin + strava)
+        t_bulk = time.perf_counter() - t0
+
+        # Streaming re-merge after dropping the merged view (timed, then traced)
+        with bulk.conn:
+            bulk.conn.execute("DELETE FROM daily_health")
+        t0 = time.perf_counter()
+        merged_days = bulk.merge_range(START, end)
+        t_stream = time.perf_counter() - t0
+        tracemalloc.start()
+        bulk.merge_range(START, end)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        history_bytes = sum(len(json.dumps(r)) for r in garmin + strava)
+        bulk.close()
+
+    workouts = sum(len(r["workouts"]) for r in garmin + strava)
+    kept = sum(len(r.get("workouts", [])) for r in reference)
+    print(f"{years} years: {len(garmin)} Garmin + {len(strava)} Strava records, {conflicts} days with both")
+    print(f"  workouts: {workouts} recorded -> {kept} after dedupe, {merged_days} days merged")
+    print(f"  per-day writes (merge per write): {t_incremental:6.2f} s")
+    print(f"  bulk put_many:                    {t_bulk:6.2f} s")
+    print(f"  streaming merge_range:            {t_stream:6.2f} s, peak {peak / 1024:.0f} KiB "
+          f"for {history_bytes / 1024:.0f} KiB of history ({health_store.MERGE_PAGE}-day pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: 365-day health range read, per-day JSON files vs the SQLite store.
+
+Writes a year of synthetic daily records as pretty-printed JSON files (the
+old layout), migrates them into a HealthStore, checks both reads agree and
+times them.
+
+Usage: python3 benchmarks/bench_health_store.py [days]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+from health_store import HealthStore, migrate_json_files
+
+
+def make_day(d, rng):
+    return {
+        "date": str(d),
+        "source": "garmin",
+        "sleep": {"duration_seconds": rng.randint(18000, 32000), "score": rng.randint(40, 95)},
+        "recovery": {"recovery_percent": rng.randint(10, 100), "body_battery_avg": rng.randint(20, 90)},
+        "activity": {"steps": rng.randint(2000, 20000), "calories": rng.randint(1800, 3500)},
+        "workouts": [{"type": "Run", "duration_min": rng.randint(20, 90)}] if rng.random() < 0.4 else [],
+    }
+
+
+def legacy_range(data_dir, start, days):
+    """One open + json.load per day, as load_weekly_data did"""
+    out = []
+    for i in range(days):
+        path = data_dir / f"{start + timedelta(days=i)}.json"
+        if path.exists():
+            with open(path, "r") as f:
+                out.append(json.load(f))
+    return out
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    rng = random.Random(1)
+    end = date(2026, 2, 23)
+    start = end - timedelta(days=days - 1)
+    with tempfile.TemporaryDirectory(prefix="bench_health_") as tmp:
+        data_dir = Path(tmp) / "health"
+        data_dir.mkdir()
+        for i in range(days):
+            if rng.random() < 0.95:
+                d = start + timedelta(days=i)
+                with open(data_dir / f"{d}.json", "w") as f:
+                    json.dump(make_day(d, rng), f, indent=2)
+
+        store = HealthStore(Path(tmp) / "health.db")
+        t0 = time.perf_counter()
+        imported = migrate_json_files(store, data_dir)
+        t_migrate = time.perf_counter() - t0
+
+        reps = 20
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            legacy = legacy_range(data_dir, start, days)
+        t_legacy = (time.perf_counter() - t0) / reps
+
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            stored = store.range(start, end)
+        t_store = (time.perf_counter() - t0) / reps
+        store.close()
+
+    assert legacy == stored
+    print(f"{days}-day range, {imported} stored days (migration took {t_migrate * 1000:.1f} ms)")
+    print(f"  per-day JSON files: {t_legacy * 1000:8.2f} ms")
+    print(f"  HealthStore.range:  {t_store * 1000:8.2f} ms ({t_legacy / t_store:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
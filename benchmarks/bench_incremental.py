@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: incremental brief state vs a full recompute.
+
+Times SeriesState.append + snapshot per close over a synthetic daily history
+(with holiday gaps) against a full analyze_series recompute. The equivalence
+checks live in tests/test_market_state.py.
+
+Usage: python3 benchmarks/bench_incremental.py [observations]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import analyze_series
+from market_series import Series
+from market_state import SeriesState
+
+
+def make_series(n):
+    rng = random.Random(21)
+    series = Series(name="SYNTH")
+    day = date(1998, 1, 2)
+    value = 900.0
+    while len(series) < n:
+        if day.weekday() < 5 and rng.random() > 0.04:
+            value *= 1 + rng.gauss(0.0002, 0.011)
+            series.append(day, value)
+        day += timedelta(days=1)
+    return series
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000
+    series = make_series(n)
+
+    state = SeriesState("SYNTH")
+    start = time.perf_counter()
+    for o, v in zip(series.ordinals, series.values):
+        state.append(o, v)
+        state.snapshot()
+    t_state = (time.perf_counter() - start) / n
+
+    reps = 200
+    start = time.perf_counter()
+    for _ in range(reps):
+        analyze_series(series)
+    t_full = (time.perf_counter() - start) / reps
+
+    print(f"{n:,} closes")
+    print(f"  append + snapshot:  {t_state * 1e6:8.1f} us/close")
+    print(f"  full recompute:     {t_full * 1e6:8.1f} us/close")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming FRED ingest vs the original split/strptime parse_csv.
+
+Generates a FRED-style CSV with holiday blanks and '.' placeholders, checks
+both parsers agree, and reports rows per second.
+
+Usage: python3 benchmarks/bench_ingest.py [rows]
+"""
+
+import csv
+import io
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_series import read_fred_csv
+
+
+def legacy_parse_csv(data):
+    """parse_csv as it was before the streaming ingest path"""
+    lines = data.strip().split('\n')
+    reader = csv.reader(lines)
+    header = next(reader)
+    results = []
+    for row in reader:
+        if len(row) == 2 and row[1] and row[1] != '.':
+            try:
+                d = datetime.strptime(row[0], '%Y-%m-%d')
+                value = float(row[1])
+                results.append((d, value))
+            except:
+                pass
+    return results
+
+
+def make_csv(rows):
+    rng = random.Random(3)
+    out = ["observation_date,SYNTH"]
+    day = date(1950, 1, 1)
+    value = 100.0
+    for _ in range(rows):
+        r = rng.random()
+        if r < 0.02:
+            out.append(f"{day.isoformat()},")
+        elif r < 0.03:
+            out.append(f"{day.isoformat()},.")
+        else:
+            value *= 1 + rng.gauss(0, 0.01)
+            out.append(f"{day.isoformat()},{value:.2f}")
+        day += timedelta(days=1)
+    return "\n".join(out)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    text = make_csv(rows)
+    payload = text.encode()
+    print(f"Rows: {rows:,} ({len(payload) / 2**20:.1f} MiB)")
+
+    start = time.perf_counter()
+    legacy = legacy_parse_csv(text)
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    series, report = read_fred_csv(io.BytesIO(payload))
+    t_stream = time.perf_counter() - start
+
+    assert list(series) == legacy
+    print(f"  skipped: {report['missing']:,} missing, {report['malformed']:,} malformed")
+    print(f"  legacy parse_csv: {rows / t_legacy:12,.0f} rows/s")
+    print(f"  read_fred_csv:    {rows / t_stream:12,.0f} rows/s ({t_legacy / t_stream:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: handle_query intent classification, if-chain vs IntentRouter.
+
+Generates a synthetic chat corpus (workout logs, range and monthly queries,
+sleep/recovery/clearance/weekly/brief questions, keyword collisions and
+unrelated chatter), classifies it with a copy of the original handle_query
+if-chain and with intent_router.classify and times both.
+tests/test_intent_router.py checks that they agree on every message.
+
+Usage: python3 benchmarks/bench_intent_router.py [messages]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+from intent_router import UNKNOWN, classify
+
+TEMPLATES = (
+    "log a {n} min {act}", "logged {n} hour {act}", "{n} minutes {act} this morning",
+    "Log {f} hr {act} then stretch", "did {n} min of {act}",
+    "how did I sleep?", "sleep score last night", "How was my SLEEP this week",
+    "what's my recovery?", "hrv today", "body battery status", "recovery over the last {n} days",
+    "am I cleared for hard training?", "should I train today", "is it clear to go hard",
+    "weekly summary", "how was my week", "give me my weekly health summary",
+    "health brief", "how am i doing", "morning brief please",
+    "how were my last {n} days", "past {n} weeks", "last {n} months of data", "this year so far",
+    "yearly trend", "past year sleep", "last month", "this month recovery", "last quarter",
+    "month over month", "show monthly numbers", "this monthly report", "last {z} days",
+    "last month over month", "this monthly", "sleep then {n} min {act}", "shard of glass",
+    "{z}{n} min {act}", "1.2.{n} min {act}", "past 365 days", "weeklyhealth", "hrvthis year",
+    "thanks!", "what's the weather", "remind me at {n}", "ok", "{act} was fun", "",
+)
+ACTIVITIES = ("run", "bike", "swim", "walk", "lifting", "weights", "yoga", "cycling", "rowing")
+FILLER = ("hey", "so", "quick q:", "btw", "", "", "please", "ty")
+
+
+def make_corpus(count, rng):
+    corpus = []
+    for _ in range(count):
+        text = rng.choice(TEMPLATES).format(
+            n=rng.randint(1, 400), f=round(rng.uniform(0.5, 3), 1), z=rng.choice(("0", "00", "7")),
+            act=rng.choice(ACTIVITIES))
+        if rng.random() < 0.3:
+            text = f"{rng.choice(FILLER)} {text} {rng.choice(FILLER)}"
+        if rng.random() < 0.1:
+            text = text.upper()
+        corpus.append(text)
+    return corpus
+
+
+def legacy_parse_range_query(message_lower):
+    match = re.search(r"(?:last|past)\s+(\d+)\s*(day|days|week|weeks|month|months)\b", message_lower)
+    if match:
+        count = int(match.group(1))
+        unit = match.group(2)
+        return count * (7 if unit.startswith("week") else 30 if unit.startswith("month") else 1)
+    if re.search(r"(?:last|past|this)\s+year|\byearly\b|\b365\b", message_lower):
+        return 365
+    if re.search(r"(?:last|past|this)\s+(?:month|30 days)", message_lower):
+        return 30
+    if re.search(r"(?:last|past)\s+quarter", message_lower):
+        return 90
+    return None
+
+
+def legacy_classify(message):
+    """The handle_query if-chain, reduced to the intent it dispatches to"""
+    message_lower = message.lower()
+    patterns = [
+        r"log(?:ged)?\s+(?:a\s+)?(\d+(?:\.\d+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
+        r"(\d+(?:\.\d+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
+    ]
+    for pattern in patterns:
+        if re.search(pattern, message.lower()):
+            return "log_workout"
+    if "month over month" in message_lower or "monthly" in message_lower:
+        return "monthly_trend"
+    if legacy_parse_range_query(message_lower):
+        return "range_summary"
+    if "sleep" in message_lower:
+        return "sleep"
+    if "recovery" in message_lower or "hrv" in message_lower or "body battery" in message_lower:
+        return "recovery"
+    if "clear" in message_lower or "train" in message_lower or "hard" in message_lower:
+        return "clearance"
+    if "week" in message_lower or "weekly" in message_lower:
+        return "weekly_summary"
+    if "health" in message_lower or "brief" in message_lower or "how am i" in message_lower:
+        return "brief"
+    return UNKNOWN
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    corpus = make_corpus(count, random.Random(14))
+    classify("warm up")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_classify(m) for m in corpus]
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    routed = [classify(m) for m in corpus]
+    t_router = time.perf_counter() - t0
+
+    mismatches = sum(a != b for a, b in zip(legacy, routed))
+    counts = {}
+    for intent in routed:
+        counts[intent] = counts.get(intent, 0) + 1
+    print(f"{count:,} messages, {len(counts)} intents, {mismatches} mismatches: "
+          + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+    print(f"  if-chain:     {t_legacy * 1000:8.1f} ms ({t_legacy / count * 1e6:.2f} us/msg)")
+    print(f"  IntentRouter: {t_router * 1000:8.1f} ms ({t_router / count * 1e6:.2f} us/msg, "
+          f"{t_legacy / t_router:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
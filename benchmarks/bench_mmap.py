@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start of a 50-series brief from CSV vs mapped series files.
+
+Times two jobs per series. "lookups" is the current close plus the weekly and
+monthly changes (bisects only). "analyze_series" is the full brief job, which
+adds the rolling context and the drawdown from the all-time peak. The CSV path
+parses every row; the mapped path opens the .fser file, bisects the mapped
+ordinal column and reads the peak from the file header. The last row shows the
+mapped job when the peak has to be found by scanning every value instead.
+
+Usage: python3 benchmarks/bench_mmap.py [series] [rows_per_series]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import analyze_series, calc_change, get_values_on_dates, parse_csv
+from market_series import Series
+from market_seriesfile import open_series_file, write_series_file
+
+
+def make_series(n, seed):
+    rng = random.Random(seed)
+    series = Series(name=f"S{seed:03d}")
+    day = date(1990, 1, 1)
+    value = 100.0
+    while len(series) < n:
+        if day.weekday() < 5:
+            value *= 1 + rng.gauss(0, 0.01)
+            series.append(day, round(value, 2))
+        day += timedelta(days=1)
+    return series
+
+
+def brief_numbers(series):
+    as_of = series.date_at(-1)
+    current = series.values[-1]
+    week, month = get_values_on_dates(series, [as_of - timedelta(days=7), as_of - timedelta(days=30)])
+    return current, calc_change(current, week), calc_change(current, month)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 9_000
+    with tempfile.TemporaryDirectory(prefix="bench_mmap_") as tmp:
+        run(Path(tmp), count, rows)
+
+
+def run(root, count, rows):
+    for seed in range(count):
+        series = make_series(rows, seed)
+        lines = ["observation_date," + series.name]
+        lines += [f"{d.date().isoformat()},{v:.2f}" for d, v in series]
+        (root / f"{series.name}.csv").write_text("\n".join(lines))
+        write_series_file(root / f"{series.name}.fser", series)
+
+    csv_paths = [root / f"S{i:03d}.csv" for i in range(count)]
+    fser_paths = [root / f"S{i:03d}.fser" for i in range(count)]
+
+    def scanned(path):
+        series = open_series_file(path)
+        series.peak = None
+        return series
+
+    timings = {}
+    for job, fn in (("lookups", brief_numbers), ("analyze_series", analyze_series)):
+        for source, load, paths in (("CSV parse", lambda p: parse_csv(p.read_bytes()), csv_paths),
+                                    ("mapped file", open_series_file, fser_paths),
+                                    ("mapped, peak scan", scanned, fser_paths)):
+            if job == "lookups" and source == "mapped, peak scan":
+                continue
+            start = time.perf_counter()
+            for path in paths:
+                fn(load(path))
+            timings[job, source] = time.perf_counter() - start
+
+    print(f"{count} series x {rows:,} rows")
+    for (job, source), elapsed in timings.items():
+        print(f"  {job + ', ' + source + ':':36s}{elapsed * 1000:9.2f} ms "
+              f"({timings[job, 'CSV parse'] / elapsed:.0f}x vs CSV)")
+
+if __name__ == "__main__":
+    main()
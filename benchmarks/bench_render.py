@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rendering 500 market briefs, print-per-line vs the render stage.
+
+Analyzes 500 synthetic series once, then renders 500 briefs, each with four
+of them in the S&P 500 / Nasdaq / Dow / VIX slots and three more as a
+watchlist (every 50th with a series that has no data). The legacy path is
+the ~70 print() calls main() used to make; the new path is brief_context +
+render_brief + one write_brief. Both write to a line-buffered file (like a terminal) and to a
+block-buffered one (like a pipe). Checks the text output is byte-identical
+for every brief, then times Markdown and JSON rendering from the same
+contexts.
+
+Usage: python3 benchmarks/bench_render.py [briefs]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import HORIZONS, analyze_series, parse_csv
+from market_render import brief_context, next_weekday, render_brief, write_brief
+
+AS_OF = date(2026, 2, 20)
+
+
+def make_series(i, rows=300):
+    lines = [f"observation_date,S{i:03d}"]
+    for k in range(rows):
+        day = AS_OF - timedelta(days=rows - 1 - k)
+        if day.weekday() < 5:
+            lines.append(f"{day.isoformat()},{1000 + i * 7 + ((k * (i + 3)) % 89) * 1.37 - (k % 13) * 2.1:.2f}")
+    return parse_csv("\n".join(lines))
+
+
+def legacy_print(results, as_of, watch, out):
+    """The print-per-line report main() produced before the render stage"""
+    def p(*args):
+        print(*args, file=out)
+
+    sp500, nasdaq, djia, vix = results
+    indices = [("S&P 500", sp500), ("Nasdaq", nasdaq), ("Dow Jones", djia)]
+    p("═══════════════════════════════════════════════════════")
+    p(f"        MORNING MARKET BRIEF - {next_weekday(as_of):%A, %b %d, %Y}")
+    p("═══════════════════════════════════════════════════════")
+    p()
+    p(f"📊 CURRENT CLOSES (as of {as_of:%b %d, %Y})")
+    p("───────────────────────────────────────────────────────")
+    for label, r in indices:
+        p(f"  {label + ':':<12}{r['current']:,.2f}")
+    p(f"  VIX:        {vix['current']:.2f}")
+    p()
+    p("📈 WEEKLY CHANGE (7 days)")
+    p("───────────────────────────────────────────────────────")
+    for label, r in indices:
+        p(f"  {label + ':':<12}{r['week']['points']:+.2f} pts ({r['week']['pct']:+.2f}%)")
+    p()
+    p("📅 MONTHLY CHANGE (30 days)")
+    p("───────────────────────────────────────────────────────")
+    for label, r in indices:
+        p(f"  {label + ':':<12}{r['month']['points']:+.2f} pts ({r['month']['pct']:+.2f}%)")
+    p()
+    p("📉 3-WEEK TREND SUMMARY")
+    p("───────────────────────────────────────────────────────")
+    p(f"From {as_of - timedelta(days=HORIZONS['three_weeks']):%b %d} to {as_of:%b %d}:")
+    for label, r in indices:
+        p(f"  {label + ':':<12}{r['three_weeks']['value']:.2f} → {r['current']:.2f} ({r['three_weeks']['pct']:+.2f}%)")
+    p()
+    p("🔍 KEY CONTEXT")
+    p("───────────────────────────────────────────────────────")
+    sp500_current, sp500_high, sp500_low = sp500["current"], sp500["high_30"], sp500["low_30"]
+    vix_current = vix["current"]
+    p(f"• S&P 500 trading near {sp500_current:,.2f}")
+    p(f"  - 30-day range: {sp500_low:,.2f} - {sp500_high:,.2f}")
+    p(f"  - Distance from 30-day high: {((sp500_current-sp500_high)/sp500_high*100):.2f}%")
+    p(f"  - Drawdown from peak: {sp500['context']['drawdown']:.2f}%")
+    p(f"  - 30-day realized volatility: {sp500['context'][30]['vol']:.1f}%")
+    p()
+    p(f"• VIX at {vix_current:.2f} (recent peak: {vix['high_10']:.2f})")
+    if vix_current > 20:
+        p("  - Elevated volatility persists")
+    elif vix_current > 17:
+        p("  - Moderately elevated volatility")
+    else:
+        p("  - Volatility normalizing")
+    p()
+    weekly = [r["week"]["pct"] for _, r in indices]
+    if all(pct > 0 for pct in weekly):
+        p("• Broad market strength across all indices")
+    elif all(pct < 0 for pct in weekly):
+        p("• Weakness across all major indices")
+    else:
+        p("• Mixed performance across indices")
+    sp500_m_pct = sp500["month"]["pct"]
+    if sp500_m_pct < -2:
+        p("• S&P 500 down significantly over 30 days")
+    elif sp500_m_pct > 2:
+        p("• S&P 500 showing strong monthly gains")
+    else:
+        p("• S&P 500 consolidating in recent range")
+    if watch:
+        p()
+        p("👀 WATCHLIST")
+        p("───────────────────────────────────────────────────────")
+        for r in watch:
+            if r["current"] is None:
+                p(f"  {r['id']:<12}no data")
+                continue
+            week, month = r["week"]["pct"], r["month"]["pct"]
+            p(f"  {r['id']:<12}{r['current']:>12,.2f}"
+              f"   1w {'n/a' if week is None else f'{week:+.2f}%':>8}"
+              f"   1m {'n/a' if month is None else f'{month:+.2f}%':>8}")
+    p()
+    p("═══════════════════════════════════════════════════════")
+
+
+def briefs(results, count, empty):
+    n = len(results)
+    for i in range(count):
+        watch = [results[(i + 4) % n], results[(i + 5) % n], empty if i % 50 == 0 else results[(i + 6) % n]]
+        yield [results[(i + k) % n] for k in range(4)], watch
+
+
+def timed(fn, path, buffering):
+    with open(path, "w", encoding="utf-8", buffering=buffering) as out:
+        t0 = time.perf_counter()
+        fn(out)
+        return time.perf_counter() - t0
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    results = [analyze_series(make_series(i), AS_OF) for i in range(count)]
+    empty = dict(results[0], id="EMPTY", current=None)  # a watchlist slot in every 50th brief
+    jobs = list(briefs(results, count, empty))
+
+    for four, watch in jobs:
+        legacy = io.StringIO()
+        legacy_print(four, AS_OF, watch, legacy)
+        assert render_brief(brief_context(four, AS_OF, watch)) == legacy.getvalue()
+
+    def run_legacy(out):
+        for four, watch in jobs:
+            legacy_print(four, AS_OF, watch, out)
+
+    def run_render(out):
+        for four, watch in jobs:
+            write_brief(render_brief(brief_context(four, AS_OF, watch)), out)
+
+    with tempfile.TemporaryDirectory(prefix="bench_render_") as tmp:
+        path = os.path.join(tmp, "brief.txt")
+        rows = []
+        for label, buffering in (("line-buffered", 1), ("block-buffered", -1)):
+            t_legacy = min(timed(run_legacy, path, buffering) for _ in range(3))
+            t_render = min(timed(run_render, path, buffering) for _ in range(3))
+            rows.append((label, t_legacy, t_render))
+
+    contexts = [brief_context(four, AS_OF, watch) for four, watch in jobs]
+    fmt_times = {}
+    for fmt in ("text", "markdown", "json"):
+        t0 = time.perf_counter()
+        for ctx in contexts:
+            render_brief(ctx, fmt)
+        fmt_times[fmt] = time.perf_counter() - t0
+
+    print(f"{len(jobs)} briefs (4 series + 3-series watchlist each), text output identical to print()")
+    for label, t_legacy, t_render in rows:
+        print(f"  {label:<15} print per line: {t_legacy * 1000:7.1f} ms   render + one write: "
+              f"{t_render * 1000:7.1f} ms ({t_legacy / t_render:.1f}x)")
+    print("  render only from prebuilt contexts: " +
+          ", ".join(f"{fmt} {t * 1000:.1f} ms" for fmt, t in fmt_times.items()))
+
+
+if __name__ == "__main__":
+    main()
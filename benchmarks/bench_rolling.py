@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rolling KEY CONTEXT statistics on 30 years of daily data.
+
+Compares market_rolling (monotonic deques and prefix sums, all windows in
+O(n) each) with re-slicing the history for every row and window, and checks
+that both agree.
+
+Usage: python3 benchmarks/bench_rolling.py [years]
+"""
+
+import math
+import random
+import statistics
+import sys
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_rolling import rolling_extremes, rolling_moments, rolling_stats
+
+WINDOWS = (5, 10, 21, 30, 63, 126, 252)
+
+
+def make_values(n):
+    rng = random.Random(5)
+    value = 400.0
+    out = array("d")
+    for _ in range(n):
+        value *= 1 + rng.gauss(0.0003, 0.012)
+        out.append(value)
+    return out
+
+
+def resliced(values, windows):
+    """The old approach generalised: slice the window for every row"""
+    out = {}
+    for w in windows:
+        highs, lows, means = [], [], []
+        for i in range(len(values)):
+            chunk = values[max(0, i + 1 - w):i + 1]
+            highs.append(max(chunk))
+            lows.append(min(chunk))
+            means.append(sum(chunk) / len(chunk))
+        out[w] = (highs, lows, means)
+    return out
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    values = make_values(years * 252)
+    print(f"{len(values):,} observations, windows {WINDOWS}")
+
+    start = time.perf_counter()
+    naive = resliced(values, WINDOWS)
+    t_naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    highs, lows = rolling_extremes(values, WINDOWS)
+    means, stds = rolling_moments(values, WINDOWS)
+    t_fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rolling_stats(values, WINDOWS)
+    t_all = time.perf_counter() - start
+
+    for w in WINDOWS:
+        n_high, n_low, n_mean = naive[w]
+        assert list(highs[w]) == n_high and list(lows[w]) == n_low
+        assert all(math.isclose(a, b, rel_tol=1e-9) for a, b in zip(means[w], n_mean))
+        i = len(values) - 1
+        chunk = values[i + 1 - w:i + 1]
+        assert math.isclose(stds[w][i], statistics.pstdev(chunk), rel_tol=1e-6)
+
+    print(f"  re-slicing high/low/mean:  {t_naive * 1000:9.1f} ms")
+    print(f"  rolling high/low/mean/std: {t_fast * 1000:9.1f} ms ({t_naive / t_fast:.1f}x)")
+    print(f"  rolling_stats (+vol, drawdown): {t_all * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: columnar Series vs the old list of (datetime, float) tuples.
+
+Reports memory per million observations and the cost of the lookups the
+brief performs (as-of value, latest close, 30-day range).
+
+Usage: python3 benchmarks/bench_series.py [observations]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import get_value_on_date
+from market_series import Series
+
+
+def iter_pairs(n):
+    start = datetime(1990, 1, 1)
+    rng = random.Random(42)
+    value = 1000.0
+    for i in range(n):
+        value *= 1 + rng.gauss(0, 0.01)
+        yield start + timedelta(days=i), value
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def tuple_value_on_date(data, target_date):
+    for d, v in reversed(data):
+        if d <= target_date:
+            return v
+    return None
+
+
+def timeit(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tuples, tuple_bytes = measure_memory(lambda: list(iter_pairs(n)))
+    series, series_bytes = measure_memory(lambda: Series.from_pairs(iter_pairs(n)))
+
+    scale = 1_000_000 / n
+    print(f"Observations: {n:,}")
+    print(f"  tuple list: {tuple_bytes * scale / 2**20:8.1f} MiB per 1M obs")
+    print(f"  Series:     {series_bytes * scale / 2**20:8.1f} MiB per 1M obs")
+
+    # As-of lookup roughly one month back from the end, as the brief does
+    target = tuples[-1][0] - timedelta(days=30)
+    t_tuple = timeit(lambda: tuple_value_on_date(tuples, target), 2000)
+    t_series = timeit(lambda: get_value_on_date(series, target), 2000)
+    assert tuple_value_on_date(tuples, target) == get_value_on_date(series, target)
+    print("As-of lookup (30 days back):")
+    print(f"  tuple list: {t_tuple * 1e6:8.2f} us")
+    print(f"  Series:     {t_series * 1e6:8.2f} us")
+
+    t_tuple = timeit(lambda: (max([v for d, v in tuples[-30:]]), min([v for d, v in tuples[-30:]])), 20000)
+    t_series = timeit(lambda: (max(series.values[-30:]), min(series.values[-30:])), 20000)
+    print("30-day range:")
+    print(f"  tuple list: {t_tuple * 1e6:8.2f} us")
+    print(f"  Series:     {t_series * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
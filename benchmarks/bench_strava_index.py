@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark + check: date-indexed Strava loader vs json.load of the whole export.
+
+Writes a synthetic activities_latest.json (default 50,000 activities over
+about eight years, newest first like the Strava API returns them) and
+compares the old per-day path -- json.load everything, then scan every
+start_date -- with StravaIndex: a one-time streaming conversion to sorted
+JSON lines plus a day index, after which a lookup reads one byte range.
+Checks the incremental parser against json.load (with a small chunk size so
+objects straddle chunk boundaries), and that day and range lookups return
+exactly the activities the full scan finds. Reports time and peak memory
+per lookup.
+
+Usage: python3 benchmarks/bench_strava_index.py [activities]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+from strava_index import StravaIndex, iter_json_array
+
+END = date(2026, 2, 23)
+TYPES = ("Run", "Ride", "Swim", "Walk", "WeightTraining")
+
+
+def generate(count, seed=21):
+    rng = random.Random(seed)
+    span_days = max(1, count // 17)
+    activities = []
+    for i in range(count):
+        start = datetime.combine(END - timedelta(days=rng.randrange(span_days)), datetime.min.time())
+        start += timedelta(seconds=rng.randrange(5 * 3600, 21 * 3600))
+        moving = rng.randrange(900, 10800)
+        activities.append({
+            "id": 10_000_000_000 + i, "name": f"Activity {i}", "type": rng.choice(TYPES),
+            "start_date": start.isoformat() + "Z", "start_date_local": start.isoformat() + "Z",
+            "distance": round(rng.uniform(0, 60000), 1), "moving_time": moving,
+            "elapsed_time": moving + rng.randrange(600), "total_elevation_gain": round(rng.uniform(0, 900), 1),
+            "average_speed": round(rng.uniform(1, 12), 3), "max_speed": round(rng.uniform(5, 20), 3),
+            "average_heartrate": round(rng.uniform(100, 170), 1), "calories": rng.randrange(0, 1600),
+            "map": {"summary_polyline": "".join(rng.choice("abcdefghij?@_~") for _ in range(200))},
+        })
+    activities.sort(key=lambda a: a["start_date"], reverse=True)
+    return activities
+
+
+def scan_day(path, day):
+    """The old parse_strava_health lookup: load everything, scan start_date"""
+    with open(path, "r") as f:
+        activities = json.load(f)
+    return [a for a in activities if a.get("start_date", "").startswith(str(day))]
+
+
+def measure(fn, repeat):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - t0) / repeat, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    activities = generate(count)
+    with tempfile.TemporaryDirectory(prefix="bench_strava_") as tmp:
+        tmp = Path(tmp)
+        source = tmp / "activities_latest.json"
+        source.write_text(json.dumps(activities, indent=1))
+        size_mb = source.stat().st_size / 1e6
+
+        small = tmp / "small.json"
+        small.write_text(json.dumps(activities[:500], indent=2))
+        assert list(iter_json_array(small, chunk_size=97)) == activities[:500]
+        assert list(iter_json_array(source)) == activities
+
+        index = StravaIndex(source, tmp / "strava.jsonl", tmp / "strava.idx.json")
+        t0 = time.perf_counter()
+        index.build()
+        t_build = time.perf_counter() - t0
+        assert index.count() == count
+
+        # Every sampled active day plus two empty ones match the full scan, oldest first
+        by_day = {}
+        for a in activities:
+            by_day.setdefault(a["start_date"][:10], []).append(a)
+        assert index.dates() == sorted(by_day)
+        for day in list(by_day)[::50] + ["2010-01-01", str(END + timedelta(days=1))]:
+            expected = sorted(by_day.get(day, []), key=lambda a: a["start_date"])
+            assert index.day(day) == expected, day
+        month = [a for a in activities if "2025-06-01" <= a["start_date"][:10] <= "2025-06-30"]
+        assert index.range("2025-06-01", "2025-06-30") == sorted(month, key=lambda a: a["start_date"])
+
+        day = sorted(by_day)[len(by_day) // 2]
+        repeat = 3
+        old, t_old, peak_old = measure(lambda: scan_day(source, day), repeat)
+        cold, t_cold, peak_cold = measure(
+            lambda: StravaIndex(source, tmp / "strava.jsonl", tmp / "strava.idx.json").day(day), repeat * 10)
+        warm, t_warm, _ = measure(lambda: index.day(day), repeat * 100)
+        # The index returns a day oldest first; the export is newest first
+        assert sorted(old, key=lambda a: a["start_date"]) == cold == warm
+        _, t_range, _ = measure(lambda: index.range("2025-01-01", "2025-12-31"), repeat)
+
+        # Touching the export invalidates the index
+        source.write_text(json.dumps(activities[:100]))
+        assert index.count() == 100
+
+    print(f"{count} activities, {size_mb:.1f} MB export, {len(by_day)} active days; index built in {t_build:.2f} s")
+    print(f"  json.load + scan, one day:  {t_old * 1000:8.1f} ms  peak {peak_old / 1e6:6.1f} MB")
+    print(f"  index, one day (cold):      {t_cold * 1000:8.2f} ms  peak {peak_cold / 1e6:6.2f} MB "
+          f"({t_old / t_cold:.0f}x)")
+    print(f"  index, one day (warm):      {t_warm * 1000:8.3f} ms ({t_old / t_warm:.0f}x)")
+    print(f"  index, one year range:      {t_range * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark + check: a year of Strava rollups in one pass vs one call per date.
+
+Builds a synthetic export (default 3 years, ~2 activities a day, some with
+Relative Effort, some with heart rate only) and rolls up the most recent
+full year three ways: the old parse_strava_health path (json.load of the
+whole export + scan per date, timed on a sample and extrapolated), one
+indexed build_strava_health call per date with weekly and per-type totals
+summed afterwards, and strava_rollup.rollup_strava's single grouped pass.
+Checks the daily records match build_strava_health exactly and the weekly,
+per-type and overall totals match sums computed independently.
+
+Usage: python3 benchmarks/bench_strava_rollup.py [years]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+import strava_index
+from strava_adapter import build_strava_health, training_load
+from strava_index import StravaIndex
+from strava_rollup import rollup_strava
+
+END = date(2026, 2, 22)
+TYPES = ("Run", "Ride", "Swim", "Walk", "WeightTraining")
+KEYS = ("distance_meters", "duration_seconds", "calories", "activity_count", "training_load")
+
+
+def generate(years, seed=22):
+    rng = random.Random(seed)
+    activities = []
+    for i in range(365 * years):
+        day = END - timedelta(days=i)
+        for _ in range(rng.choice((0, 1, 2, 2, 3, 4))):
+            start = datetime.combine(day, datetime.min.time()) + timedelta(seconds=rng.randrange(5 * 3600, 21 * 3600))
+            activity = {"id": len(activities), "type": rng.choice(TYPES), "start_date": start.isoformat() + "Z",
+                        "distance": round(rng.uniform(0, 60000), 1), "moving_time": rng.randrange(900, 10800),
+                        "calories": rng.randrange(0, 1600)}
+            roll = rng.random()
+            if roll < 0.4:
+                activity["suffer_score"] = rng.randrange(5, 300)
+            elif roll < 0.8:
+                activity["average_heartrate"] = round(rng.uniform(100, 175), 1)
+            activities.append(activity)
+    activities.sort(key=lambda a: a["start_date"], reverse=True)
+    return activities
+
+
+def old_parse(path, day):
+    """parse_strava_health before the index: load everything, scan start_date"""
+    with open(path, "r") as f:
+        activities = json.load(f)
+    return build_strava_health(day, [a for a in activities if a.get("start_date", "").startswith(str(day))])
+
+
+def per_date(index, start, end):
+    """One indexed call per date, then weekly and per-type sums"""
+    days, weeks, by_type = [], {}, {}
+    day = start
+    while day <= end:
+        record = build_strava_health(str(day), index.day(day))
+        days.append(record)
+        iso = day.isocalendar()
+        week = weeks.setdefault(f"{iso.year}-W{iso.week:02d}", dict.fromkeys(KEYS, 0))
+        for key in KEYS:
+            week[key] += record["activity"][key]
+        day += timedelta(days=1)
+    for a in index.range(start, end):
+        totals = by_type.setdefault(a.get("type", "Activity"), dict.fromkeys(KEYS, 0))
+        totals["distance_meters"] += a.get("distance", 0) or 0
+        totals["duration_seconds"] += a.get("moving_time", 0) or 0
+        totals["calories"] += a.get("calories", 0) or 0
+        totals["activity_count"] += 1
+        totals["training_load"] += training_load(a)
+    return days, weeks, by_type
+
+
+def close(a, b):
+    return all(abs(a[k] - b[k]) < 1e-6 * max(1, abs(a[k])) + 0.1 * (k == "training_load") for k in KEYS)
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    activities = generate(years)
+    start, end = END - timedelta(days=364), END
+    with tempfile.TemporaryDirectory(prefix="bench_rollup_") as tmp:
+        tmp = Path(tmp)
+        source = tmp / "activities_latest.json"
+        source.write_text(json.dumps(activities))
+        index = StravaIndex(source, tmp / "strava.jsonl", tmp / "strava.idx.json")
+        index.build()
+        strava_index._default_index = index
+
+        sample = [start + timedelta(days=d) for d in range(0, 365, 73)]
+        t0 = time.perf_counter()
+        for day in sample:
+            old_parse(source, day)
+        t_old = (time.perf_counter() - t0) / len(sample) * 365
+
+        t0 = time.perf_counter()
+        days, weeks, by_type = per_date(index, start, end)
+        t_per_date = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        result = rollup_strava(start, end)
+        t_rollup = time.perf_counter() - t0
+
+        # Same totals as before the index (summed in export order, so compared with a tolerance)
+        for day in sample:
+            assert close(old_parse(source, day)["activity"], next(d for d in days if d["date"] == str(day))["activity"])
+
+    assert result["days"] == days
+    assert [w["week"] for w in result["weeks"]] == list(weeks)
+    for w in result["weeks"]:
+        assert close(w["activity"], weeks[w["week"]]), w["week"]
+        assert w["activity"]["activity_count"] == sum(t["activity_count"] for t in w["by_type"].values())
+    assert result["by_type"].keys() == by_type.keys()
+    assert all(close(result["by_type"][k], by_type[k]) for k in by_type)
+    overall = {k: sum(d["activity"][k] for d in days) for k in KEYS}
+    assert close(result["activity"], overall)
+
+    count = result["activity"]["activity_count"]
+    print(f"{len(activities)} activities in export; rollup of {start}..{end}: {count} activities, "
+          f"{len(result['weeks'])} weeks, {len(result['by_type'])} types")
+    print(f"  json.load + scan per date:  {t_old:8.2f} s (extrapolated from {len(sample)} dates)")
+    print(f"  indexed call per date:      {t_per_date * 1000:8.1f} ms")
+    print(f"  single grouped pass:        {t_rollup * 1000:8.1f} ms ({t_per_date / t_rollup:.1f}x vs per date, "
+          f"{t_old / t_rollup:.0f}x vs json.load)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-series brief jobs over a worker pool at 1, 2, 4 and 8 workers.
+
+Each job parses one FRED CSV and runs analyze_series, which is the shape of a
+cold watchlist run. Threads share the GIL, so expect scaling mainly from the
+process pool.
+
+Usage: python3 benchmarks/bench_workers.py [series] [rows_per_series]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_analysis import analyze_series, parse_csv, run_brief_jobs
+
+
+def csv_job(path):
+    return analyze_series(parse_csv(Path(path).read_bytes()))
+
+
+def write_csvs(root, count, rows):
+    paths = []
+    for i in range(count):
+        lines = [f"observation_date,S{i:03d}"]
+        day = date(1995, 1, 2)
+        for k in range(rows):
+            lines.append(f"{(day + timedelta(days=k)).isoformat()},{100 + i + (k % 97) * 0.25:.2f}")
+        path = root / f"S{i:03d}.csv"
+        path.write_text("\n".join(lines))
+        paths.append(str(path))
+    return paths
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 8_000
+    with tempfile.TemporaryDirectory(prefix="bench_workers_") as tmp:
+        jobs = [partial(csv_job, p) for p in write_csvs(Path(tmp), count, rows)]
+        baseline = run_brief_jobs(jobs, workers=1)
+        print(f"{count} series x {rows:,} rows, {os.cpu_count()} CPUs")
+        for processes in (False, True):
+            kind = "processes" if processes else "threads"
+            for workers in (1, 2, 4, 8):
+                start = time.perf_counter()
+                results = run_brief_jobs(jobs, workers=workers, processes=processes)
+                elapsed = time.perf_counter() - start
+                assert [r["id"] for r in results] == [r["id"] for r in baseline]
+                print(f"  {kind:<9} x{workers}: {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk workout import vs logging each line as it arrives.
+
+Generates a chat export of dated workout messages (with a few invalid
+lines), then imports it three ways: the old per-workout read-modify-write of
+the day's record in the HealthStore (on a prefix of the export, extrapolated
+linearly, which understates it since records grow; pass rmw_lines=lines for
+the full run), one save_workout-style insert per line, and import_workout_log
+(parse, group by date, one transaction). Checks the two full imports log the
+same workouts, that every invalid line is reported with its number, and that
+a malformed default date is rejected without writing anything.
+
+Usage: python3 benchmarks/bench_workout_import.py [lines] [rmw_lines]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+import health_store
+import workout_journal
+
+TEMPLATES = ("log a {n} min {act}", "logged {h} hour {act}", "{n} minutes {act}", "did {n} min {act} today")
+ACTIVITIES = ("run", "bike", "swim", "walk", "lifting", "yoga", "rowing")
+INVALID = ("felt great today", "rest day", "2026-02-30 log a 30 min run", "log a run")
+
+
+def make_export(count, rng):
+    lines, bad = [], set()
+    start = date(2026, 2, 23) - timedelta(days=365)
+    for i in range(count):
+        if rng.random() < 0.01:
+            text = rng.choice(INVALID)
+            if not text.startswith("2026"):
+                text = f"{start + timedelta(days=rng.randrange(365))} {text}"
+            bad.add(i + 1)
+        else:
+            day = start + timedelta(days=rng.randrange(365))
+            msg = rng.choice(TEMPLATES).format(n=rng.randint(10, 120), h=rng.choice((1, 1.5, 2)),
+                                               act=rng.choice(ACTIVITIES))
+            text = f"[{day} {rng.randint(5, 21):02d}:{rng.randint(0, 59):02d}] {msg}" if rng.random() < 0.5 \
+                else f"{day} {msg}"
+        lines.append(text + "\n")
+    return lines, bad
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rmw_count = min(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000, count)
+    lines, bad = make_export(count, random.Random(15))
+
+    with tempfile.TemporaryDirectory(prefix="bench_import_") as tmp:
+        tmp = Path(tmp)
+        health_store.DB_FILE = tmp / "health.db"
+        health_store.DATA_DIR = tmp
+        import health_tracker
+
+        # The pre-journal save_workout: read the day's record, append, write it back
+        store = health_store.HealthStore(tmp / "rmw.db")
+        t0 = time.perf_counter()
+        for line in lines[:rmw_count]:
+            day, _, message = line.partition(" ")
+            workout = health_tracker.parse_workout_log(message)
+            if workout:
+                data = store.get(day.strip("[")) or {"date": day.strip("["), "workouts": []}
+                data["workouts"].append(workout)
+                store.put(data)
+        t_rmw = (time.perf_counter() - t0) * count / rmw_count
+        store.close()
+
+        # One insert per line, grouped the same way as the import
+        per_line = health_store.HealthStore(tmp / "per_line.db")
+        t0 = time.perf_counter()
+        for line in lines:
+            report = health_tracker.import_workout_log([line], store=per_line)
+        t_append = time.perf_counter() - t0
+
+        bulk = health_store.HealthStore(tmp / "bulk.db")
+        t0 = time.perf_counter()
+        report = health_tracker.import_workout_log(lines, store=bulk)
+        t_bulk = time.perf_counter() - t0
+
+        slow = workout_journal.read_workouts(store=per_line)
+        fast = workout_journal.read_workouts(store=bulk)
+        rejected = False
+        try:
+            health_tracker.import_workout_log(["log a 30 min run"], "02/17/2026", store=bulk)
+        except ValueError:
+            rejected = workout_journal.read_workouts(store=bulk) == fast
+        per_line.close()
+        bulk.close()
+
+    key = lambda w: (w["timestamp"], w["type"], w["duration_min"])
+    assert {d: sorted(ws, key=key) for d, ws in slow.items()} == {d: sorted(ws, key=key) for d, ws in fast.items()}
+    assert {n for n, _, _ in report["invalid"]} == bad
+    assert report["imported"] == count - len(bad)
+    assert rejected, "a non-ISO default date must be rejected before anything is written"
+    print(f"{count:,} lines -> {report['imported']:,} workouts on {len(report['days'])} days, "
+          f"{len(report['invalid'])} invalid lines reported")
+    basis = "measured" if rmw_count >= count else f"lower bound from {rmw_count:,} lines"
+    print(f"  read-modify-write per workout: {t_rmw:8.2f} s ({basis})")
+    print(f"  one insert per line:           {t_append:8.2f} s")
+    print(f"  import_workout_log:            {t_bulk:8.2f} s ({t_append / t_bulk:.0f}x vs per-line insert, "
+          f"{t_rmw / t_bulk:.0f}x vs read-modify-write)")
+
+
+if __name__ == "__main__":
+    main()
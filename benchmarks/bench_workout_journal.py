@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent workout logging, workouts table vs read-modify-write.
+
+Several processes log workouts for the same day at once while another keeps
+reading that day's workouts and another keeps saving Garmin-style daily
+records for it, then counts how many workouts the store kept. For contrast,
+the same load runs against the old pattern (load the day's JSON file,
+append, rewrite it), which loses workouts. Also times one append with
+each approach on a day that already holds many workouts, and a one-day read
+from a year of workouts: the indexed table vs parsing a JSON-lines journal.
+tests/test_workout_journal.py checks that no workout is lost.
+
+Usage: python3 benchmarks/bench_workout_journal.py [processes] [workouts_per_process] [year_workouts]
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/health-tracker"))
+
+import workout_journal
+from health_store import HealthStore
+
+DAY = "2026-02-23"
+
+
+def store_writer(db_path, worker, count):
+    store = HealthStore(db_path)
+    for i in range(count):
+        workout_journal.append_workout({"type": "Run", "duration_min": 30, "id": f"{worker}-{i}"}, DAY, store)
+    store.close()
+
+
+def reader(db_path, stop):
+    store = HealthStore(db_path)
+    while not stop.is_set():
+        workout_journal.read_workouts(DAY, DAY, store)
+    store.close()
+
+
+def garmin_writer(db_path, stop):
+    store = HealthStore(db_path)
+    while not stop.is_set():
+        store.put({"date": DAY, "source": "garmin", "sleep": {"score": 80}}, keep=("workouts",))
+    store.close()
+
+
+def rewrite_writer(path, worker, count):
+    """The old save_workout: read the day's file, append, rewrite the whole file"""
+    for i in range(count):
+        data = {"date": DAY, "workouts": []}
+        if path.exists():
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except ValueError:  # caught another writer mid-rewrite
+                pass
+        data["workouts"].append({"type": "Run", "duration_min": 30, "id": f"{worker}-{i}"})
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def journal_read(path, day):
+    """The old read_workouts: parse the whole JSON-lines journal, keep one day"""
+    by_day = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            entry = json.loads(line)
+            d = entry.pop("date")
+            if d == day:
+                by_day.setdefault(d, []).append(entry)
+    return by_day
+
+
+def run(target, args_for, processes, extra=()):
+    workers = [multiprocessing.Process(target=target, args=args_for(w)) for w in range(processes)]
+    for p in list(workers) + list(extra):
+        p.start()
+    for p in workers:
+        p.join()
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    per_process = int(sys.argv[2]) if len(sys.argv) > 2 else 250
+    year = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    expected = {f"{w}-{i}" for w in range(processes) for i in range(per_process)}
+
+    with tempfile.TemporaryDirectory(prefix="bench_journal_") as tmp:
+        db_path = Path(tmp) / "health.db"
+        HealthStore(db_path).close()
+        stop = multiprocessing.Event()
+        background = [multiprocessing.Process(target=reader, args=(db_path, stop)),
+                      multiprocessing.Process(target=garmin_writer, args=(db_path, stop))]
+        t0 = time.perf_counter()
+        run(store_writer, lambda w: (db_path, w, per_process), processes, background)
+        t_store = time.perf_counter() - t0
+        stop.set()
+        for p in background:
+            p.join()
+        store = HealthStore(db_path)
+        logged = [w["id"] for w in workout_journal.read_workouts(DAY, DAY, store).get(DAY, [])]
+
+        legacy = Path(tmp) / f"{DAY}.json"
+        t0 = time.perf_counter()
+        run(rewrite_writer, lambda w: (legacy, w, per_process), processes)
+        t_legacy = time.perf_counter() - t0
+        with open(legacy, "r") as f:
+            survived = len(json.load(f)["workouts"])
+
+        # Cost of one more append on a day that already has many workouts
+        reps = 200
+        t0 = time.perf_counter()
+        for i in range(reps):
+            workout_journal.append_workout({"type": "Run", "duration_min": 30}, DAY, store)
+        t_append = (time.perf_counter() - t0) / reps
+        with open(legacy, "w") as f:
+            json.dump({"date": DAY, "workouts": [{"type": "Run", "duration_min": 30, "id": i} for i in expected]}, f)
+        t0 = time.perf_counter()
+        rewrite_writer(legacy, "x", reps)
+        t_rewrite = (time.perf_counter() - t0) / reps
+        store.close()
+
+        # One day's workouts out of a year of them: indexed query vs parsing the whole journal
+        days = [(date(2026, 2, 23) - timedelta(days=i)).isoformat() for i in range(365)]
+        workouts = [(days[i % 365], {"type": "Run", "duration_min": 30, "id": i}) for i in range(year)]
+        journal = Path(tmp) / "workouts.jsonl"
+        with open(journal, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(dict(w, date=d), separators=(",", ":")) + "\n" for d, w in workouts)
+        store = HealthStore(Path(tmp) / "year.db")
+        workout_journal.import_journal(journal, store)
+        t0 = time.perf_counter()
+        for day in days[:20]:
+            workout_journal.read_workouts(day, day, store)
+        t_indexed = (time.perf_counter() - t0) / 20
+        t0 = time.perf_counter()
+        journal_read(journal, days[0])
+        t_scan = time.perf_counter() - t0
+        store.close()
+
+    total = len(expected)
+    print(f"{processes} processes x {per_process} workouts on one day "
+          f"(store run also reading the day and saving Garmin records concurrently)")
+    print(f"  workouts table:      {len(set(logged) & expected):6d}/{total} kept in {t_store:6.2f} s")
+    print(f"  read-modify-write:   {survived:6d}/{total} kept in {t_legacy:6.2f} s "
+          f"({total - survived} lost)")
+    print(f"  one append, ~{total} workouts that day: table {t_append * 1e6:8.1f} us, "
+          f"rewrite {t_rewrite * 1e6:8.1f} us")
+    print(f"  one day's workouts out of {year:,}: indexed {t_indexed * 1e3:7.2f} ms, "
+          f"journal scan {t_scan * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for garmin_connect.GarminConnect used by the health benchmarks.
+
+Returns deterministic payloads per date, sleeps to simulate network latency,
+fails a fixed subset of first attempts to exercise retries, and counts
+logins and calls per endpoint. With require_auth, fetches fail until login()
+or resume() has supplied an unexpired token. Bumping revisions[endpoint]
+changes that endpoint's payloads, as new data arriving upstream would.
+"""
+
+import random
+import threading
+import time
+import zlib
+
+
+class FakeGarminClient:
+    def __init__(self, email="fake@example.com", password="secret", latency=0.05, jitter=0.02,
+                 fail_every=20, seed=0, login_latency=None, token_ttl=3600, require_auth=False,
+                 clock=time.time):
+        self.email = email
+        self.login_latency = latency * 4 if login_latency is None else login_latency
+        self.token_ttl = token_ttl
+        self.require_auth = require_auth
+        self.clock = clock
+        self.session = None
+        self.revisions = {}
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_every = fail_every
+        self.seed = seed
+        self.logins = 0
+        self.calls = {}
+        self._attempts = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    def login(self):
+        with self._lock:
+            self.logins += 1
+            token = f"token-{self.email}-{self.logins}"
+        time.sleep(self.login_latency)
+        self.session = {"oauth_token": token, "expires_at": self.clock() + self.token_ttl}
+        return dict(self.session)
+
+    def resume(self, session):
+        self.session = dict(session)
+
+    def _call(self, endpoint, day):
+        if self.require_auth and (not self.session or self.session["expires_at"] <= self.clock()):
+            raise PermissionError("401 Unauthorized: no valid session")
+        key = f"{endpoint}:{day}"
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+            delay = max(0.0, self._rng.gauss(self.latency, self.jitter))
+        time.sleep(delay)
+        revision = self.revisions.get(endpoint, 0)
+        rng = random.Random(zlib.crc32(f"{self.seed}:{key}:{revision}".encode()))
+        if self.fail_every and attempt == 1 and rng.randrange(self.fail_every) == 0:
+            raise ConnectionError(f"simulated timeout for {key}")
+        return rng
+
+    def get_daily_summary_data(self, day):
+        rng = self._call("summary", day)
+        return {"calendarDate": str(day), "steps": rng.randint(2000, 20000), "distance": rng.randint(1000, 15000),
+                "calories": rng.randint(1800, 3500), "activeMinutes": rng.randint(0, 120)}
+
+    def get_sleep_data(self, day):
+        rng = self._call("sleep", day)
+        duration = rng.randint(18000, 32000)
+        return {"calendarDate": str(day), "sleepDurationSeconds": duration,
+                "deepSleepDurationSeconds": duration // 5, "lightSleepDurationSeconds": duration // 2,
+                "remSleepDurationSeconds": duration // 5, "awakeDurationSeconds": duration // 10,
+                "sleepScore": rng.randint(40, 95)}
+
+    def get_stress_details(self, day):
+        rng = self._call("stress", day)
+        return {"calendarDate": str(day), "averageStressLevel": rng.randint(10, 70),
+                "bodyBatteryAverage": rng.randint(20, 90), "bodyBatteryMaximum": rng.randint(60, 100),
+                "bodyBatteryMinimum": rng.randint(5, 40)}
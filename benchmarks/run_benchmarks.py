@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the market-brief and health-tracker hot paths.
+
+Runs a fixed set of cases on seeded synthetic data (benchmarks/synthetic.py)
+and reports, per case, the best and median time per iteration and per
+operation. Sizes depend only on --scale, so a JSON result written on one
+commit can be compared with another run on the same machine:
+
+    python3 benchmarks/run_benchmarks.py --json before.json
+    (change things)
+    python3 benchmarks/run_benchmarks.py --compare before.json
+
+--compare prints the ratio per case and exits with status 1 when any case
+got slower than --threshold (default 10%) on its best time. Cases whose
+module can't be imported here (garmin.py needs the requests package) are
+reported as skipped with the reason rather than dropped.
+
+Cases:
+  market.parse_csv, market.get_value_on_date, market.calc_change,
+  market.rolling_context (KEY CONTEXT stats as of the last close),
+  market.rolling_stats (full-history windows), market.brief (analyze the
+  four brief series + render)
+  health.load_weekly_data, health.parse_workout_log, health.handle_query,
+  health.parse_garmin_data, health.parse_strava_health
+
+Usage: python3 benchmarks/run_benchmarks.py [--filter TEXT] [--scale N] [--repeats N]
+           [--min-time SECONDS] [--json FILE] [--compare FILE] [--threshold FRACTION] [--list]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "skills/health-tracker"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import synthetic
+
+SCHEMA = 1
+CASES = {}
+
+
+class Skip(Exception):
+    """Raised by a case setup that can't run in this environment"""
+
+
+def case(name):
+    """Register setup(env) -> (fn, ops): fn is timed, ops is operations per call"""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+class Env:
+    """Per-run state shared by case setups: scale and a scratch directory"""
+
+    def __init__(self, scale, tmp):
+        self.scale = scale
+        self.tmp = Path(tmp)
+        self._health = None
+
+    def n(self, base):
+        return max(1, int(base * self.scale))
+
+    def health(self):
+        """Point the health modules at a seeded store and journal under tmp (once)"""
+        if self._health is None:
+            import health_store
+            import workout_journal
+
+            health_dir = self.tmp / "health"
+            health_dir.mkdir()
+            health_store.DB_FILE = health_dir / "health.db"
+            health_store.DATA_DIR = health_dir
+            health_store._default_store = None
+            workout_journal.JOURNAL_FILE = health_dir / "workouts.jsonl"
+            import health_tracker
+            health_tracker.DATA_DIR = health_dir
+            health_tracker.BASELINE_FILE = health_dir / "health-baseline.json"
+
+            today = date.today()
+            health_store.get_store().put_many(synthetic.health_records(self.n(365), today))
+            for i, message in enumerate(synthetic.workout_messages(self.n(60))):
+                workout = health_tracker.parse_workout_log(message)
+                if workout:
+                    workout_journal.append_workout(workout, today - timedelta(days=i % 14))
+            self._health = health_tracker
+        return self._health
+
+
+# Market cases
+
+@case("market.parse_csv")
+def _parse_csv(env):
+    from market_analysis import parse_csv
+    text = synthetic.fred_csv(env.n(5000))
+    return lambda: parse_csv(text), 1
+
+
+@case("market.get_value_on_date")
+def _get_value_on_date(env):
+    from market_analysis import get_value_on_date, parse_csv
+    series = parse_csv(synthetic.fred_csv(env.n(9000)))
+    targets = synthetic.lookup_dates(env.n(1000))
+
+    def run():
+        for target in targets:
+            get_value_on_date(series, target)
+    return run, len(targets)
+
+
+@case("market.calc_change")
+def _calc_change(env):
+    from market_analysis import calc_change
+    pairs = synthetic.change_pairs(env.n(10000))
+
+    def run():
+        for current, previous in pairs:
+            calc_change(current, previous)
+    return run, len(pairs)
+
+
+@case("market.rolling_context")
+def _rolling_context(env):
+    from market_analysis import parse_csv
+    from market_rolling import latest_context
+    series = parse_csv(synthetic.fred_csv(env.n(9000)))
+    return lambda: latest_context(series), 1
+
+
+@case("market.rolling_stats")
+def _rolling_stats(env):
+    from market_analysis import parse_csv
+    from market_rolling import rolling_stats
+    series = parse_csv(synthetic.fred_csv(env.n(9000)))
+    return lambda: rolling_stats(series.values), 1
+
+
+@case("market.brief")
+def _brief(env):
+    from market_analysis import BRIEF_SERIES, HORIZONS, analyze_series, load_embedded_series, now
+    from market_render import brief_context, render_brief
+    series = load_embedded_series()
+
+    def run():
+        results = [analyze_series(series[series_id], now) for series_id in BRIEF_SERIES]
+        render_brief(brief_context(results, now, (), HORIZONS["three_weeks"]))
+    return run, 1
+
+
+# Health cases
+
+@case("health.load_weekly_data")
+def _load_weekly_data(env):
+    health_tracker = env.health()
+    return health_tracker.load_weekly_data, 1
+
+
+@case("health.parse_workout_log")
+def _parse_workout_log(env):
+    health_tracker = env.health()
+    messages = synthetic.workout_messages(env.n(1000))
+
+    def run():
+        for message in messages:
+            health_tracker.parse_workout_log(message)
+    return run, len(messages)
+
+
+@case("health.handle_query")
+def _handle_query(env):
+    health_tracker = env.health()
+    messages = synthetic.query_messages(env.n(200))
+
+    def run():
+        for message in messages:
+            health_tracker.handle_query(message)
+    return run, len(messages)
+
+
+@case("health.parse_garmin_data")
+def _parse_garmin_data(env):
+    env.health()
+    try:
+        from garmin import parse_garmin_data
+    except ImportError as e:
+        raise Skip(f"garmin.py could not be imported: {e}")
+    summary, sleep, stress = synthetic.garmin_payloads()
+    day = date(2026, 2, 23)
+    return lambda: parse_garmin_data(summary, sleep, stress, day), 1
+
+
+@case("health.parse_strava_health")
+def _parse_strava_health(env):
+    env.health()
+    import strava_index
+    from strava_adapter import parse_strava_health
+
+    source = env.tmp / "activities_latest.json"
+    source.write_text(synthetic.strava_export(env.n(10000)))
+    strava_index._default_index = strava_index.StravaIndex(
+        source, env.tmp / "strava-activities.jsonl", env.tmp / "strava-activities.idx.json")
+    strava_index._default_index.build()
+    days = [synthetic.STRAVA_END - timedelta(days=i * 7) for i in range(env.n(50))]
+
+    def run():
+        for day in days:
+            parse_strava_health(day)
+    return run, len(days)
+
+
+# Runner
+
+def _time(fn, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return time.perf_counter() - start
+
+
+def measure(fn, min_time, repeats):
+    """(loops, [seconds per call] * repeats), like timeit: GC off, loops calibrated to min_time"""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        fn()  # warm caches and lazy imports outside the timings
+        loops = 1
+        while True:
+            elapsed = _time(fn, loops)
+            if elapsed >= min_time:
+                break
+            loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.1))
+        times = [_time(fn, loops) / loops for _ in range(repeats)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return loops, times
+
+
+def run_case(name, env, min_time, repeats):
+    try:
+        fn, ops = CASES[name](env)
+        loops, times = measure(fn, min_time, repeats)
+    except Skip as e:
+        return {"name": name, "status": "skipped", "reason": str(e)}
+    except Exception as e:
+        return {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}"}
+    best = min(times)
+    return {"name": name, "status": "ok", "ops": ops, "loops": loops, "repeats": repeats,
+            "best_s": best, "median_s": statistics.median(times), "us_per_op": best / ops * 1e6}
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT, capture_output=True,
+                             text=True, timeout=30)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(names, scale, min_time, repeats):
+    with tempfile.TemporaryDirectory(prefix="benchmarks_") as tmp:
+        env = Env(scale, tmp)
+        results = [run_case(name, env, min_time, repeats) for name in names]
+    return {
+        "schema": SCHEMA,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "scale": scale,
+        "min_time": min_time,
+        "results": results,
+    }
+
+
+def format_results(report):
+    lines = [f"revision {report['revision']}  python {report['python']}  scale {report['scale']}"]
+    for r in report["results"]:
+        if r["status"] == "ok":
+            lines.append(f"  {r['name']:<28}{r['us_per_op']:>12.3f} us/op  x{r['ops']:<6}"
+                         f"best {r['best_s'] * 1000:9.3f} ms  median {r['median_s'] * 1000:9.3f} ms")
+        else:
+            lines.append(f"  {r['name']:<28}{r['status']}: {r.get('reason') or r.get('error')}")
+    return "\n".join(lines)
+
+
+def compare(report, baseline, threshold):
+    """Lines comparing report with baseline, and the names that regressed"""
+    lines = [f"vs {baseline.get('revision')} ({baseline.get('created')}), threshold +{threshold:.0%}"]
+    if baseline.get("scale") != report["scale"]:
+        lines.append(f"  warning: baseline scale {baseline.get('scale')} != {report['scale']}; ratios are not comparable")
+    old = {r["name"]: r for r in baseline.get("results", [])}
+    regressed = []
+    for r in report["results"]:
+        before = old.get(r["name"])
+        if before is None or before["status"] != "ok" or r["status"] != "ok":
+            state = "new" if before is None else f"{before['status']} -> {r['status']}"
+            lines.append(f"  {r['name']:<28}{state}")
+            continue
+        ratio = r["best_s"] / before["best_s"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressed.append(r["name"])
+        elif ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        lines.append(f"  {r['name']:<28}{before['us_per_op']:>12.3f} -> {r['us_per_op']:>12.3f} us/op  "
+                     f"{ratio:6.2f}x{flag}")
+    return lines, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Market and health benchmark harness")
+    parser.add_argument("--filter", default="", help="run cases whose name contains TEXT")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every data size (default 1)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed repeats per case (default 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat (default 0.2)")
+    parser.add_argument("--json", help="write the JSON report here ('-' for stdout)")
+    parser.add_argument("--compare", help="JSON report from another run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    report = run(names, args.scale, args.min_time, args.repeats)
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_results(report))
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare:
+        with open(args.compare) as f:
+            lines, regressed = compare(report, json.load(f), args.threshold)
+        print("\n".join(lines), file=sys.stderr if args.json == "-" else sys.stdout)
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
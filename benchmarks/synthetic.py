@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic data for the benchmark harness.
+
+Every generator takes an explicit seed and size, so the same arguments give
+byte-identical data on every machine and commit. Dates are anchored to fixed
+days, except health records, which end on a caller-supplied day because the
+health queries read "today".
+"""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+
+MARKET_END = date(2026, 2, 20)
+STRAVA_END = date(2026, 2, 22)
+
+ACTIVITIES = ("run", "bike", "swim", "walk", "lifting", "weights", "yoga", "cycling", "rowing")
+STRAVA_TYPES = ("Run", "Ride", "Swim", "Walk", "WeightTraining")
+QUERIES = (
+    "how did I sleep?", "sleep score last night", "what's my recovery?", "body battery status",
+    "am I cleared for hard training?", "should I train today", "weekly summary", "how was my week",
+    "health brief", "morning brief please", "how were my last 30 days", "past 2 weeks", "this year so far",
+    "month over month", "last quarter", "thanks!", "what's the weather",
+)
+
+
+def fred_csv(rows, seed=1, name="SP500", end=MARKET_END, missing=0.03):
+    """FRED-style CSV text with `rows` business days ending at end, some values blank"""
+    rng = random.Random(seed)
+    days = []
+    day = end
+    while len(days) < rows:
+        if day.weekday() < 5:
+            days.append(day)
+        day -= timedelta(days=1)
+    value = 1000.0 + rng.random() * 5000
+    lines = [f"observation_date,{name}"]
+    for day in reversed(days):
+        value *= 1 + rng.gauss(0.0003, 0.011)
+        lines.append(f"{day.isoformat()}," if rng.random() < missing else f"{day.isoformat()},{value:.2f}")
+    return "\n".join(lines)
+
+
+def lookup_dates(count, seed=2, start=date(1990, 1, 1), end=MARKET_END):
+    """Random calendar dates (weekends and holidays included) in start..end"""
+    rng = random.Random(seed)
+    span = (end - start).days
+    return [datetime.combine(start + timedelta(days=rng.randrange(span + 1)), datetime.min.time())
+            for _ in range(count)]
+
+
+def change_pairs(count, seed=3):
+    """(current, previous) pairs for calc_change, including zero and missing baselines"""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        previous = rng.choice((None, 0.0)) if rng.random() < 0.02 else rng.uniform(10, 50000)
+        pairs.append((rng.uniform(10, 50000), previous))
+    return pairs
+
+
+def health_records(days, end, seed=4):
+    """Garmin-shaped daily records for the `days` days ending at end"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(days):
+        day = end - timedelta(days=days - 1 - i)
+        records.append({
+            "date": day.isoformat(), "source": "garmin",
+            "sleep": {"duration_seconds": rng.randrange(18000, 32000), "score": rng.randrange(40, 100)},
+            "recovery": {"body_battery_avg": rng.randrange(20, 100), "recovery_percent": rng.randrange(10, 100)},
+            "activity": {"steps": rng.randrange(2000, 20000), "calories": rng.randrange(1800, 3500)},
+            "vo2": None,
+        })
+    return records
+
+
+def workout_messages(count, seed=5):
+    """Chat messages, about two thirds of them workout logs"""
+    rng = random.Random(seed)
+    templates = ("log a {n} min {act}", "logged {n} hour {act}", "{n} minutes {act} this morning",
+                 "did {n} min of {act}", "thanks!", "how did I sleep?")
+    return [rng.choice(templates).format(n=rng.randint(1, 180), act=rng.choice(ACTIVITIES)) for _ in range(count)]
+
+
+def query_messages(count, seed=6):
+    """Read-only health questions (no workout logs, so handle_query doesn't write)"""
+    rng = random.Random(seed)
+    return [rng.choice(QUERIES) for _ in range(count)]
+
+
+def garmin_payloads(seed=7):
+    """(summary, sleep, stress) payloads as the Garmin Connect API returns them"""
+    rng = random.Random(seed)
+    summary = {"steps": rng.randrange(2000, 20000), "distance": rng.randrange(1000, 15000),
+               "calories": rng.randrange(1800, 3500), "activeMinutes": rng.randrange(0, 180)}
+    sleep = {"sleepDurationSeconds": rng.randrange(18000, 32000), "deepSleepDurationSeconds": rng.randrange(3000, 8000),
+             "lightSleepDurationSeconds": rng.randrange(8000, 16000), "remSleepDurationSeconds": rng.randrange(3000, 7000),
+             "awakeDurationSeconds": rng.randrange(0, 3000), "sleepScore": rng.randrange(40, 100)}
+    stress = {"averageStressLevel": rng.randrange(10, 60), "bodyBatteryAverage": rng.randrange(20, 100),
+              "bodyBatteryMaximum": rng.randrange(60, 100), "bodyBatteryMinimum": rng.randrange(5, 40)}
+    return summary, sleep, stress
+
+
+def strava_export(count, seed=8, end=STRAVA_END):
+    """activities_latest.json text: `count` activities over ~count/2 days, newest first"""
+    rng = random.Random(seed)
+    span = max(1, count // 2)
+    activities = []
+    for i in range(count):
+        start = datetime.combine(end - timedelta(days=rng.randrange(span)), datetime.min.time())
+        start += timedelta(seconds=rng.randrange(5 * 3600, 21 * 3600))
+        activity = {"id": i, "type": rng.choice(STRAVA_TYPES), "start_date": start.isoformat() + "Z",
+                    "distance": round(rng.uniform(0, 60000), 1), "moving_time": rng.randrange(900, 10800),
+                    "calories": rng.randrange(0, 1600)}
+        if rng.random() < 0.5:
+            activity["average_heartrate"] = round(rng.uniform(100, 175), 1)
+        activities.append(activity)
+    activities.sort(key=lambda a: a["start_date"], reverse=True)
+    return json.dumps(activities)
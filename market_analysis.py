@@ -1,29 +1,27 @@
 #!/usr/bin/env python3
-import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
+
+from market_render import FORMATS, brief_context, next_weekday, render_brief, write_brief
+from market_rolling import latest_context
+from market_series import read_fred_csv
+from market_store import BRIEF_SERIES, DEFAULT_WATCHLIST
+from stage_profile import get_profiler
 
 def parse_csv(data):
-    """Parse CSV data and return list of (date, value) tuples, skipping missing values"""
-    lines = data.strip().split('\n')
-    reader = csv.reader(lines)
-    header = next(reader)
-    results = []
-    for row in reader:
-        if len(row) == 2 and row[1] and row[1] != '.':
-            try:
-                date = datetime.strptime(row[0], '%Y-%m-%d')
-                value = float(row[1])
-                results.append((date, value))
-            except:
-                pass
-    return results
+    """Parse FRED CSV (text, bytes or file object) into a Series, skipping missing values"""
+    series, report = read_fred_csv(data)
+    return series
 
 def get_value_on_date(data, target_date):
     """Get value on or before target_date"""
-    for date, value in reversed(data):
-        if date <= target_date:
-            return value
-    return None
+    return data.asof_index().value_on(target_date)
+
+def get_values_on_dates(data, target_dates):
+    """Get values on or before each of target_dates in one pass"""
+    return data.asof_index().values_on(target_dates)
 
 def calc_change(current, previous):
     """Calculate change in points and percentage"""
@@ -33,11 +31,117 @@ def calc_change(current, previous):
     pct = (points / previous) * 100
     return points, pct
 
-# Current date
+def change_row(current, baselines):
+    """calc_change of current against each baseline: (points list, percent list)"""
+    if current is None:
+        return [None] * len(baselines), [None] * len(baselines)
+    points = [current - b if b else None for b in baselines]
+    pct = [p / b * 100 if p is not None else None for p, b in zip(points, baselines)]
+    return points, pct
+
+# Change horizons in calendar days
+HORIZONS = {"week": 7, "month": 30, "three_weeks": 21, "quarter": 91}
+
+def brief_result(series_id, as_of, current, anchors, context):
+    """Assemble one series' brief numbers from its horizon anchors and rolling context"""
+    result = {"id": series_id, "as_of": as_of, "current": current}
+    for horizon, value, points, pct in zip(HORIZONS, anchors, *change_row(current, anchors)):
+        result[horizon] = {"value": value, "points": points, "pct": pct}
+    result["context"] = context
+    result["high_30"] = context[30]["high"] if context else None
+    result["low_30"] = context[30]["low"] if context else None
+    result["high_10"] = context[10]["high"] if context else None
+    return result
+
+def analyze_series(series, as_of=None):
+    """Per-series brief job: current value, horizon changes and recent range"""
+    if as_of is None:
+        as_of = series.date_at(-1)
+    anchors = [as_of] + [as_of - timedelta(days=days) for days in HORIZONS.values()]
+    current, *previous = get_values_on_dates(series, anchors)
+    return brief_result(series.name, as_of, current, previous, latest_context(series))
+
+def analyze_stored_series(root, series_id, as_of=None):
+    """analyze_series for a series mapped from the store at root (picklable job)"""
+    from market_store import SeriesStore
+    return analyze_series(SeriesStore(root).open(series_id), as_of)
+
+def update_stored_series(store, series_id):
+    """store.update(series_id), keeping the stored history with a warning if the fetch fails (picklable job)"""
+    try:
+        return store.update(series_id)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not update {series_id}, using stored data: {e}", file=sys.stderr)
+        return 0
+
+def run_brief_jobs(jobs, workers=1, processes=False):
+    """Run zero-argument jobs on a thread or process pool; results keep job order"""
+    if workers <= 1 or len(jobs) <= 1:
+        return [job() for job in jobs]
+    executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        futures = [pool.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+def quarter_start(day):
+    """First day of day's calendar quarter"""
+    return day.replace(month=3 * ((day.month - 1) // 3) + 1, day=1)
+
+# Screening horizons: anchor date as a function of as_of ("1d" is the previous observation)
+CHANGE_HORIZONS = {
+    "1d": None,
+    "1w": lambda d: d - timedelta(days=7),
+    "1m": lambda d: d - timedelta(days=30),
+    "3w": lambda d: d - timedelta(days=21),
+    "QTD": lambda d: quarter_start(d) - timedelta(days=1),
+    "YTD": lambda d: d.replace(month=1, day=1) - timedelta(days=1),
+    "1y": lambda d: d - timedelta(days=365),
+}
+
+def calc_changes(series_list, horizons=tuple(CHANGE_HORIZONS), as_of=None, calendar=None):
+    """Points/percent change matrix: one row per series, one column per horizon
+
+    Each row costs one batched as-of pass over the series, or plain array
+    indexing when a market_calendar.CalendarIndex built over the same series
+    is passed. Cells follow calc_change: None when the baseline is missing or
+    zero, or the series has no value on as_of. as_of defaults to each series'
+    last observation.
+    """
+    specs = [CHANGE_HORIZONS[h] for h in horizons]
+    targets_by_day, offsets_by_day = {}, {}
+    points, pct = [], []
+    for series in series_list:
+        if not len(series):
+            points.append([None] * len(specs))
+            pct.append([None] * len(specs))
+            continue
+        day = as_of or series.date_at(-1)
+        targets = targets_by_day.get(day)
+        if targets is None:
+            # [as_of, as_of, anchor...]; the 1d column is resolved from as_of's row
+            targets = targets_by_day[day] = [day.toordinal()] + [
+                (spec(day) if spec is not None else day).toordinal() for spec in specs]
+        values = series.values
+        if calendar is not None:
+            offsets = offsets_by_day.get(day)
+            if offsets is None:
+                offsets = offsets_by_day[day] = [calendar.offset(t) for t in targets]
+            column = calendar.rows[calendar.column(series.name)]
+            pos, *rows = [-1 if k is None else column[k] for k in offsets]
+        else:
+            pos, *rows = series.asof_index().rows_for(targets)
+        current = values[pos] if pos >= 0 else None
+        baselines = [values[pos - 1] if spec is None and pos > 0 else
+                     None if spec is None or row < 0 else values[row]
+                     for spec, row in zip(specs, rows)]
+        row_points, row_pct = change_row(current, baselines)
+        points.append(row_points)
+        pct.append(row_pct)
+    return {"series": [series.name for series in series_list], "horizons": list(horizons),
+            "points": points, "pct": pct}
+
+# Current date for the embedded sample data
 now = datetime(2026, 2, 20)  # Last trading day with data
-week_ago = now - timedelta(days=7)
-month_ago = now - timedelta(days=30)
-three_weeks_ago = now - timedelta(days=21)
 
 # S&P 500 data
 sp500_raw = """observation_date,SP500
@@ -303,111 +407,88 @@ vix_raw = """observation_date,VIXCLS
 2026-02-18,19.62
 2026-02-19,20.23"""
 
-# Parse data
-sp500 = parse_csv(sp500_raw)
-nasdaq = parse_csv(nasdaq_raw)
-djia = parse_csv(djia_raw)
-vix = parse_csv(vix_raw)
-
-# Get current values (Feb 20, 2026)
-sp500_current = sp500[-1][1]
-nasdaq_current = nasdaq[-1][1]
-djia_current = djia[-1][1]
-vix_current = get_value_on_date(vix, now)
-
-# Get historical values
-sp500_week = get_value_on_date(sp500, week_ago)
-nasdaq_week = get_value_on_date(nasdaq, week_ago)
-djia_week = get_value_on_date(djia, week_ago)
-
-sp500_month = get_value_on_date(sp500, month_ago)
-nasdaq_month = get_value_on_date(nasdaq, month_ago)
-djia_month = get_value_on_date(djia, month_ago)
-
-sp500_3weeks = get_value_on_date(sp500, three_weeks_ago)
-nasdaq_3weeks = get_value_on_date(nasdaq, three_weeks_ago)
-djia_3weeks = get_value_on_date(djia, three_weeks_ago)
-
-# Calculate changes
-sp500_w_pts, sp500_w_pct = calc_change(sp500_current, sp500_week)
-nasdaq_w_pts, nasdaq_w_pct = calc_change(nasdaq_current, nasdaq_week)
-djia_w_pts, djia_w_pct = calc_change(djia_current, djia_week)
-
-sp500_m_pts, sp500_m_pct = calc_change(sp500_current, sp500_month)
-nasdaq_m_pts, nasdaq_m_pct = calc_change(nasdaq_current, nasdaq_month)
-djia_m_pts, djia_m_pct = calc_change(djia_current, djia_month)
-
-# Print report
-print("═══════════════════════════════════════════════════════")
-print("        MORNING MARKET BRIEF - Monday, Feb 23, 2026")
-print("═══════════════════════════════════════════════════════")
-print()
-print("📊 CURRENT CLOSES (as of Feb 20, 2026)")
-print("───────────────────────────────────────────────────────")
-print(f"  S&P 500:    {sp500_current:,.2f}")
-print(f"  Nasdaq:     {nasdaq_current:,.2f}")
-print(f"  Dow Jones:  {djia_current:,.2f}")
-print(f"  VIX:        {vix_current:.2f}")
-print()
-
-print("📈 WEEKLY CHANGE (7 days)")
-print("───────────────────────────────────────────────────────")
-print(f"  S&P 500:    {sp500_w_pts:+.2f} pts ({sp500_w_pct:+.2f}%)")
-print(f"  Nasdaq:     {nasdaq_w_pts:+.2f} pts ({nasdaq_w_pct:+.2f}%)")
-print(f"  Dow Jones:  {djia_w_pts:+.2f} pts ({djia_w_pct:+.2f}%)")
-print()
-
-print("📅 MONTHLY CHANGE (30 days)")
-print("───────────────────────────────────────────────────────")
-print(f"  S&P 500:    {sp500_m_pts:+.2f} pts ({sp500_m_pct:+.2f}%)")
-print(f"  Nasdaq:     {nasdaq_m_pts:+.2f} pts ({nasdaq_m_pct:+.2f}%)")
-print(f"  Dow Jones:  {djia_m_pts:+.2f} pts ({djia_m_pct:+.2f}%)")
-print()
+def load_embedded_series():
+    """Parse the embedded sample CSVs, keyed by FRED ID"""
+    return {s.name: s for s in map(parse_csv, (sp500_raw, nasdaq_raw, djia_raw, vix_raw))}
 
-# 3-week trend analysis
-print("📉 3-WEEK TREND SUMMARY")
-print("───────────────────────────────────────────────────────")
-print(f"From Jan 30 to Feb 20:")
-print(f"  S&P 500:    {sp500_3weeks:.2f} → {sp500_current:.2f} ({(sp500_current-sp500_3weeks)/sp500_3weeks*100:+.2f}%)")
-print(f"  Nasdaq:     {nasdaq_3weeks:.2f} → {nasdaq_current:.2f} ({(nasdaq_current-nasdaq_3weeks)/nasdaq_3weeks*100:+.2f}%)")
-print(f"  Dow Jones:  {djia_3weeks:.2f} → {djia_current:.2f} ({(djia_current-djia_3weeks)/djia_3weeks*100:+.2f}%)")
-print()
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Morning market brief")
+    parser.add_argument("--store", nargs="?", const=True, default=None,
+                        help="read series from the local FRED store (optionally at DIR)")
+    parser.add_argument("--fixtures", help="fetch from a directory of <ID>.csv files instead of FRED")
+    parser.add_argument("--offline", action="store_true", help="use the store as-is, no fetch")
+    parser.add_argument("--watchlist", default="",
+                        help="comma-separated FRED IDs to add to the brief (needs --store, which also lists DGS10)")
+    parser.add_argument("--workers", type=int, default=1, help="worker pool size for per-series jobs")
+    parser.add_argument("--processes", action="store_true", help="use processes instead of threads")
+    parser.add_argument("--from-state", action="store_true",
+                        help="render from the persisted incremental state instead of recomputing (needs --store)")
+    parser.add_argument("--format", choices=FORMATS, default="text", help="brief output format")
+    parser.add_argument("--output", help="write the brief to this file instead of stdout")
+    parser.add_argument("--profile", nargs="?", const="-", default=None, metavar="FILE",
+                        help="record per-stage timings and memory as JSON (stderr, or appended to FILE)")
+    parser.add_argument("--cprofile", metavar="FILE", help="also dump cProfile stats to FILE")
+    return parser.parse_args(argv)
 
-print("🔍 KEY CONTEXT")
-print("───────────────────────────────────────────────────────")
+def main(argv=None):
+    args = parse_args(argv)
+    profiler = get_profiler("market_analysis", args.profile, args.cprofile, env_prefix="MARKET_PROFILE")
+    try:
+        run_brief(args, profiler)
+    finally:
+        profiler.finish(format=args.format, store=bool(args.store), workers=args.workers,
+                        processes=args.processes)
 
-# Calculate key levels and observations
-sp500_high = max([v for d, v in sp500[-30:]])
-sp500_low = min([v for d, v in sp500[-30:]])
-vix_recent_high = max([v for d, v in vix[-10:]])
+def run_brief(args, profiler):
+    watchlist = [s for s in args.watchlist.split(",") if s]
+    run = partial(run_brief_jobs, workers=args.workers, processes=args.processes)
+    # Process pools pickle the jobs, so per-job counting only wraps them on threads
+    count = (lambda name, jobs: jobs) if args.processes else (
+        lambda name, jobs: [profiler.calls(name, job) for job in jobs])
 
-print(f"• S&P 500 trading near {sp500_current:,.2f}")
-print(f"  - 30-day range: {sp500_low:,.2f} - {sp500_high:,.2f}")
-print(f"  - Distance from 30-day high: {((sp500_current-sp500_high)/sp500_high*100):.2f}%")
-print()
-print(f"• VIX at {vix_current:.2f} (recent peak: {vix_recent_high:.2f})")
-if vix_current > 20:
-    print("  - Elevated volatility persists")
-elif vix_current > 17:
-    print("  - Moderately elevated volatility")
-else:
-    print("  - Volatility normalizing")
-print()
+    # Build one job per series
+    if args.store:
+        from market_store import STORE_DIR, DirectoryFetcher, SeriesStore, fred_fetcher
+        store = SeriesStore(STORE_DIR if args.store is True else args.store,
+                            fetch=DirectoryFetcher(args.fixtures) if args.fixtures else fred_fetcher)
+        watchlist = [s for s in dict.fromkeys(DEFAULT_WATCHLIST + tuple(watchlist)) if s not in BRIEF_SERIES]
+        series_ids = list(BRIEF_SERIES) + watchlist
+        if not args.offline:
+            with profiler.stage("fetch"):
+                run(count("update", [partial(update_stored_series, store, series_id) for series_id in series_ids]))
+        with profiler.stage("load"):
+            missing = [series_id for series_id in BRIEF_SERIES if store.last_ordinal(series_id) is None]
+            if missing:
+                hint = "; run without --offline to fetch it" if args.offline else ""
+                raise SystemExit(f"No {', '.join(missing)} history in {store.root}{hint}")
+            as_of = store.open("SP500").date_at(-1)
+        if args.from_state:
+            from market_state import snapshot_stored_series
+            jobs = [partial(snapshot_stored_series, store.root, series_id, as_of) for series_id in series_ids]
+        else:
+            jobs = [partial(analyze_stored_series, store.root, series_id, as_of) for series_id in series_ids]
+    else:
+        if watchlist or args.from_state:
+            raise SystemExit("--watchlist and --from-state need --store")
+        with profiler.stage("load"):
+            series = load_embedded_series()
+        as_of = now
+        jobs = [partial(analyze_series, series[series_id], as_of) for series_id in BRIEF_SERIES]
 
-# Market direction
-if sp500_w_pct > 0 and nasdaq_w_pct > 0 and djia_w_pct > 0:
-    print("• Broad market strength across all indices")
-elif sp500_w_pct < 0 and nasdaq_w_pct < 0 and djia_w_pct < 0:
-    print("• Weakness across all major indices")
-else:
-    print("• Mixed performance across indices")
+    # Run jobs, then render the brief from their results in one write
+    with profiler.stage("analyze"):
+        results = run(count("analyze", jobs))
+    with profiler.stage("context"):
+        ctx = brief_context(results[:len(BRIEF_SERIES)], as_of, results[len(BRIEF_SERIES):], HORIZONS["three_weeks"])
+    with profiler.stage("render"):
+        text = render_brief(ctx, args.format)
+    with profiler.stage("write"):
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                write_brief(text, f)
+        else:
+            write_brief(text)
 
-if sp500_m_pct < -2:
-    print("• S&P 500 down significantly over 30 days")
-elif sp500_m_pct > 2:
-    print("• S&P 500 showing strong monthly gains")
-else:
-    print("• S&P 500 consolidating in recent range")
-    
-print()
-print("═══════════════════════════════════════════════════════")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared trading-calendar alignment index for several market series.
+
+CalendarIndex maps every calendar day between the earliest and latest
+observation of a set of series to the as-of row of each series: the last
+observation on or before that day, or -1 before the series starts. The map
+is built once per series in a single walk, so holiday gaps (the blank
+2025-12-25 rows), weekends and different start dates are resolved up front
+and cross-series lookups and horizon anchors become plain array indexing.
+
+The trading calendar itself is the union of observation days across the
+series; ``is_observed`` tells a real observation from a carried-forward one.
+
+This is a library index for cross-series work over many dates, such as
+``market_analysis.calc_changes(calendar=...)``. The morning brief does not use
+it. The brief needs five anchors per series, and bisecting each series costs
+microseconds, while building the day map walks every row of every series:
+about 25 ms for seven 9,000-row series, against 16 us of bisects.
+"""
+
+from array import array
+from datetime import datetime
+
+
+class CalendarIndex:
+    """Calendar day -> as-of row position for each series"""
+
+    def __init__(self, series_list):
+        self.series = list(series_list)
+        self.names = [s.name for s in self.series]
+        self._column = {name: i for i, name in enumerate(self.names)}
+        firsts = [s.ordinals[0] for s in self.series if len(s)]
+        lasts = [s.ordinals[-1] for s in self.series if len(s)]
+        self.start = min(firsts) if firsts else 0
+        self.end = max(lasts) if lasts else -1
+        span = self.end - self.start + 1
+        self.rows = [self._build(s, span) for s in self.series]
+        observed = bytearray(max(span, 0))
+        for s in self.series:
+            for o in s.ordinals:
+                observed[o - self.start] = 1
+        self.trading_days = array("i", (self.start + k for k, flag in enumerate(observed) if flag))
+
+    def _build(self, series, span):
+        rows = array("i", [-1]) * max(span, 0)
+        ordinals, start = series.ordinals, self.start
+        n = len(ordinals)
+        for i in range(n):
+            a = ordinals[i] - start
+            b = ordinals[i + 1] - start if i + 1 < n else span
+            rows[a:b] = array("i", [i]) * (b - a)
+        return rows
+
+    def offset(self, day):
+        """Position of a date/ordinal in the day map (clamped to its end), None before it"""
+        o = day if isinstance(day, int) else day.toordinal()
+        if o < self.start:
+            return None
+        return min(o, self.end) - self.start
+
+    def column(self, name):
+        return self._column[name]
+
+    def row(self, name, day):
+        """As-of row of series name on day, or -1"""
+        k = self.offset(day)
+        return -1 if k is None else self.rows[self._column[name]][k]
+
+    def rows_on(self, day):
+        """As-of rows of every series on day"""
+        k = self.offset(day)
+        if k is None:
+            return [-1] * len(self.rows)
+        return [rows[k] for rows in self.rows]
+
+    def values_on(self, day):
+        """As-of value of every series on day (None before a series starts)"""
+        return [s.values[r] if r >= 0 else None for s, r in zip(self.series, self.rows_on(day))]
+
+    def is_observed(self, name, day):
+        """True if series name has its own observation on day (not carried forward)"""
+        o = day if isinstance(day, int) else day.toordinal()
+        r = self.row(name, o)
+        return r >= 0 and self.series[self._column[name]].ordinals[r] == o
+
+    def last_trading_day(self):
+        return datetime.fromordinal(self.trading_days[-1]) if len(self.trading_days) else None
+
+    def aligned(self, names=None, days=None):
+        """Rows of as-of values per trading day: [(date, [v1, v2, ...]), ...]"""
+        columns = [self._column[n] for n in names] if names else range(len(self.series))
+        out = []
+        for o in (self.trading_days if days is None else [d.toordinal() for d in days]):
+            k = self.offset(o)
+            values = [None if k is None or self.rows[c][k] < 0 else self.series[c].values[self.rows[c][k]]
+                      for c in columns]
+            out.append((datetime.fromordinal(o), values))
+        return out
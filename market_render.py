@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Render stage for the morning market brief.
+
+``brief_context`` turns the per-series results from ``analyze_series`` (or
+persisted state snapshots) into one plain structure holding every number and
+observation the brief shows. The renderers only format that structure, so
+the same analytics can go to the terminal, Telegram, the mission-control
+dashboard or a file without being recomputed.
+
+The text and Markdown renderers are plain functions that build one list of
+f-strings over the context and join it; ``write_brief`` emits the result in
+a single write. JSON output is the context itself.
+"""
+
+import json
+import sys
+from datetime import date, timedelta
+
+RULE = "═══════════════════════════════════════════════════════"
+SECTION = "───────────────────────────────────────────────────────"
+FORMATS = ("text", "markdown", "json")
+
+INDEX_LABELS = (("SP500", "S&P 500"), ("NASDAQCOM", "Nasdaq"), ("DJIA", "Dow Jones"))
+
+
+def _pct_or_na(value):
+    return "n/a" if value is None else f"{value:+.2f}%"
+
+
+def render_text(ctx):
+    """The terminal brief for a brief_context"""
+    indices, sp500, vix, notes = ctx["indices"], ctx["sp500"], ctx["vix"], ctx["notes"]
+    out = [f"{RULE}\n        MORNING MARKET BRIEF - {ctx['date']:%A, %b %d, %Y}\n{RULE}\n\n"
+           f"📊 CURRENT CLOSES (as of {ctx['as_of']:%b %d, %Y})\n{SECTION}\n"]
+    out += [f"  {r['label'] + ':':<12}{r['current']:,.2f}\n" for r in indices]
+    out.append(f"  VIX:        {vix['current']:.2f}\n\n📈 WEEKLY CHANGE (7 days)\n{SECTION}\n")
+    out += [f"  {r['label'] + ':':<12}{r['week']['points']:+.2f} pts ({r['week']['pct']:+.2f}%)\n" for r in indices]
+    out.append(f"\n📅 MONTHLY CHANGE (30 days)\n{SECTION}\n")
+    out += [f"  {r['label'] + ':':<12}{r['month']['points']:+.2f} pts ({r['month']['pct']:+.2f}%)\n" for r in indices]
+    out.append(f"\n📉 3-WEEK TREND SUMMARY\n{SECTION}\n"
+               f"From {ctx['three_weeks_from']:%b %d} to {ctx['as_of']:%b %d}:\n")
+    out += [f"  {r['label'] + ':':<12}{r['three_weeks']['value']:.2f} → {r['current']:.2f} "
+            f"({r['three_weeks']['pct']:+.2f}%)\n" for r in indices]
+    out.append(f"\n🔍 KEY CONTEXT\n{SECTION}\n"
+               f"• S&P 500 trading near {sp500['current']:,.2f}\n"
+               f"  - 30-day range: {sp500['low_30']:,.2f} - {sp500['high_30']:,.2f}\n"
+               f"  - Distance from 30-day high: {sp500['from_high_pct']:.2f}%\n"
+               f"  - Drawdown from peak: {sp500['drawdown']:.2f}%\n"
+               f"  - 30-day realized volatility: {sp500['vol_30']:.1f}%\n\n"
+               f"• VIX at {vix['current']:.2f} (recent peak: {vix['high_10']:.2f})\n"
+               f"  - {notes['vix']}\n\n"
+               f"• {notes['direction']}\n"
+               f"• {notes['sp500_month']}\n")
+    if ctx["watchlist"]:
+        out.append(f"\n👀 WATCHLIST\n{SECTION}\n")
+        out += [f"  {r['id']:<12}no data\n" if r["current"] is None else
+                f"  {r['id']:<12}{r['current']:>12,.2f}   1w {_pct_or_na(r['week_pct']):>8}"
+                f"   1m {_pct_or_na(r['month_pct']):>8}\n" for r in ctx["watchlist"]]
+    out.append(f"\n{RULE}\n")
+    return "".join(out)
+
+
+def render_markdown(ctx):
+    """The brief as Markdown (tables for closes and the watchlist) for a brief_context"""
+    indices, sp500, vix, notes = ctx["indices"], ctx["sp500"], ctx["vix"], ctx["notes"]
+    out = [f"# Morning Market Brief — {ctx['date']:%A, %b %d, %Y}\n\n"
+           f"## 📊 Closes (as of {ctx['as_of']:%b %d, %Y})\n\n"
+           "| Index | Close | 1w pts | 1w % | 30d pts | 30d % | 3w trend |\n"
+           "|---|---:|---:|---:|---:|---:|---:|\n"]
+    out += [f"| {r['label']} | {r['current']:,.2f} | {r['week']['points']:+.2f} | {r['week']['pct']:+.2f}% | "
+            f"{r['month']['points']:+.2f} | {r['month']['pct']:+.2f}% | {r['three_weeks']['pct']:+.2f}% |\n"
+            for r in indices]
+    out.append(f"| VIX | {vix['current']:.2f} | | | | | |\n\n"
+               f"_3-week trend: {ctx['three_weeks_from']:%b %d} to {ctx['as_of']:%b %d}_\n\n"
+               "## 🔍 Key context\n\n"
+               f"- **S&P 500** trading near {sp500['current']:,.2f}\n"
+               f"  - 30-day range: {sp500['low_30']:,.2f} – {sp500['high_30']:,.2f}\n"
+               f"  - Distance from 30-day high: {sp500['from_high_pct']:.2f}%\n"
+               f"  - Drawdown from peak: {sp500['drawdown']:.2f}%\n"
+               f"  - 30-day realized volatility: {sp500['vol_30']:.1f}%\n"
+               f"- **VIX** at {vix['current']:.2f} (recent peak: {vix['high_10']:.2f}) — {notes['vix']}\n"
+               f"- {notes['direction']}\n"
+               f"- {notes['sp500_month']}\n")
+    if ctx["watchlist"]:
+        out.append("\n## 👀 Watchlist\n\n| Series | Close | 1w | 1m |\n|---|---:|---:|---:|\n")
+        out += [f"| {r['id']} | no data | | |\n" if r["current"] is None else
+                f"| {r['id']} | {r['current']:,.2f} | {_pct_or_na(r['week_pct'])} | {_pct_or_na(r['month_pct'])} |\n"
+                for r in ctx["watchlist"]]
+    return "".join(out)
+
+
+RENDERERS = {"text": render_text, "markdown": render_markdown}
+
+
+def next_weekday(day):
+    """First weekday after day"""
+    day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+
+def _vix_note(vix_current):
+    if vix_current > 20:
+        return "Elevated volatility persists"
+    if vix_current > 17:
+        return "Moderately elevated volatility"
+    return "Volatility normalizing"
+
+
+def _direction_note(weekly):
+    if all(pct > 0 for pct in weekly):
+        return "Broad market strength across all indices"
+    if all(pct < 0 for pct in weekly):
+        return "Weakness across all major indices"
+    return "Mixed performance across indices"
+
+
+def _month_note(pct):
+    if pct < -2:
+        return "S&P 500 down significantly over 30 days"
+    if pct > 2:
+        return "S&P 500 showing strong monthly gains"
+    return "S&P 500 consolidating in recent range"
+
+
+def brief_context(results, as_of, watchlist=(), three_weeks=21):
+    """Everything the brief shows, computed once from per-series results
+
+    results: analyze_series results for SP500, NASDAQCOM, DJIA and VIXCLS, in
+    that order; watchlist: results for extra series. three_weeks is the
+    3-week horizon in calendar days.
+    """
+    sp500, nasdaq, djia, vix = results
+    indices = []
+    for (series_id, label), r in zip(INDEX_LABELS, (sp500, nasdaq, djia)):
+        indices.append({"id": series_id, "label": label, "current": r["current"],
+                        "week": r["week"], "month": r["month"], "three_weeks": r["three_weeks"]})
+    current, high = sp500["current"], sp500["high_30"]
+    return {
+        "date": next_weekday(as_of),
+        "as_of": as_of,
+        "three_weeks_from": as_of - timedelta(days=three_weeks),
+        "indices": indices,
+        "vix": {"current": vix["current"], "high_10": vix["high_10"]},
+        "sp500": {"current": current, "low_30": sp500["low_30"], "high_30": high,
+                  "from_high_pct": (current - high) / high * 100,
+                  "drawdown": sp500["context"]["drawdown"], "vol_30": sp500["context"][30]["vol"]},
+        "notes": {"vix": _vix_note(vix["current"]),
+                  "direction": _direction_note([r["week"]["pct"] for r in indices]),
+                  "sp500_month": _month_note(sp500["month"]["pct"])},
+        "watchlist": [{"id": r["id"], "current": r["current"],
+                       "week_pct": r["week"]["pct"] if r["current"] is not None else None,
+                       "month_pct": r["month"]["pct"] if r["current"] is not None else None}
+                      for r in watchlist],
+    }
+
+
+def _json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def render_brief(ctx, fmt="text"):
+    """The brief for a brief_context as one string in fmt (text, markdown or json)"""
+    if fmt == "json":
+        return json.dumps(ctx, default=_json_default, ensure_ascii=False, indent=2) + "\n"
+    render = RENDERERS.get(fmt)
+    if render is None:
+        raise ValueError(f"Unknown brief format {fmt!r}; expected one of {FORMATS}")
+    return render(ctx)
+
+
+def write_brief(text, out=None):
+    """Emit a rendered brief with a single write (stdout by default)"""
+    out = sys.stdout if out is None else out
+    out.write(text)
+    out.flush()
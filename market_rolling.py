@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Rolling-window analytics for the KEY CONTEXT section.
+
+Every statistic is computed for several window sizes in O(n) per window:
+highs and lows with monotonic deques (all windows in one pass over the
+data), means and standard deviations from one set of prefix sums, realized
+volatility from prefix sums of log returns, and drawdown from a running peak.
+
+Windows count observations, not calendar days, and are partial at the start
+of the series (the first 29 rows of a 30-row window use what is available),
+which matches ``max(values[-30:])`` on short histories. Statistics that need
+two points (std, volatility) are NaN until they have them.
+"""
+
+import math
+from array import array
+from collections import deque
+
+WINDOWS = (10, 30, 90, 252)
+TRADING_DAYS = 252
+NAN = float("nan")
+
+
+def _empty(n):
+    return array("d", bytes(8 * n))
+
+
+def rolling_extremes(values, windows=WINDOWS):
+    """Rolling highs and lows for every window in a single pass
+
+    Returns ``({window: highs}, {window: lows})`` of float arrays.
+    """
+    n = len(values)
+    highs = {w: _empty(n) for w in windows}
+    lows = {w: _empty(n) for w in windows}
+    hi_q = {w: deque() for w in windows}
+    lo_q = {w: deque() for w in windows}
+    for i, v in enumerate(values):
+        for w in windows:
+            q = hi_q[w]
+            while q and values[q[-1]] <= v:
+                q.pop()
+            q.append(i)
+            if q[0] <= i - w:
+                q.popleft()
+            highs[w][i] = values[q[0]]
+
+            q = lo_q[w]
+            while q and values[q[-1]] >= v:
+                q.pop()
+            q.append(i)
+            if q[0] <= i - w:
+                q.popleft()
+            lows[w][i] = values[q[0]]
+    return highs, lows
+
+
+def _prefix_sums(values):
+    """Prefix sums of x and x**2, shifted by the first value for stability"""
+    shift = values[0] if len(values) else 0.0
+    s1, s2 = array("d", [0.0]), array("d", [0.0])
+    a = b = 0.0
+    for v in values:
+        d = v - shift
+        a += d
+        b += d * d
+        s1.append(a)
+        s2.append(b)
+    return shift, s1, s2
+
+
+def _window_moments(prefix, windows, ddof):
+    """Rolling means and standard deviations for each window from prefix sums"""
+    shift, s1, s2 = prefix
+    n = len(s1) - 1
+    means, stds = {}, {}
+    for w in windows:
+        mean, std = _empty(n), _empty(n)
+        for i in range(n):
+            lo = i + 1 - w if i + 1 > w else 0
+            count = i + 1 - lo
+            total = s1[i + 1] - s1[lo]
+            mean[i] = shift + total / count
+            if count > ddof:
+                var = (s2[i + 1] - s2[lo] - total * total / count) / (count - ddof)
+                std[i] = math.sqrt(var) if var > 0 else 0.0
+            else:
+                std[i] = NAN
+        means[w], stds[w] = mean, std
+    return means, stds
+
+
+def rolling_moments(values, windows=WINDOWS):
+    """Rolling means and population standard deviations: ``({w: mean}, {w: std})``"""
+    return _window_moments(_prefix_sums(values), windows, ddof=0)
+
+
+def log_returns(values):
+    """Daily log returns, one shorter than values
+
+    Undefined returns (a non-positive value, e.g. in a rate spread) count as
+    zero so they do not poison the prefix sums of later windows.
+    """
+    return array("d", (math.log(b / a) if a > 0 and b > 0 else 0.0 for a, b in zip(values, values[1:])))
+
+
+def realized_volatility(values, windows=WINDOWS, periods=TRADING_DAYS):
+    """Annualized realized volatility (%) of log returns, aligned with values
+
+    Row 0 has no return and is NaN.
+    """
+    returns = log_returns(values)
+    _, stds = _window_moments(_prefix_sums(returns), windows, ddof=1)
+    scale = math.sqrt(periods) * 100
+    head = array("d", [NAN] if len(values) else [])
+    return {w: head + array("d", (s * scale for s in std)) for w, std in stds.items()}
+
+
+def drawdown(values):
+    """Percent below the running peak at each row (0 at a new high)"""
+    out = _empty(len(values))
+    peak = -math.inf
+    for i, v in enumerate(values):
+        if v > peak:
+            peak = v
+        out[i] = (v / peak - 1) * 100 if peak > 0 else NAN
+    return out
+
+
+def rolling_stats(values, windows=WINDOWS):
+    """All rolling statistics for values, keyed by window
+
+    Returns ``{"drawdown": array, w: {"high", "low", "mean", "std", "vol"}}``.
+    """
+    highs, lows = rolling_extremes(values, windows)
+    means, stds = rolling_moments(values, windows)
+    vols = realized_volatility(values, windows)
+    stats = {"drawdown": drawdown(values)}
+    for w in windows:
+        stats[w] = {"high": highs[w], "low": lows[w], "mean": means[w], "std": stds[w], "vol": vols[w]}
+    return stats
+
+
+def latest_context(series, windows=WINDOWS):
+    """Rolling statistics as of the last observation only
+
+    Runs the window algorithms over the tail the largest window needs rather
+    than the whole history; drawdown uses the all-history peak, taken from
+    series.peak when the series file header carries it.
+    """
+    values = series.values
+    if not len(values):
+        return None
+    tail = values[-(max(windows) + 1):]
+    full = rolling_stats(tail, windows)
+    peak = series.peak if series.peak is not None else max(values)
+    context = {"drawdown": (values[-1] / peak - 1) * 100 if peak > 0 else NAN}
+    for w in windows:
+        context[w] = {name: column[-1] for name, column in full[w].items()}
+    return context
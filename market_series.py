@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Columnar time series for the market brief.
+
+A Series keeps observation dates as day ordinals (``date.toordinal()``) in an
+int32 ``array`` and the observed values in a float64 ``array``. It still
+behaves like the old list of ``(datetime, value)`` tuples when indexed or
+iterated, so existing callers keep working while hot paths read the columns
+directly.
+"""
+
+import codecs
+import io
+from array import array
+from bisect import bisect_right
+from calendar import monthrange
+from datetime import date, datetime
+
+ORDINAL_TYPECODE = "i"
+VALUE_TYPECODE = "d"
+CHUNK_SIZE = 1 << 16
+MISSING_VALUES = ("", ".")
+
+
+class Series:
+    """Array-backed (date ordinal, float64 value) series, sorted by date
+
+    Columns may also be read-only memoryviews, e.g. over a mapped series file.
+    peak is max(values) when known without a scan (a series file header), else None.
+    """
+
+    __slots__ = ("name", "ordinals", "values", "peak", "_asof")
+
+    def __init__(self, ordinals=(), values=(), name=None, peak=None):
+        self.name = name
+        self.peak = peak
+        self._asof = None
+        self.ordinals = ordinals if isinstance(ordinals, (array, memoryview)) else array(ORDINAL_TYPECODE, ordinals)
+        self.values = values if isinstance(values, (array, memoryview)) else array(VALUE_TYPECODE, values)
+        if len(self.ordinals) != len(self.values):
+            raise ValueError("ordinals and values must have the same length")
+
+    @classmethod
+    def from_pairs(cls, pairs, name=None):
+        """Build a series from (date, value) tuples"""
+        series = cls(name=name)
+        for when, value in pairs:
+            series.append(when, value)
+        return series
+
+    def append(self, when, value):
+        """Append one observation; ``when`` is a date, datetime or ordinal"""
+        self.ordinals.append(when if isinstance(when, int) else when.toordinal())
+        self.values.append(value)
+        if self.peak is not None and value > self.peak:
+            self.peak = value
+        self._asof = None
+
+    def asof_index(self):
+        """As-of lookup index for this series, built on first use"""
+        if self._asof is None:
+            self._asof = AsOfIndex(self)
+        return self._asof
+
+    def date_at(self, i):
+        """Observation date at row ``i`` as a midnight datetime"""
+        return datetime.fromordinal(self.ordinals[i])
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return Series(self.ordinals[key], self.values[key], self.name)
+        return datetime.fromordinal(self.ordinals[key]), self.values[key]
+
+    def __iter__(self):
+        fromordinal = datetime.fromordinal
+        for o, v in zip(self.ordinals, self.values):
+            yield fromordinal(o), v
+
+    def __repr__(self):
+        return f"Series({self.name!r}, n={len(self)})"
+
+
+class AsOfIndex:
+    """Answers "value on or before date D" for one series in O(log n)
+
+    Dates compare by calendar day, matching the old ``date <= target_date``
+    check against midnight observation timestamps. The ordinal column is
+    searched in place, array or memory map alike, so building the index
+    copies nothing and a mapped series only reads the probed pages.
+    """
+
+    __slots__ = ("series", "_ordinals")
+
+    def __init__(self, series):
+        self.series = series
+        self._ordinals = series.ordinals
+
+    def position(self, target_date):
+        """Row of the last observation on or before target_date, or -1"""
+        return bisect_right(self._ordinals, target_date.toordinal()) - 1
+
+    def value_on(self, target_date):
+        """Value on or before target_date, None if it precedes the series"""
+        i = self.position(target_date)
+        return self.series.values[i] if i >= 0 else None
+
+    def rows_for(self, target_ordinals):
+        """Row positions (-1 if none) for day ordinals, in one ordered pass"""
+        ordinals = self._ordinals
+        rows = [-1] * len(target_ordinals)
+        lo = 0
+        for k in sorted(range(len(target_ordinals)), key=target_ordinals.__getitem__):
+            lo = bisect_right(ordinals, target_ordinals[k], lo)
+            rows[k] = lo - 1
+        return rows
+
+    def values_on(self, target_dates):
+        """Batched value_on: one ordered pass over a vector of target dates
+
+        Results come back in the order of ``target_dates``.
+        """
+        values = self.series.values
+        rows = self.rows_for([d.toordinal() for d in target_dates])
+        return [values[i] if i >= 0 else None for i in rows]
+
+
+def _month_base(key, cache):
+    """(ordinal of day 0, days in month) for a 'YYYY-MM' prefix, memoized"""
+    base = cache.get(key)
+    if base is None:
+        year, month = int(key[:4]), int(key[5:7])
+        base = (date(year, month, 1).toordinal() - 1, monthrange(year, month)[1])
+        cache[key] = base
+    return base
+
+
+def parse_iso_ordinal(text, cache):
+    """Day ordinal for a fixed-width 'YYYY-MM-DD' string, None if malformed"""
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        return None
+    try:
+        base, days = _month_base(text[:7], cache)
+        day = int(text[8:])
+    except ValueError:
+        return None
+    if not 1 <= day <= days:
+        return None
+    return base + day
+
+
+def _iter_lines(source, chunk_size):
+    """Yield text lines from a file object, reading chunk_size at a time"""
+    tail = ""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def read_fred_csv(source, chunk_size=CHUNK_SIZE):
+    """Stream a FRED two-column CSV into a Series
+
+    ``source`` is a text or binary file object, or a str/bytes buffer. Dates
+    go through a fixed-width ISO parser instead of strptime; ``.`` and empty
+    values count as missing. Returns ``(series, report)`` where report counts
+    ``rows`` read, ``missing`` values and ``malformed`` rows.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    series = Series()
+    ordinals, values = series.ordinals, series.values
+    report = {"rows": 0, "missing": 0, "malformed": 0}
+    months = {}
+
+    for line in _iter_lines(source, chunk_size):
+        line = line.strip()
+        if not line:
+            continue
+        if not line[0].isdigit():
+            if report["rows"] == 0 and series.name is None:
+                header = line.split(",")
+                series.name = header[1] if len(header) > 1 else None
+            else:
+                report["rows"] += 1
+                report["malformed"] += 1
+            continue
+        report["rows"] += 1
+        comma = line.find(",")
+        if comma < 0 or line.find(",", comma + 1) >= 0:
+            report["malformed"] += 1
+            continue
+        ordinal = parse_iso_ordinal(line[:comma], months)
+        if ordinal is None:
+            report["malformed"] += 1
+            continue
+        raw = line[comma + 1:].strip()
+        if raw in MISSING_VALUES:
+            report["missing"] += 1
+            continue
+        try:
+            value = float(raw)
+        except ValueError:
+            report["malformed"] += 1
+            continue
+        ordinals.append(ordinal)
+        values.append(value)
+
+    return series, report
+
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Fixed-layout binary file format for one market series.
+
+Layout (header little-endian, columns in native byte order)::
+
+    0   4s  magic b"FSER"
+    4   H   format version
+    6   H   reserved
+    8   I   row count
+    12  I   row capacity (even, so the value column stays 8-byte aligned)
+    16  d   peak: largest value in the first count rows (-inf when empty)
+    24  8x  padding to HEADER_SIZE
+    32  int32[capacity]    day ordinals
+    ..  float64[capacity]  values
+
+Rows past the count are reserved space, so appends write in place and then
+bump the count and peak in the header with one write; the count is the
+commit point. When capacity runs out the file is rewritten with double the
+room and swapped in with an atomic rename.
+
+``open_series_file`` maps the file with ``mmap`` and returns a Series whose
+columns are memoryviews over the mapping, so lookups touch only the pages
+they read instead of materialising the whole history. The header peak is
+passed on as ``Series.peak``, so the brief's drawdown doesn't scan every
+value for the all-time high.
+"""
+
+import math
+import mmap
+import os
+import struct
+from array import array
+
+from market_series import ORDINAL_TYPECODE, VALUE_TYPECODE, Series
+
+MAGIC = b"FSER"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIId")
+HEADER_SIZE = 32
+COUNT_OFFSET = 8
+# count, capacity and peak, rewritten together after an append
+COMMIT = struct.Struct("<IId")
+ORDINAL_SIZE = array(ORDINAL_TYPECODE).itemsize
+VALUE_SIZE = array(VALUE_TYPECODE).itemsize
+MIN_CAPACITY = 256
+
+
+def _values_offset(capacity):
+    return HEADER_SIZE + capacity * ORDINAL_SIZE
+
+
+def _capacity_for(rows):
+    capacity = MIN_CAPACITY
+    while capacity < rows:
+        capacity *= 2
+    return capacity
+
+
+def read_header(f):
+    """(count, capacity, peak) from an open series file"""
+    f.seek(0)
+    magic, version, _, count, capacity, peak = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a v{VERSION} series file: {getattr(f, 'name', f)}")
+    return count, capacity, peak
+
+
+def write_series_file(path, series, capacity=None):
+    """Write a whole series to path atomically, with room to grow"""
+    rows = len(series)
+    capacity = capacity or _capacity_for(rows)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        peak = max(series.values, default=-math.inf)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, rows, capacity, peak).ljust(HEADER_SIZE, b"\0"))
+        array(ORDINAL_TYPECODE, series.ordinals).tofile(f)
+        f.seek(_values_offset(capacity))
+        array(VALUE_TYPECODE, series.values).tofile(f)
+        f.truncate(_values_offset(capacity) + capacity * VALUE_SIZE)
+    os.replace(tmp, path)
+
+
+def append_series_file(path, ordinals, values):
+    """Append rows to an existing series file, growing it if needed"""
+    added = len(ordinals)
+    if not added:
+        return
+    with open(path, "r+b") as f:
+        count, capacity, peak = read_header(f)
+        if count + added <= capacity:
+            f.seek(HEADER_SIZE + count * ORDINAL_SIZE)
+            array(ORDINAL_TYPECODE, ordinals).tofile(f)
+            f.seek(_values_offset(capacity) + count * VALUE_SIZE)
+            array(VALUE_TYPECODE, values).tofile(f)
+            f.flush()
+            f.seek(COUNT_OFFSET)
+            f.write(COMMIT.pack(count + added, capacity, max(peak, max(values))))
+            return
+    existing = load_series_file(path)
+    existing.ordinals.extend(array(ORDINAL_TYPECODE, ordinals))
+    existing.values.extend(array(VALUE_TYPECODE, values))
+    write_series_file(path, existing, _capacity_for(2 * (count + added)))
+
+
+def last_ordinal(path):
+    """Newest stored day ordinal, or None for an empty file"""
+    with open(path, "rb") as f:
+        count, _, _ = read_header(f)
+        if not count:
+            return None
+        f.seek(HEADER_SIZE + (count - 1) * ORDINAL_SIZE)
+        last = array(ORDINAL_TYPECODE)
+        last.fromfile(f, 1)
+        return last[0]
+
+
+def load_series_file(path, name=None):
+    """Read a series file into in-memory arrays"""
+    ordinals, values = array(ORDINAL_TYPECODE), array(VALUE_TYPECODE)
+    with open(path, "rb") as f:
+        count, capacity, peak = read_header(f)
+        f.seek(HEADER_SIZE)
+        ordinals.fromfile(f, count)
+        f.seek(_values_offset(capacity))
+        values.fromfile(f, count)
+    return Series(ordinals, values, name, peak=peak if count else None)
+
+
+def open_series_file(path, name=None):
+    """Map a series file read-only; columns are memoryviews over the mapping"""
+    with open(path, "rb") as f:
+        count, capacity, peak = read_header(f)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    ordinals = view[HEADER_SIZE:HEADER_SIZE + count * ORDINAL_SIZE].cast(ORDINAL_TYPECODE)
+    start = _values_offset(capacity)
+    values = view[start:start + count * VALUE_SIZE].cast(VALUE_TYPECODE)
+    return Series(ordinals, values, name, peak=peak if count else None)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental brief state for one market series.
+
+A SeriesState holds everything the brief needs about a series as of its last
+observation: the latest value, a pointer per change horizon (week, month,
+3-week, quarter) into a short buffer of recent observations, monotonic
+deques for rolling highs/lows, running sums for rolling means, standard
+deviations and realized volatility, and the all-time peak. Appending one
+observation updates all of it in amortized O(1) without touching the rest of
+the history, and ``snapshot()`` returns the same result dict as a full
+``analyze_series`` recompute.
+
+States are persisted as JSON next to the series files in the FRED store
+(``<ID>.state.json``) and caught up from the store with ``sync_state``. The
+state assumes history is append-only; if stored rows are ever revised,
+delete the state file and it is rebuilt on the next sync.
+"""
+
+import json
+import math
+import os
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+
+from market_analysis import HORIZONS, analyze_stored_series, brief_result
+from market_rolling import NAN, TRADING_DAYS, WINDOWS
+from market_store import SeriesStore
+
+STATE_VERSION = 1
+RESYNC_EVERY = 1024
+COMPACT_AT = 64
+
+
+class SeriesState:
+    """Append-only analytics state for one series"""
+
+    def __init__(self, series_id, windows=WINDOWS, horizons=HORIZONS):
+        self.series_id = series_id
+        self.windows = tuple(windows)
+        self.horizons = dict(horizons)
+        size = max(self.windows)
+        self.count = 0
+        self.last_ordinal = None
+        self.current = None
+        self.peak = -math.inf
+        # Observations back to the oldest live horizon anchor, and the anchors
+        self.recent = []
+        self.anchor_pos = {h: -1 for h in self.horizons}
+        # Rolling-window accumulators
+        self.tail = deque(maxlen=size + 1)
+        self.returns = deque(maxlen=size)
+        self.highs = {w: deque() for w in self.windows}
+        self.lows = {w: deque() for w in self.windows}
+        self.shift = None
+        self.sums = {w: [0.0, 0.0] for w in self.windows}
+        self.rsums = {w: [0.0, 0.0] for w in self.windows}
+        self.since_resync = 0
+
+    def append(self, ordinal, value):
+        """Add the next observation (day ordinal, value) in date order"""
+        if self.last_ordinal is not None and ordinal <= self.last_ordinal:
+            raise ValueError(f"{self.series_id}: observation {ordinal} is not after {self.last_ordinal}")
+        seq = self.count
+        tail, returns = self.tail, self.returns
+
+        # Running sums of shifted values and of log returns
+        if self.shift is None:
+            self.shift = value
+        d = value - self.shift
+        for w in self.windows:
+            s = self.sums[w]
+            if len(tail) >= w:
+                out = tail[-w] - self.shift
+                s[0] -= out
+                s[1] -= out * out
+            s[0] += d
+            s[1] += d * d
+        if tail:
+            prev = tail[-1]
+            r = math.log(value / prev) if prev > 0 and value > 0 else 0.0
+            for w in self.windows:
+                s = self.rsums[w]
+                if len(returns) >= w:
+                    out = returns[-w]
+                    s[0] -= out
+                    s[1] -= out * out
+                s[0] += r
+                s[1] += r * r
+            returns.append(r)
+        tail.append(value)
+
+        # Monotonic deques for rolling highs and lows
+        for w in self.windows:
+            q = self.highs[w]
+            while q and q[-1][1] <= value:
+                q.pop()
+            q.append((seq, value))
+            if q[0][0] <= seq - w:
+                q.popleft()
+            q = self.lows[w]
+            while q and q[-1][1] >= value:
+                q.pop()
+            q.append((seq, value))
+            if q[0][0] <= seq - w:
+                q.popleft()
+
+        # Horizon anchors only ever move forward
+        recent = self.recent
+        recent.append((ordinal, value))
+        for h, days in self.horizons.items():
+            target = ordinal - days
+            pos = self.anchor_pos[h]
+            while pos + 1 < len(recent) and recent[pos + 1][0] <= target:
+                pos += 1
+            self.anchor_pos[h] = pos
+        drop = min(self.anchor_pos.values())
+        if drop >= COMPACT_AT:
+            del recent[:drop]
+            for h in self.anchor_pos:
+                self.anchor_pos[h] -= drop
+
+        self.count += 1
+        self.current = value
+        self.last_ordinal = ordinal
+        self.peak = max(self.peak, value)
+        self.since_resync += 1
+        if self.since_resync >= RESYNC_EVERY:
+            self._resync()
+
+    def extend(self, series, start=0):
+        """Append the rows of a Series from position start onwards"""
+        for o, v in zip(series.ordinals[start:], series.values[start:]):
+            self.append(o, v)
+
+    def _resync(self):
+        """Recompute the running sums from the buffers to shed float drift"""
+        tail, returns = list(self.tail), list(self.returns)
+        self.shift = tail[0]
+        for w in self.windows:
+            window = [v - self.shift for v in tail[-w:]]
+            self.sums[w] = [sum(window), sum(d * d for d in window)]
+            window = returns[-w:] if returns else []
+            self.rsums[w] = [sum(window), sum(r * r for r in window)]
+        self.since_resync = 0
+
+    def context(self):
+        """Rolling context as of the last observation (see market_rolling.latest_context)"""
+        if not self.count:
+            return None
+        scale = math.sqrt(TRADING_DAYS) * 100
+        n_returns = len(self.returns)
+        context = {"drawdown": (self.current / self.peak - 1) * 100 if self.peak > 0 else NAN}
+        for w in self.windows:
+            c = min(len(self.tail), w)
+            s1, s2 = self.sums[w]
+            var = (s2 - s1 * s1 / c) / c
+            rc = min(n_returns, w)
+            if rc > 1:
+                r1, r2 = self.rsums[w]
+                rvar = (r2 - r1 * r1 / rc) / (rc - 1)
+                vol = math.sqrt(rvar) * scale if rvar > 0 else 0.0
+            else:
+                vol = NAN
+            context[w] = {
+                "high": self.highs[w][0][1],
+                "low": self.lows[w][0][1],
+                "mean": self.shift + s1 / c,
+                "std": math.sqrt(var) if var > 0 else 0.0,
+                "vol": vol,
+            }
+        return context
+
+    def snapshot(self):
+        """Brief result for the last observation, as analyze_series would compute it"""
+        as_of = datetime.fromordinal(self.last_ordinal) if self.count else None
+        anchors = [self.recent[pos][1] if pos >= 0 else None for pos in self.anchor_pos.values()]
+        return brief_result(self.series_id, as_of, self.current, anchors, self.context())
+
+    def to_dict(self):
+        return {
+            "version": STATE_VERSION,
+            "series_id": self.series_id,
+            "windows": list(self.windows),
+            "horizons": self.horizons,
+            "count": self.count,
+            "last_ordinal": self.last_ordinal,
+            "current": self.current,
+            "peak": self.peak,
+            "recent": self.recent,
+            "anchor_pos": self.anchor_pos,
+            "tail": list(self.tail),
+            "returns": list(self.returns),
+            "highs": {w: list(q) for w, q in self.highs.items()},
+            "lows": {w: list(q) for w, q in self.lows.items()},
+            "shift": self.shift,
+            "sums": self.sums,
+            "rsums": self.rsums,
+            "since_resync": self.since_resync,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls(data["series_id"], data["windows"], data["horizons"])
+        size = max(state.windows)
+        state.count = data["count"]
+        state.last_ordinal = data["last_ordinal"]
+        state.current = data["current"]
+        state.peak = data["peak"]
+        state.recent = [tuple(o) for o in data["recent"]]
+        state.anchor_pos = data["anchor_pos"]
+        state.tail = deque(data["tail"], maxlen=size + 1)
+        state.returns = deque(data["returns"], maxlen=size)
+        state.highs = {w: deque(tuple(e) for e in data["highs"][str(w)]) for w in state.windows}
+        state.lows = {w: deque(tuple(e) for e in data["lows"][str(w)]) for w in state.windows}
+        state.shift = data["shift"]
+        state.sums = {w: data["sums"][str(w)] for w in state.windows}
+        state.rsums = {w: data["rsums"][str(w)] for w in state.windows}
+        state.since_resync = data["since_resync"]
+        return state
+
+
+def state_path(store, series_id):
+    return store.root / f"{series_id}.state.json"
+
+
+def load_state(path):
+    """Load a saved state, or None if missing or from another layout"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        data = json.load(f)
+    if data.get("version") != STATE_VERSION:
+        return None
+    return SeriesState.from_dict(data)
+
+
+def save_state(state, path):
+    """Write a state atomically"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state.to_dict(), f)
+    os.replace(tmp, path)
+
+
+def sync_state(store, series_id, windows=WINDOWS):
+    """Load the saved state for a series and append any rows the store has since"""
+    path = state_path(store, series_id)
+    state = load_state(path)
+    if state is None or state.windows != tuple(windows) or state.horizons != HORIZONS:
+        state = SeriesState(series_id, windows)
+    series = store.open(series_id)
+    start = bisect_right(series.ordinals, state.last_ordinal) if state.last_ordinal is not None else 0
+    if start < len(series) or not path.exists():
+        state.extend(series, start)
+        save_state(state, path)
+    return state
+
+
+def snapshot_stored_series(root, series_id, as_of=None):
+    """sync_state plus snapshot for the store at root (picklable brief job)
+
+    The state is anchored on the series' own last observation. When the brief
+    is for another date (as_of, e.g. a watchlist series that hasn't printed
+    yet today), the horizons differ, so the result is a full recompute at as_of.
+    """
+    state = sync_state(SeriesStore(root), series_id)
+    if as_of is not None and state.last_ordinal != as_of.toordinal():
+        return analyze_stored_series(root, series_id, as_of)
+    return state.snapshot()
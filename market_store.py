@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Local FRED series store for the market brief.
+
+Keeps the full history of each FRED series on disk as one ``<ID>.fser`` file
+(see market_seriesfile for the layout) and only appends observations newer
+than the last stored date. Loading maps the file with mmap, so a warm brief
+does no text parsing and touches only the header (which also keeps the
+all-time peak), the window tail and the rows its date lookups bisect.
+
+The fetch step is a plain callable ``fetch(series_id, start) -> payload``
+where payload is CSV text, bytes or a file object, so tests and offline runs
+can swap the network for a fixture directory.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from pathlib import Path
+
+from market_series import Series, read_fred_csv
+from market_seriesfile import (
+    append_series_file,
+    last_ordinal,
+    load_series_file,
+    open_series_file,
+    write_series_file,
+)
+
+# Paths
+WORKSPACE = Path(__file__).resolve().parent
+STORE_DIR = WORKSPACE / "data/market/fred"
+
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
+# Series the brief needs (index rows, then VIX), and extra series --store keeps
+# current and lists with the watchlist (DGS10: 10-year Treasury yield)
+BRIEF_SERIES = ("SP500", "NASDAQCOM", "DJIA", "VIXCLS")
+DEFAULT_WATCHLIST = ("DGS10",)
+
+
+def fred_fetcher(series_id, start=None, timeout=30):
+    """Download a series from FRED as CSV bytes, optionally from start onwards"""
+    import urllib.request  # only needed when fetching; keeps the import cheap for the brief
+
+    url = FRED_CSV_URL.format(series_id=series_id)
+    if start is not None:
+        url += f"&cosd={start.isoformat()}"
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        return resp.read()
+
+
+class DirectoryFetcher:
+    """Fetch step backed by a directory of ``<ID>.csv`` files"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __call__(self, series_id, start=None):
+        return (self.path / f"{series_id}.csv").read_bytes()
+
+
+class SeriesStore:
+    """On-disk, append-only store of FRED series keyed by series ID"""
+
+    def __init__(self, root=STORE_DIR, fetch=fred_fetcher):
+        self.root = Path(root)
+        self.fetch = fetch
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, series_id):
+        """Series file for series_id"""
+        return self.root / f"{series_id}.fser"
+
+    def last_ordinal(self, series_id):
+        """Day ordinal of the newest stored observation, or None"""
+        path = self.path(series_id)
+        return last_ordinal(path) if path.exists() else None
+
+    def open(self, series_id):
+        """Memory-map the stored history of a series (read-only)"""
+        path = self.path(series_id)
+        if not path.exists():
+            return Series(name=series_id)
+        return open_series_file(path, series_id)
+
+    def load(self, series_id):
+        """Read the full stored history of a series into memory"""
+        path = self.path(series_id)
+        if not path.exists():
+            return Series(name=series_id)
+        return load_series_file(path, series_id)
+
+    def append(self, series_id, series):
+        """Append observations newer than the last stored date; returns count added"""
+        path = self.path(series_id)
+        if not path.exists():
+            write_series_file(path, series)
+            return len(series)
+        last = last_ordinal(path)
+        start = bisect_right(series.ordinals, last) if last is not None else 0
+        append_series_file(path, series.ordinals[start:], series.values[start:])
+        return len(series) - start
+
+    def update(self, series_id):
+        """Fetch and append anything newer than the stored history"""
+        last = self.last_ordinal(series_id)
+        start = date.fromordinal(last + 1) if last is not None else None
+        series, report = read_fred_csv(self.fetch(series_id, start))
+        return self.append(series_id, series)
+
+    def update_all(self, series_ids=BRIEF_SERIES + DEFAULT_WATCHLIST):
+        """Update several series; returns {series_id: rows appended}"""
+        return {series_id: self.update(series_id) for series_id in series_ids}
@@ -4,12 +4,32 @@ Garmin Connect Integration for Health Tracker Skill
 Pulls daily health data: sleep, HRV, recovery, activity load, VO2 max
 """
 
+import importlib.util
 import json
 import os
+import sys
 import requests
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
 
+from health_store import get_store
+import garmin_sync
+from health_log import get_log
+from garmin_session import GarminSession, SessionClient
+
+def _load_stage_profile():
+    """stage_profile.py from the repo root (shared with the market brief), loaded by path, not via sys.path"""
+    module = sys.modules.get("stage_profile")
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "stage_profile", Path(__file__).resolve().parents[2] / "stage_profile.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["stage_profile"] = module
+    return module
+
+get_profiler = _load_stage_profile().get_profiler
+
 # Paths
 SKILL_DIR = Path(__file__).parent
 WORKSPACE = Path("/home/clawd/.openclaw/workspace-ceo")
@@ -20,13 +40,14 @@ LOG_FILE = SKILL_DIR / "health-tracker.log"
 # Ensure directories exist
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-def log(message):
-    """Log with timestamp"""
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    msg = f"[{timestamp}] {message}"
-    print(msg)
-    with open(LOG_FILE, "a") as f:
-        f.write(msg + "\n")
+# HEALTH_LOG_FORMAT=json writes JSON lines instead of "[timestamp] message"
+LOG_FORMAT = os.environ.get("HEALTH_LOG_FORMAT", "text")
+# HEALTH_PROFILE=1|FILE (and HEALTH_PROFILE_CPROFILE=FILE) profile main(); see stage_profile
+PROFILE_ENV = "HEALTH_PROFILE"
+
+def log(message, **fields):
+    """Log with timestamp (printed now, written to LOG_FILE by a background thread)"""
+    get_log(LOG_FILE, fmt=LOG_FORMAT, echo=True).log(message, **fields)
 
 def load_credentials():
     """Load Garmin credentials"""
@@ -37,15 +58,32 @@ def load_credentials():
         return json.load(f)
 
 def save_credentials(creds):
-    """Save updated credentials"""
-    with open(CREDS_FILE, "w") as f:
+    """Save updated credentials (including the cached session)"""
+    tmp = CREDS_FILE.with_suffix(".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
         json.dump(creds, f, indent=2)
+    os.replace(tmp, CREDS_FILE)
 
-def get_garmin_client(creds):
-    """Initialize Garmin Connect client"""
+# Process-wide session: one client shared by every fetch in this process
+_session = None
+
+def get_garmin_client(creds, factory=None):
+    """Garmin Connect client, reusing the cached session token when still valid
+    
+    factory(email, password) defaults to GarminConnect; pass another to
+    inject a client (e.g. a local fake). API calls on the returned client log
+    in again and retry once if Garmin rejects the session.
+    """
+    global _session
     try:
-        from garmin_connect import GarminConnect
-        return GarminConnect(creds["email"], creds["password"])
+        if _session is None or _session.creds.get("email") != creds.get("email"):
+            if factory is None:
+                from garmin_connect import GarminConnect
+                factory = GarminConnect
+            _session = GarminSession(creds, factory, save=save_credentials)
+        _session.client()  # log in (or resume) now, so a bad login is reported here
+        return SessionClient(_session)
     except ImportError:
         log("❌ garmin-connect package not installed")
         return None
@@ -91,10 +129,10 @@ def fetch_body_battery(client, target_date=None):
         log(f"❌ Failed to fetch body battery: {e}")
         return None
 
-def parse_garmin_data(summary, sleep, stress):
+def parse_garmin_data(summary, sleep, stress, target_date=None):
     """Parse Garmin data into standardized format"""
     data = {
-        "date": str(date.today()),
+        "date": str(target_date or date.today()),
         "source": "garmin",
         "sleep": {},
         "recovery": {},
@@ -155,12 +193,11 @@ def load_baseline():
     return None
 
 def save_daily_health(data):
-    """Save daily health data"""
-    output_file = DATA_DIR / f"{data['date']}.json"
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
-    log(f"💾 Saved health data to {output_file}")
-    return output_file
+    """Save daily health data (workouts already logged for the day are kept)"""
+    store = get_store()
+    store.put(data, keep=("workouts",))
+    log(f"💾 Saved health data for {data['date']} to {store.path}")
+    return store.path
 
 def generate_brief(data, baseline=None):
     """Generate morning health brief"""
@@ -223,41 +260,117 @@ def generate_brief(data, baseline=None):
     
     return "\n".join(brief)
 
-def main():
-    """Main fetch and brief generation"""
+def backfill(start, end=None, client=None, workers=garmin_sync.WORKERS):
+    """Fetch and save every day from start to end (default today) concurrently
+
+    client defaults to a logged-in GarminConnect; any object with the same
+    get_* methods can be passed instead. Returns garmin_sync.backfill stats.
+    """
+    end = end or date.today()
+    if client is None:
+        creds = load_credentials()
+        client = get_garmin_client(creds) if creds else None
+        if not client:
+            log("❌ Could not initialize Garmin client")
+            return None
+    
+    log(f"Backfilling Garmin data {start} → {end} with {workers} workers...")
+    stats = garmin_sync.backfill(
+        client, start, end,
+        parse=lambda day, summary, sleep, stress: parse_garmin_data(summary, sleep, stress, day),
+        store=get_store(),
+        workers=workers,
+        log=log,
+    )
+    log(f"✅ Backfill complete: {stats['saved']}/{stats['days']} days saved, "
+        f"{stats['requests']} requests, {stats['retries']} retries in {stats['seconds']:.1f}s")
+    if stats["failed"]:
+        log(f"⚠️ No data for: {', '.join(str(d) for d in stats['failed'])}")
+    return stats
+
+def main(force=False, profiler=None):
+    """Main fetch and brief generation (force: refetch and rewrite unchanged data)
+
+    profiler: a stage_profile profiler for per-stage timings (default: from HEALTH_PROFILE)
+    """
+    profiler = profiler or get_profiler("garmin.main", env_prefix=PROFILE_ENV)
+    try:
+        run_sync(force, profiler)
+    finally:
+        profiler.finish(force=force)
+
+def run_sync(force, profiler):
     log("=" * 50)
     log("Starting Garmin health sync...")
     
     # Load credentials
-    creds = load_credentials()
+    with profiler.stage("credentials"):
+        creds = load_credentials()
     if not creds:
         log("❌ No Garmin credentials. Add to config/garmin-credentials.json:")
         log('{"email": "your@email.com", "password": "yourpassword"}')
         return
     
     # Get client
-    client = get_garmin_client(creds)
+    with profiler.stage("client"):
+        client = get_garmin_client(creds)
     if not client:
         log("❌ Could not initialize Garmin client")
         return
     
-    # Fetch data
-    summary = fetch_daily_summary(client)
-    sleep = fetch_sleep_data(client)
-    stress = fetch_body_battery(client)
-    
-    # Parse
-    data = parse_garmin_data(summary, sleep, stress)
-    
-    # Save
-    save_daily_health(data)
+    # Fetch, then parse and save only what changed since the last sync
+    today = date.today()
+    with profiler.stage("store"):
+        store = get_store()
+    with profiler.stage("sync"):
+        stats = garmin_sync.sync_day(
+            client, today, store,
+            parse=profiler.calls("parse", lambda day, summary, sleep, stress: parse_garmin_data(summary, sleep, stress, day)),
+            fetchers={"summary": profiler.calls("fetch.summary", fetch_daily_summary),
+                      "sleep": profiler.calls("fetch.sleep", fetch_sleep_data),
+                      "stress": profiler.calls("fetch.stress", fetch_body_battery)},
+            force=force,
+            log=log,
+        )
+    log(f"Fetched {stats['fetched']} (skipped {stats['fetch_skipped']}), "
+        f"parsed/wrote {stats['written']} (skipped {stats['write_skipped']})")
+    if not stats["changed"]:
+        log("✅ No changes since last sync — brief unchanged")
+        return
     
     # Generate brief
-    baseline = load_baseline()
-    brief = generate_brief(data, baseline)
-    print("\n" + brief)
+    with profiler.stage("brief"):
+        data = store.get(today)
+        baseline = load_baseline()
+        brief = generate_brief(data, baseline)
+    with profiler.stage("print"):
+        print("\n" + brief)
     
     log("✅ Garmin sync complete!")
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 2 and sys.argv[1] == "--backfill":
+        # python3 garmin.py --backfill START [END] [--workers N]
+        args = sys.argv[2:]
+        workers = garmin_sync.WORKERS
+        if "--workers" in args:
+            i = args.index("--workers")
+            workers = int(args[i + 1])
+            del args[i:i + 2]
+        start = date.fromisoformat(args[0])
+        end = date.fromisoformat(args[1]) if len(args) > 1 else None
+        backfill(start, end, workers=workers)
+    else:
+        # python3 garmin.py [--force] [--profile [FILE]] [--cprofile FILE]
+        args = sys.argv[1:]
+        profile = cprofile = None
+        if "--cprofile" in args:
+            i = args.index("--cprofile")
+            cprofile = args[i + 1]
+            del args[i:i + 2]
+        if "--profile" in args:
+            i = args.index("--profile")
+            has_file = i + 1 < len(args) and not args[i + 1].startswith("--")
+            profile = args[i + 1] if has_file else "-"
+            del args[i:i + 1 + has_file]
+        main(force="--force" in args, profiler=get_profiler("garmin.main", profile, cprofile, env_prefix=PROFILE_ENV))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Garmin Session Cache for Health Tracker Skill
+One authenticated client per process, reusing saved session tokens across runs until they expire
+"""
+
+import threading
+import time
+from functools import partial
+
+# Log in again this many seconds before a cached session expires
+EXPIRY_MARGIN = 300
+
+
+def is_auth_error(error):
+    """True if error means the API rejected the session (401/403, *Authentication* errors)"""
+    if isinstance(error, PermissionError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    name = type(error).__name__
+    return status in (401, 403) or "Authentication" in name or "Unauthorized" in name
+
+
+class GarminSession:
+    """Shared Garmin client backed by a session cached in the credentials dict
+
+    factory(email, password) builds a client. A client that has login()
+    (returning a session dict such as {"oauth_token": ..., "expires_at": epoch})
+    and resume(session) gets its tokens reused: the session is stored under
+    creds["session"] and written back through save(creds), so the next run
+    resumes it instead of logging in. Clients without those methods are
+    still shared for the life of the process, and rebuilt (logging in again
+    through the factory) when the API rejects them.
+    """
+
+    def __init__(self, creds, factory, save=None, clock=time.time):
+        self.creds = creds
+        self.factory = factory
+        self.save = save
+        self.clock = clock
+        self.logins = 0
+        self._client = None
+        self._lock = threading.Lock()
+
+    def valid(self, session):
+        """True for a cached session that is not within EXPIRY_MARGIN of expiring"""
+        if not session:
+            return False
+        expires_at = session.get("expires_at")
+        return expires_at is None or expires_at - EXPIRY_MARGIN > self.clock()
+
+    def client(self):
+        """The process's client: resumed from the cached session, or freshly logged in"""
+        with self._lock:
+            session = self.creds.get("session")
+            if self._client is not None and (self.valid(session) or not hasattr(self._client, "login")):
+                return self._client
+            client = self._client or self.factory(self.creds["email"], self.creds["password"])
+            if self.valid(session) and hasattr(client, "resume"):
+                client.resume(session)
+            else:
+                self._login(client)
+            self._client = client
+            return client
+
+    def refresh(self, seen=None):
+        """Force a new login, e.g. after the API rejected the cached tokens
+
+        seen is the login count when the rejected call was made; if another
+        caller has logged in since, that login is reused instead of a new one.
+        """
+        with self._lock:
+            if self._client is not None and seen is not None and self.logins != seen:
+                return self._client
+            if self._client is None or not hasattr(self._client, "login"):
+                self._client = self.factory(self.creds["email"], self.creds["password"])
+            self._login(self._client)
+            return self._client
+
+    def call(self, method, *args, **kwargs):
+        """client().method(...), logging in again and retrying once if the API rejects the session"""
+        client = self.client()
+        seen = self.logins
+        try:
+            return getattr(client, method)(*args, **kwargs)
+        except Exception as e:
+            if not is_auth_error(e):
+                raise
+            return getattr(self.refresh(seen), method)(*args, **kwargs)
+
+    def _login(self, client):
+        login = getattr(client, "login", None)
+        session = login() if login else None
+        self.logins += 1
+        if session:
+            self.creds["session"] = session
+            if self.save:
+                self.save(self.creds)
+
+
+class SessionClient:
+    """Stands in for the session's client: every method call goes through GarminSession.call"""
+
+    def __init__(self, session):
+        self.session = session
+
+    def __getattr__(self, name):
+        attr = getattr(self.session.client(), name)
+        return partial(self.session.call, name) if callable(attr) else attr
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Garmin Backfill Pipeline for Health Tracker Skill
+Fetches summary, sleep and stress data for a date range concurrently, with per-endpoint rate limits and retries
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+# Endpoint name -> Garmin client method, in parse_garmin_data argument order
+ENDPOINTS = {
+    "summary": "get_daily_summary_data",
+    "sleep": "get_sleep_data",
+    "stress": "get_stress_details",
+}
+
+# Endpoint -> the daily-record section parsed from its payload
+SECTIONS = {"summary": "activity", "sleep": "sleep", "stress": "recovery"}
+
+# A payload fetched this long after its day ended is final and not fetched again
+SETTLE = timedelta(days=1)
+
+# Requests per second and burst size per endpoint
+RATE_LIMITS = {"summary": (4.0, 4), "sleep": (4.0, 4), "stress": (4.0, 4)}
+WORKERS = 6
+RETRIES = 3
+BACKOFF = 0.5
+MAX_BACKOFF = 8.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate` calls per second with bursts of `burst`"""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self.clock = clock
+        self.sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed; the slot is reserved before sleeping"""
+        with self._lock:
+            now = self.clock()
+            allowed = max(now, self._next - self.tolerance)
+            self._next = max(self._next, allowed) + self.interval
+        if allowed > now:
+            self.sleep(allowed - now)
+
+
+def call_with_retry(fn, retries=RETRIES, backoff=BACKOFF, max_backoff=MAX_BACKOFF, on_retry=None,
+                    sleep=time.sleep):
+    """fn() retried up to `retries` times with full-jitter exponential backoff
+
+    Re-raises the last exception when every attempt fails. on_retry(attempt,
+    error, delay) is called before each wait.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+            if on_retry:
+                on_retry(attempt + 1, e, delay)
+            sleep(delay)
+
+
+def date_range(start, end):
+    """Dates start..end inclusive"""
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def backfill(client, start, end, parse, store, workers=WORKERS, rate_limits=RATE_LIMITS,
+             retries=RETRIES, backoff=BACKOFF, log=print):
+    """Fetch every endpoint for start..end and save each day as soon as it is complete
+
+    client: any object with the ENDPOINTS methods (GarminConnect or a fake).
+    parse(day, summary, sleep, stress) builds the daily record, which is
+    written to store (a HealthStore) by save_day along with the payload
+    hashes, so a later sync_day skips what the backfill already has; both run
+    on the calling thread, in completion order. An endpoint that still fails
+    after its retries contributes None, like the single-day fetch_* helpers;
+    a day where every endpoint failed is not saved.
+
+    Returns {"days", "saved", "failed", "requests", "retries", "seconds"}.
+    """
+    days = date_range(start, end)
+    limiters = {name: RateLimiter(*rate_limits[name]) for name in ENDPOINTS}
+    stats = {"days": len(days), "saved": 0, "failed": [], "requests": 0, "retries": 0}
+    lock = threading.Lock()
+
+    def on_retry(endpoint, day):
+        def note(attempt, error, delay):
+            with lock:
+                stats["retries"] += 1
+            log(f"⚠️ {endpoint} {day}: {error} (retry {attempt} in {delay:.1f}s)")
+        return note
+
+    def fetch(endpoint, day):
+        method = getattr(client, ENDPOINTS[endpoint])
+
+        def attempt():
+            limiters[endpoint].acquire()
+            with lock:
+                stats["requests"] += 1
+            return method(day)
+
+        try:
+            return call_with_retry(attempt, retries, backoff, on_retry=on_retry(endpoint, day))
+        except Exception as e:
+            log(f"❌ Failed to fetch {endpoint} for {day}: {e}")
+            return None
+
+    started = time.perf_counter()
+    pending = {day: {} for day in days}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Day-major submission so early days complete (and are saved) first
+        futures = {pool.submit(fetch, endpoint, day): (day, endpoint) for day in days for endpoint in ENDPOINTS}
+        for future in as_completed(futures):
+            day, endpoint = futures[future]
+            payloads = pending[day]
+            payloads[endpoint] = future.result()
+            if len(payloads) < len(ENDPOINTS):
+                continue
+            del pending[day]
+            if all(payloads[name] is None for name in ENDPOINTS):
+                stats["failed"].append(day)
+                continue
+            save_day(store, day, parse(day, *(payloads[name] for name in ENDPOINTS)), payloads)
+            log(f"💾 Saved health data for {day}")
+            stats["saved"] += 1
+    stats["seconds"] = time.perf_counter() - started
+    stats["failed"].sort()
+    return stats
+
+
+def payload_hash(payload):
+    """Stable content hash of a fetched payload"""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def save_day(store, day, record, payloads, now=None):
+    """Write a day parsed from payloads ({endpoint: payload}) with their hashes, in one transaction
+
+    Endpoints whose fetch failed (None) keep their stored section and hash.
+    """
+    fetched_at = (now or datetime.now()).isoformat()
+    sync = {e: (payload_hash(p), fetched_at) for e, p in payloads.items() if p is not None}
+    store.update_sections(day, {SECTIONS[e]: record[SECTIONS[e]] for e in sync}, defaults=record, sync=sync)
+
+
+def is_final(day, fetched_at):
+    """True if a payload for day fetched at fetched_at can no longer change"""
+    return fetched_at >= datetime.combine(day, datetime.min.time()) + timedelta(days=1) + SETTLE
+
+
+def sync_day(client, day, store, parse, fetchers=None, now=None, force=False, log=print):
+    """Conditionally sync one day: fetch, then parse and write only what changed
+
+    Each endpoint's payload hash is kept in the store's sync_state. Endpoints
+    whose stored payload was fetched once the day had settled are not fetched
+    again; a payload whose hash matches is not parsed or written; changed
+    payloads replace only their own section of the daily record. fetchers maps
+    endpoint -> fetch(client, day) (default: the client method); parse(day,
+    summary, sleep, stress) builds a record from the payloads, with None for
+    those not being parsed. force refetches and rewrites everything.
+
+    Returns counts {"fetched", "fetch_skipped", "parsed", "parse_skipped",
+    "written", "write_skipped"} plus "changed", the changed endpoints.
+    """
+    now = now or datetime.now()
+    known = {} if force else store.sync_state(day)
+    stats = {"fetched": 0, "fetch_skipped": 0, "parsed": 0, "parse_skipped": 0,
+             "written": 0, "write_skipped": 0, "changed": []}
+
+    payloads = {}
+    for endpoint, method in ENDPOINTS.items():
+        state = known.get(endpoint)
+        if state and is_final(day, datetime.fromisoformat(state[1])):
+            stats["fetch_skipped"] += 1
+            continue
+        fetch = fetchers[endpoint] if fetchers else lambda c, d, m=method: getattr(c, m)(d)
+        try:
+            payloads[endpoint] = fetch(client, day)
+        except Exception as e:
+            log(f"❌ Failed to fetch {endpoint} for {day}: {e}")
+            payloads[endpoint] = None
+        stats["fetched"] += 1
+
+    # A failed fetch (None) keeps the stored section and its hash
+    hashes = {endpoint: payload_hash(p) for endpoint, p in payloads.items() if p is not None}
+    changed = [e for e in ENDPOINTS if e in hashes and (e not in known or known[e][0] != hashes[e])]
+    stats["changed"] = changed
+    stats["parsed"] = stats["written"] = len(changed)
+    stats["parse_skipped"] = stats["write_skipped"] = len(ENDPOINTS) - len(changed)
+
+    sections, record = {}, None
+    if changed:
+        record = parse(day, *(payloads[e] if e in changed else None for e in ENDPOINTS))
+        sections = {SECTIONS[e]: record[SECTIONS[e]] for e in changed}
+    # Record new hashes, and unchanged ones only when the fetch marks them final
+    fetched_at = now.isoformat()
+    final = is_final(day, now)
+    sync = {e: (h, fetched_at) for e, h in hashes.items() if e in changed or final}
+    if sections or sync:
+        store.update_sections(day, sections, defaults=record, sync=sync)
+    return stats
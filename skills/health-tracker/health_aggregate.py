@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Health Aggregation Engine for Health Tracker Skill
+Range summaries, month-over-month and rolling 7-day averages in one pass over daily records
+"""
+
+from collections import deque
+from datetime import date
+
+# Metric extractors over one daily record; None means "no reading that day".
+# Sleep and recovery follow format_weekly_summary: a day with a sleep/recovery
+# block counts, with a missing score read as 0.
+METRICS = {
+    "sleep": lambda d: d["sleep"].get("score", 0) if d.get("sleep") else None,
+    "recovery": lambda d: d["recovery"].get("recovery_percent", 0) if d.get("recovery") else None,
+    "steps": lambda d: d["activity"].get("steps") if d.get("activity") else None,
+    "workout_min": lambda d: sum(w.get("duration_min", 0) or 0 for w in d.get("workouts", [])),
+}
+ROLLING_DAYS = 7
+
+
+def _new_bucket():
+    return {m: [0.0, 0, None, None] for m in METRICS}  # total, count, min, max
+
+
+def _add(bucket, metric, value):
+    acc = bucket[metric]
+    acc[0] += value
+    acc[1] += 1
+    acc[2] = value if acc[2] is None or value < acc[2] else acc[2]
+    acc[3] = value if acc[3] is None or value > acc[3] else acc[3]
+
+
+def _finish(bucket):
+    return {
+        m: {"avg": total / count if count else None, "total": total, "count": count, "min": lo, "max": hi}
+        for m, (total, count, lo, hi) in bucket.items()
+    }
+
+
+def aggregate(records, rolling_days=ROLLING_DAYS):
+    """Aggregate daily health records in a single pass
+
+    records: daily dicts with a 'date' (any order). Returns::
+
+        {"days": n, "start": first date, "end": last date,
+         "metrics": {metric: {avg, total, count, min, max}},
+         "workouts": number of workouts,
+         "months": {"YYYY-MM": {metric: {...}}},
+         "rolling": {metric: [(date, avg over the trailing rolling_days calendar days)]}}
+    """
+    records = sorted(records, key=lambda d: d["date"])
+    overall = _new_bucket()
+    months = {}
+    rolling = {m: [] for m in METRICS}
+    window = deque()
+    sums = {m: [0.0, 0] for m in METRICS}
+    workouts = 0
+
+    for record in records:
+        day = date.fromisoformat(record["date"][:10])
+        ordinal = day.toordinal()
+        month = months.get(record["date"][:7])
+        if month is None:
+            month = months[record["date"][:7]] = _new_bucket()
+        workouts += len(record.get("workouts", []))
+
+        values = {}
+        for metric, extract in METRICS.items():
+            value = extract(record)
+            values[metric] = value
+            if value is None:
+                continue
+            _add(overall, metric, value)
+            _add(month, metric, value)
+            sums[metric][0] += value
+            sums[metric][1] += 1
+
+        # Trailing calendar-day window for rolling averages
+        window.append((ordinal, values))
+        while window[0][0] <= ordinal - rolling_days:
+            _, old = window.popleft()
+            for metric, value in old.items():
+                if value is not None:
+                    sums[metric][0] -= value
+                    sums[metric][1] -= 1
+        for metric, (total, count) in sums.items():
+            if count:
+                rolling[metric].append((day, total / count))
+
+    return {
+        "days": len(records),
+        "start": records[0]["date"] if records else None,
+        "end": records[-1]["date"] if records else None,
+        "metrics": _finish(overall),
+        "workouts": workouts,
+        "months": {key: _finish(bucket) for key, bucket in months.items()},
+        "rolling": rolling,
+    }
+
+
+def format_metric_line(metrics):
+    """'Sleep 80 | Recovery 66% | Steps 9,870 | Workouts 25 min' from per-metric averages"""
+    parts = []
+    if metrics["sleep"] is not None:
+        parts.append(f"Sleep {metrics['sleep']:.0f}")
+    if metrics["recovery"] is not None:
+        parts.append(f"Recovery {metrics['recovery']:.0f}%")
+    if metrics["steps"] is not None:
+        parts.append(f"Steps {metrics['steps']:,.0f}")
+    if metrics["workout_min"] is not None:
+        parts.append(f"Workouts {metrics['workout_min']:.0f} min")
+    return " | ".join(parts) or "No data"
+
+
+def format_range_summary(result, title):
+    """Format an aggregate() result as a chat summary"""
+    if not result["days"]:
+        return f"No health data available for {title.lower()}."
+
+    m = result["metrics"]
+    summary = [f"📊 HEALTH SUMMARY — {title.upper()}", ""]
+    summary.append(f"Days with data: {result['days']} ({result['start']} → {result['end']})")
+    if m["sleep"]["count"]:
+        summary.append(f"Avg Sleep Score: {m['sleep']['avg']:.0f}/100")
+    if m["recovery"]["count"]:
+        summary.append(f"Avg Recovery: {m['recovery']['avg']:.0f}%")
+    if m["steps"]["count"]:
+        summary.append(f"Avg Steps: {m['steps']['avg']:,.0f}/day")
+    summary.append(f"Workout Minutes: {m['workout_min']['total']:.0f} total ({m['workout_min']['avg']:.0f}/day)")
+    summary.append(f"Workouts Logged: {result['workouts']}")
+
+    latest = {metric: (series[-1][1] if series else None) for metric, series in result["rolling"].items()}
+    summary.append("")
+    summary.append(f"7-day avg (latest): {format_metric_line(latest)}")
+    return "\n".join(summary)
+
+
+def format_month_over_month(result):
+    """Format per-month averages with the change versus the previous month"""
+    if not result["months"]:
+        return "No health data available for month-over-month."
+
+    lines = ["📊 MONTH OVER MONTH", ""]
+    previous = None
+    for key in sorted(result["months"]):
+        avgs = {metric: stats["avg"] for metric, stats in result["months"][key].items()}
+        line = f"{key}: {format_metric_line(avgs)}"
+        if previous is not None:
+            deltas = []
+            for metric, label in (("sleep", "sleep"), ("recovery", "recovery"), ("steps", "steps")):
+                if avgs[metric] is not None and previous[metric] is not None:
+                    deltas.append(f"{label} {avgs[metric] - previous[metric]:+,.0f}")
+            if deltas:
+                line += f"  ({', '.join(deltas)})"
+        lines.append(line)
+        previous = avgs
+    return "\n".join(lines)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Buffered Logging for Health Tracker Skill
+Queue-backed log writer: callers enqueue, a background thread writes batches with size-based rotation
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+FORMATS = ("text", "json")
+MAX_BYTES = 5 * 1024 * 1024
+BACKUPS = 3
+BATCH_SIZE = 2048
+
+_FLUSH = object()
+_STOP = object()
+
+
+class BufferedLog:
+    """Append-only log file written in batches from a background thread
+
+    The writer drains whatever is queued (up to batch_size lines) into one
+    write. fmt="text" writes the legacy "[YYYY-mm-dd HH:MM:SS UTC] message"
+    lines; fmt="json" writes one {"ts", "msg", ...fields} object per line.
+    When a batch takes the file past max_bytes it is rotated to <name>.1 ...
+    <name>.<backups>. echo prints the text line on the calling thread, as
+    log() always did.
+    """
+
+    def __init__(self, path, fmt="text", max_bytes=MAX_BYTES, backups=BACKUPS, echo=False,
+                 batch_size=BATCH_SIZE):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown log format {fmt!r}; expected one of {FORMATS}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.echo = echo
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._stamp = (None, "")
+        self._iso = (None, "")
+        self._encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        self._thread = threading.Thread(target=self._run, name=f"log-{self.path.name}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _timestamp(self, ts):
+        """'YYYY-mm-dd HH:MM:SS UTC', formatted once per second"""
+        second = int(ts)
+        cached_second, stamp = self._stamp  # one tuple: read and replaced atomically across threads
+        if second != cached_second:
+            stamp = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+            self._stamp = (second, stamp)
+        return stamp
+
+    def _iso_timestamp(self, ts):
+        """'YYYY-mm-ddTHH:MM:SS.ffffffZ' with the date/time part formatted once per second"""
+        second = int(ts)
+        cached_second, prefix = self._iso
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._iso = (second, prefix)
+        return f"{prefix}.{int((ts - second) * 1e6):06d}Z"
+
+    def log(self, message, **fields):
+        """Queue one message; returns immediately"""
+        ts = time.time()
+        if self.echo:
+            print(f"[{self._timestamp(ts)}] {message}")
+        self._queue.put((ts, message, fields))
+
+    def _format(self, ts, message, fields):
+        if self.fmt == "json":
+            record = {"ts": self._iso_timestamp(ts), "msg": message}
+            record.update(fields)
+            return self._encode(record) + "\n"
+        return f"[{self._timestamp(ts)}] {message}\n"
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is written"""
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done, None))
+        done.wait(timeout)
+
+    def close(self):
+        """Write everything queued and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None, None))
+            self._thread.join()
+        atexit.unregister(self.close)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self.path, "ab")
+
+    def _rotate(self, f):
+        f.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        return self._open()
+
+    def _run(self):
+        f = self._open()
+        get = self._queue.get
+        try:
+            stop = False
+            while not stop:
+                item = get()
+                lines, waiters = [], []
+                while True:
+                    ts, message, fields = item
+                    if ts is _STOP:
+                        stop = True
+                    elif ts is _FLUSH:
+                        waiters.append(message)
+                    else:
+                        lines.append(self._format(ts, message, fields))
+                    if stop or len(lines) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if lines:
+                    f.write("".join(lines).encode("utf-8"))
+                    f.flush()
+                    if self.max_bytes and f.tell() >= self.max_bytes:
+                        f = self._rotate(f)
+                for done in waiters:
+                    done.set()
+        except Exception as e:
+            print(f"[health-tracker] log writer failed: {e}", file=sys.stderr)
+        finally:
+            f.close()
+
+
+_logs = {}
+_logs_by_path = {}
+_logs_lock = threading.Lock()
+
+
+def get_log(path, **options):
+    """Process-wide BufferedLog for path (options apply when it is first created)
+
+    Looked up by the path as given, so the per-call cost is one dict lookup;
+    the resolved path (a filesystem call) is only used, under the lock, the
+    first time a path is seen, so aliases of one file share a writer.
+    """
+    log = _logs_by_path.get(path)
+    if log is None:
+        key = str(Path(path).resolve())
+        with _logs_lock:
+            if key not in _logs:
+                _logs[key] = BufferedLog(path, **options)
+            log = _logs_by_path[path] = _logs[key]
+    return log
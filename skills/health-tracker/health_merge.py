@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Multi-Source Merge for Health Tracker Skill
+Combines per-source daily records (Garmin, Strava, manual, ...) using per-field precedence rules
+"""
+
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+
+# Source order used when no rule below names the field
+DEFAULT_PRECEDENCE = ("garmin", "whoop", "apple_health", "strava", "manual")
+
+# Section ("sleep") or field ("activity.duration_seconds") -> source order.
+# A field falls back to its section's rule, then to DEFAULT_PRECEDENCE;
+# sources a rule doesn't list rank after the ones it does.
+PRECEDENCE = {
+    "sleep": ("garmin", "whoop", "apple_health"),
+    "recovery": ("garmin", "whoop", "apple_health"),
+    "activity": ("garmin", "apple_health", "strava", "manual"),
+    "activity.duration_seconds": ("strava", "garmin"),
+    "activity.activity_count": ("strava", "garmin"),
+    "workouts": ("strava", "garmin", "manual"),
+}
+
+# Top-level fields that only make sense for a single-source day
+SINGLE_SOURCE_FIELDS = ("note",)
+
+# Workouts from different sources are the same session when their time
+# ranges overlap by at least this fraction of the shorter one
+OVERLAP_FRACTION = 0.5
+
+
+def rank(key, source):
+    """Sort key for source under the precedence rule for key"""
+    order = PRECEDENCE.get(key) or PRECEDENCE.get(key.split(".", 1)[0]) or DEFAULT_PRECEDENCE
+    if source in order:
+        return (0, order.index(source), source)
+    if source in DEFAULT_PRECEDENCE:
+        return (1, DEFAULT_PRECEDENCE.index(source), source)
+    return (2, 0, source)
+
+
+def _present(value):
+    return value is not None and value != {} and value != []
+
+
+def _pick(key, candidates):
+    """Value from the highest-precedence source among [(source, value)]"""
+    candidates = [(s, v) for s, v in candidates if _present(v)]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda sv: rank(key, sv[0]))[1]
+
+
+def _parse_time(value):
+    """Workout timestamp as naive UTC datetime, or None
+
+    Timestamps without an offset (manual logs, Garmin) are local time;
+    Strava's start_date carries its own ("Z").
+    """
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    # astimezone() reads a naive datetime as local time
+    return when.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _interval(workout):
+    start = _parse_time(workout.get("timestamp"))
+    if start is None:
+        return None
+    minutes = workout.get("duration_min") or 0
+    return start, start + timedelta(minutes=max(minutes, 1))
+
+
+def overlaps(a, b):
+    """True if intervals a and b overlap by OVERLAP_FRACTION of the shorter one"""
+    shared = (min(a[1], b[1]) - max(a[0], b[0])).total_seconds()
+    shorter = min((a[1] - a[0]).total_seconds(), (b[1] - b[0]).total_seconds())
+    return shared > 0 and shared >= OVERLAP_FRACTION * shorter
+
+
+def dedupe_workouts(tagged):
+    """Merge [(source, workout)] lists, collapsing cross-source duplicates
+
+    Workouts are taken in workout precedence order; one that overlaps an
+    already kept workout from another source is dropped, after filling in any
+    fields the kept one lacks. Workouts from the same source are never
+    collapsed, and workouts without a usable timestamp are always kept.
+    Returns workouts (tagged with their source) ordered by start time.
+    """
+    timed, untimed = [], []
+    for source, workout in tagged:
+        workout = dict(workout, source=workout.get("source", source))
+        interval = _interval(workout)
+        (untimed if interval is None else timed).append((source, interval, workout))
+    timed.sort(key=lambda item: (rank("workouts", item[0]), item[1][0]))
+
+    kept = []
+    for source, interval, workout in timed:
+        for kept_source, kept_interval, kept_workout in kept:
+            if kept_source != source and overlaps(kept_interval, interval):
+                for key, value in workout.items():
+                    if not _present(kept_workout.get(key)):
+                        kept_workout[key] = value
+                break
+        else:
+            kept.append((source, interval, workout))
+    kept.sort(key=lambda item: item[1][0])
+    return [w for _, _, w in kept] + [w for _, _, w in untimed]
+
+
+def merge_day(records):
+    """One daily record from several per-source records for the same date
+
+    A single record is returned unchanged. Otherwise dict sections (sleep,
+    recovery, activity, ...) are merged field by field, other fields take the
+    highest-precedence value, and workouts are deduplicated by time overlap.
+    """
+    if len(records) == 1:
+        return dict(records[0])
+    records = sorted(records, key=lambda r: rank("", r.get("source", "manual")))
+    sources = [r.get("source", "manual") for r in records]
+    merged = {"date": records[0]["date"], "source": "+".join(sources), "sources": sources}
+
+    keys = []
+    for record in records:
+        keys.extend(k for k in record if k not in keys)
+    for key in keys:
+        if key in ("date", "source", "sources", "workouts") or key in SINGLE_SOURCE_FIELDS:
+            continue
+        candidates = [(s, r[key]) for s, r in zip(sources, records) if key in r]
+        if all(isinstance(v, dict) for _, v in candidates):
+            section = {}
+            for _, value in candidates:
+                for field in value:
+                    if field not in section:
+                        picked = _pick(f"{key}.{field}", [(s, v.get(field)) for s, v in candidates])
+                        if picked is not None:
+                            section[field] = picked
+            merged[key] = section
+        else:
+            merged[key] = _pick(key, candidates)
+
+    tagged = [(s, w) for s, r in zip(sources, records) for w in r.get("workouts", [])]
+    if tagged or any("workouts" in r for r in records):
+        merged["workouts"] = dedupe_workouts(tagged)
+    return merged
+
+
+def merge_stream(rows):
+    """Merged daily records from (date, source, record) rows sorted by date
+
+    Holds one date's rows at a time, so a range of any length streams through.
+    """
+    for _, group in groupby(rows, key=lambda row: row[0]):
+        yield merge_day([dict(record, source=record.get("source", source)) for _, source, record in group])
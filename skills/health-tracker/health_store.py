@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Health History Store for Health Tracker Skill
+SQLite-backed daily health records with a date index, replacing one JSON file per day
+"""
+
+import json
+import sqlite3
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+from health_merge import merge_stream
+
+# Paths
+WORKSPACE = Path("/home/clawd/.openclaw/workspace-ceo")
+DATA_DIR = WORKSPACE / "memory/health"
+DB_FILE = WORKSPACE / "memory/health.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_health (
+    date TEXT PRIMARY KEY,
+    source TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS source_records (
+    date TEXT NOT NULL,
+    source TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (date, source)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    date TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (date, endpoint)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS workouts (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workouts_by_date ON workouts (date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+# Dates re-merged per query
+MERGE_PAGE = 500
+
+
+def _day(value):
+    """Normalize a date, datetime or ISO string to 'YYYY-MM-DD'"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def _source(data):
+    return data.get("source") or "manual"
+
+
+class HealthStore:
+    """Daily health records keyed by date; range reads are one indexed query
+
+    Each source (garmin, strava, manual, ...) writes its own row per date to
+    source_records; daily_health holds the merged record for that date (see
+    health_merge), rebuilt whenever one of its source rows is written.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if self.get_meta("sources_seeded") is None:
+            self._seed_sources()
+
+    def _seed_sources(self):
+        """Copy records stored before per-source rows existed into source_records"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO source_records (date, source, data, updated_at) "
+                "SELECT date, COALESCE(source, 'manual'), data, updated_at FROM daily_health"
+            )
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('sources_seeded', ?)",
+                              (datetime.utcnow().isoformat(),))
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, day):
+        """Record for one date, or None"""
+        row = self.conn.execute("SELECT data FROM daily_health WHERE date = ?", (_day(day),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, data, keep=()):
+        """Insert or replace data['source']'s record for data['date']"""
+        self.put_many([data], keep)
+
+    def put_many(self, records, keep=()):
+        """Insert or replace several source records in one transaction
+
+        Each record replaces its source's row for its date, and the merged
+        record for every date touched is rebuilt. Fields named in keep that a
+        new record lacks are carried over from the stored row of the same
+        source; the read and the write share one write transaction.
+        """
+        now = datetime.utcnow().isoformat()
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            if keep:
+                records = [self._carry_over(r, keep) for r in records]
+            rows = [(_day(r["date"]), _source(r), json.dumps(r), now) for r in records]
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO source_records (date, source, data, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._merge_days(sorted({row[0] for row in rows}), now)
+
+    def _carry_over(self, data, keep):
+        stored = self.get_source(data["date"], _source(data))
+        missing = [k for k in keep if stored and stored.get(k) and k not in data]
+        if not missing:
+            return data
+        data = dict(data)
+        data.update((k, stored[k]) for k in missing)
+        return data
+
+    def update_sections(self, day, sections, defaults=None, sync=None, source=None):
+        """Replace only the given top-level sections of one source's record
+
+        The stored row for source (default: defaults' source, else "manual"),
+        or defaults when there is none, keeps every other field; the day's
+        merged record is rebuilt. sync maps endpoint -> (hash, fetched_at) and
+        is recorded in the same transaction. Returns True if a record was
+        written.
+        """
+        day = _day(day)
+        source = source or _source(defaults or {})
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            if sections:
+                now = datetime.utcnow().isoformat()
+                data = self.get_source(day, source) or dict(defaults or {}, date=day, source=source)
+                data.update(sections)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO source_records (date, source, data, updated_at) VALUES (?, ?, ?, ?)",
+                    (day, source, json.dumps(data), now),
+                )
+                self._merge_days([day], now)
+            if sync:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO sync_state (date, endpoint, hash, fetched_at) VALUES (?, ?, ?, ?)",
+                    [(day, endpoint, h, fetched_at) for endpoint, (h, fetched_at) in sync.items()],
+                )
+        return bool(sections)
+
+    def get_source(self, day, source):
+        """One source's record for one date, or None"""
+        row = self.conn.execute(
+            "SELECT data FROM source_records WHERE date = ? AND source = ?", (_day(day), source)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _source_rows(self, first, last):
+        """(date, source, record) rows for first <= date <= last, by date"""
+        cursor = self.conn.execute(
+            "SELECT date, source, data FROM source_records WHERE date BETWEEN ? AND ? ORDER BY date, source",
+            (first, last),
+        )
+        return ((day, source, json.loads(data)) for day, source, data in cursor)
+
+    def _merge_days(self, days, now):
+        """Rebuild daily_health for the given sorted dates from their source rows"""
+        for i in range(0, len(days), MERGE_PAGE):
+            page = days[i:i + MERGE_PAGE]
+            wanted = set(page)
+            rows = (row for row in self._source_rows(page[0], page[-1]) if row[0] in wanted)
+            merged = [(_day(r["date"]), r.get("source"), json.dumps(r), now) for r in merge_stream(rows)]
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO daily_health (date, source, data, updated_at) VALUES (?, ?, ?, ?)",
+                merged,
+            )
+
+    def merge_range(self, start, end):
+        """Rebuild merged records for start..end from the per-source rows
+
+        Streams MERGE_PAGE dates at a time, one transaction per page, so a
+        range of years never holds more than a page in memory. Use after
+        changing the precedence rules or writing source rows directly.
+        Returns the number of dates merged.
+        """
+        merged, after = 0, None
+        first = _day(start)
+        end = _day(end)
+        while True:
+            if after is None:
+                query, args = "date >= ?", (first,)
+            else:
+                query, args = "date > ?", (after,)
+            days = [row[0] for row in self.conn.execute(
+                f"SELECT DISTINCT date FROM source_records WHERE {query} AND date <= ? ORDER BY date LIMIT ?",
+                args + (end, MERGE_PAGE),
+            )]
+            if not days:
+                return merged
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self._merge_days(days, datetime.utcnow().isoformat())
+            merged += len(days)
+            after = days[-1]
+
+    def sync_state(self, day):
+        """{endpoint: (hash, fetched_at)} recorded for one date"""
+        rows = self.conn.execute(
+            "SELECT endpoint, hash, fetched_at FROM sync_state WHERE date = ?", (_day(day),)
+        ).fetchall()
+        return {endpoint: (h, fetched_at) for endpoint, h, fetched_at in rows}
+
+    def range(self, start, end):
+        """Records with start <= date <= end, oldest first"""
+        rows = self.conn.execute(
+            "SELECT data FROM daily_health WHERE date BETWEEN ? AND ? ORDER BY date",
+            (_day(start), _day(end)),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def add_workouts(self, rows, once=None):
+        """Insert (date, workout) rows in one transaction; returns the number inserted
+
+        Workouts are kept apart from the source records, one row each, so
+        logging one is a single INSERT whatever the day already holds. once
+        names a meta key for one-time imports: if it is already set nothing
+        is inserted, otherwise it is set in the same transaction.
+        """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            if once is not None:
+                if self.get_meta(once) is not None:
+                    return 0
+                self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (once, datetime.utcnow().isoformat()))
+            cursor = self.conn.executemany(
+                "INSERT INTO workouts (date, data) VALUES (?, ?)",
+                [(_day(day), json.dumps(workout)) for day, workout in rows],
+            )
+            return cursor.rowcount
+
+    def workouts(self, start=None, end=None):
+        """Logged workouts grouped by date, {'YYYY-MM-DD': [workout, ...]}, in logging order"""
+        cursor = self.conn.execute(
+            "SELECT date, data FROM workouts WHERE date BETWEEN ? AND ? ORDER BY date, id",
+            (_day(start) if start else "", _day(end) if end else "9999-12-31"),
+        )
+        by_day = {}
+        for day, data in cursor:
+            by_day.setdefault(day, []).append(json.loads(data))
+        return by_day
+
+    def get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def dates(self):
+        """All stored dates, oldest first"""
+        return [row[0] for row in self.conn.execute("SELECT date FROM daily_health ORDER BY date")]
+
+
+def migrate_json_files(store, data_dir=DATA_DIR, overwrite=False):
+    """Import per-day YYYY-MM-DD.json files into the store
+
+    Dates already in the store are skipped unless overwrite is set. Files
+    that can't be read as a JSON object (torn by a racing writer, say) are
+    reported on stderr and skipped, so one bad day can't block the rest.
+    Returns the number of records imported; the JSON files are left in place.
+    """
+    existing = set() if overwrite else set(store.dates())
+    records = []
+    for path in sorted(Path(data_dir).glob("????-??-??.json")):
+        if path.stem in existing:
+            continue
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[health-store] Skipped unreadable {path}: {e}", file=sys.stderr)
+            continue
+        if not isinstance(data, dict):
+            print(f"[health-store] Skipped {path}: not a JSON object", file=sys.stderr)
+            continue
+        data.setdefault("date", path.stem)
+        records.append(data)
+    store.put_many(records)
+    return len(records)
+
+
+_default_store = None
+
+
+def get_store():
+    """Process-wide store at DB_FILE, opened on first use
+
+    The first time a store is opened it imports any per-day JSON files
+    already in DATA_DIR, so existing history shows up in range reads.
+    """
+    global _default_store
+    if _default_store is None:
+        store = HealthStore(DB_FILE)
+        if store.get_meta("json_migrated") is None:
+            migrate_json_files(store, DATA_DIR)
+            store.set_meta("json_migrated", datetime.utcnow().isoformat())
+        _default_store = store
+    return _default_store
+
+
+# CLI: migrate existing JSON history, re-merge sources
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        count = migrate_json_files(get_store(), overwrite="--overwrite" in sys.argv)
+        print(f"[health-store] Imported {count} day(s) from {DATA_DIR} into {DB_FILE}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "merge":
+        start = sys.argv[2] if len(sys.argv) > 2 else "0000-01-01"
+        end = sys.argv[3] if len(sys.argv) > 3 else "9999-12-31"
+        count = get_store().merge_range(start, end)
+        print(f"[health-store] Merged {count} day(s) from per-source records")
+    else:
+        print("Usage: python3 health_store.py migrate [--overwrite] | merge [START [END]]")
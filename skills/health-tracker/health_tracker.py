@@ -11,6 +11,12 @@ from datetime import datetime, date, timedelta
 from pathlib import Path
 from difflib import SequenceMatcher
 
+from health_merge import dedupe_workouts
+from health_store import get_store
+from workout_journal import append_workout, append_workouts, read_workouts
+from health_aggregate import aggregate, format_range_summary, format_month_over_month
+from intent_router import WORKOUT_PATTERNS, RANGE_PATTERNS, classify
+
 # Paths
 WORKSPACE = Path("/home/clawd/.openclaw/workspace-ceo")
 DATA_DIR = WORKSPACE / "memory/health"
@@ -19,19 +25,60 @@ BASELINE_FILE = WORKSPACE / "memory/health-baseline.json"
 # Ensure directories exist
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# Compiled once; shared with the intent router's table
+WORKOUT_RES = [re.compile(p) for p in WORKOUT_PATTERNS]
+# Optional leading date/time on imported lines: "2026-02-17", "[2026-02-17 07:30]", "2026-02-17T07:30:00 -"
+IMPORT_LINE_RE = re.compile(r"\[?(\d{4}-\d{2}-\d{2})(?:[ T](\d{2}:\d{2}(?::\d{2})?))?\]?\s*[-:,|]?\s*")
+RANGE_COUNT_RE, RANGE_YEAR_RE, RANGE_MONTH_RE, RANGE_QUARTER_RE = (re.compile(p) for p in RANGE_PATTERNS)
+# Longest range a query can ask for (a century); any longer covers the whole history anyway
+MAX_RANGE_DAYS = 36525
+
 def log(message):
     print(f"[health-tracker] {message}")
 
+def _with_journal_workouts(data, day, workouts):
+    """Daily record with journaled workouts merged into its own workout list
+
+    Journaled workouts are the "manual" source: one that overlaps a session a
+    device recorded is collapsed into it, as health_merge does across sources.
+    """
+    if not workouts:
+        return data
+    if data is None:
+        data = {"date": str(day), "source": "manual", "workouts": []}
+    source = data.get("source", "manual")
+    tagged = [(w.get("source", source), w) for w in data.get("workouts", [])]
+    data["workouts"] = dedupe_workouts(tagged + [("manual", w) for w in workouts])
+    return data
+
 def load_daily_health(target_date=None):
-    """Load health data for a specific date"""
+    """Load health data for a specific date, including journaled workouts"""
     if target_date is None:
         target_date = date.today()
     
-    file_path = DATA_DIR / f"{target_date}.json"
-    if file_path.exists():
-        with open(file_path, "r") as f:
-            return json.load(f)
-    return None
+    journaled = read_workouts(target_date, target_date).get(str(target_date), [])
+    data = get_store().get(target_date)
+    if data is None:
+        # Legacy per-day JSON file not migrated yet: import it on first read
+        file_path = DATA_DIR / f"{target_date}.json"
+        if file_path.exists():
+            with open(file_path, "r") as f:
+                data = json.load(f)
+            data.setdefault("date", str(target_date))
+            get_store().put(data)
+    return _with_journal_workouts(data, target_date, journaled)
+
+def save_daily_health(data):
+    """Save health data for data['date'], keeping workouts already stored for that day"""
+    get_store().put(data, keep=("workouts",))
+    return data
+
+def load_health_range(start, end):
+    """Load health data for start..end inclusive, oldest first (one indexed query)"""
+    records = {d["date"]: d for d in get_store().range(start, end)}
+    for day, workouts in read_workouts(start, end).items():
+        records[day] = _with_journal_workouts(records.get(day), day, workouts)
+    return [records[day] for day in sorted(records)]
 
 def load_baseline():
     """Load health baseline"""
@@ -46,14 +93,9 @@ def save_baseline(baseline):
         json.dump(baseline, f, indent=2)
 
 def load_weekly_data():
-    """Load last 7 days of health data"""
-    data = []
-    for i in range(7):
-        d = date.today() - timedelta(days=i)
-        day_data = load_daily_health(d)
-        if day_data:
-            data.append(day_data)
-    return data
+    """Load last 7 days of health data, newest first"""
+    today = date.today()
+    return load_health_range(today - timedelta(days=6), today)[::-1]
 
 def parse_workout_log(message):
     """Parse workout from natural language message"""
@@ -62,13 +104,9 @@ def parse_workout_log(message):
     # "log 45 min bike"
     # "logged 1 hour swim"
     
-    patterns = [
-        r"log(?:ged)?\s+(?:a\s+)?(\d+(?:\.\d+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
-        r"(\d+(?:\.\d+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, message.lower())
+    message_lower = message.lower()
+    for pattern in WORKOUT_RES:
+        match = pattern.search(message_lower)
         if match:
             duration_val = float(match.group(1))
             unit = match.group(2)
@@ -104,27 +142,63 @@ def parse_workout_log(message):
     return None
 
 def save_workout(workout):
-    """Save workout to today's log"""
-    today = date.today()
-    log_file = DATA_DIR / f"{today}.json"
-    
-    # Load existing or create new
-    if log_file.exists():
-        with open(log_file, "r") as f:
-            data = json.load(f)
-    else:
-        data = {"date": str(today), "source": "manual", "workouts": []}
-    
-    if "workouts" not in data:
-        data["workouts"] = []
-    
-    data["workouts"].append(workout)
-    
-    with open(log_file, "w") as f:
-        json.dump(data, f, indent=2)
-    
+    """Log workout for today (one INSERT, no read-modify-write)"""
+    append_workout(workout, date.today())
     return workout
 
+def import_workout_log(lines, default_date=None, store=None):
+    """Bulk-import workouts from chat-export lines
+
+    Each line is a workout message, optionally prefixed with a date or
+    timestamp ("2026-02-17 07:30 log a 30 min run"); undated lines use
+    default_date (a date or 'YYYY-MM-DD'; anything else raises ValueError
+    before a line is read). Blank lines and '#' comments are skipped. Workouts are
+    grouped by date and written in a single transaction.
+
+    Returns {"imported": n, "days": {date: count}, "invalid": [(line_no, line, reason)]}.
+    """
+    by_day = {}
+    invalid = []
+    if isinstance(default_date, datetime):
+        default_date = default_date.date()
+    elif isinstance(default_date, str):
+        try:
+            default_date = date.fromisoformat(default_date)
+        except ValueError:
+            raise ValueError(f"Invalid default date {default_date!r}; expected YYYY-MM-DD") from None
+    default_day = default_date.isoformat() if default_date else None
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        prefix = IMPORT_LINE_RE.match(line)
+        if prefix:
+            day, clock = prefix.group(1), prefix.group(2)
+            try:
+                date.fromisoformat(day)
+            except ValueError:
+                invalid.append((line_no, line, f"invalid date {day}"))
+                continue
+            message = line[prefix.end():]
+        elif default_day:
+            day, clock, message = default_day, None, line
+        else:
+            invalid.append((line_no, line, "no date"))
+            continue
+        workout = parse_workout_log(message)
+        if workout is None:
+            invalid.append((line_no, line, "no workout found"))
+            continue
+        workout["timestamp"] = f"{day}T{clock}" if clock else f"{day}T00:00:00"
+        by_day.setdefault(day, []).append(workout)
+    
+    append_workouts([dict(w, date=day) for day in sorted(by_day) for w in by_day[day]], store=store)
+    return {
+        "imported": sum(len(w) for w in by_day.values()),
+        "days": {day: len(by_day[day]) for day in sorted(by_day)},
+        "invalid": invalid,
+    }
+
 def format_sleep_response(data):
     """Format sleep data for response"""
     if not data.get("sleep"):
@@ -186,71 +260,87 @@ def format_weekly_summary():
     if not data:
         return "No health data available for this week."
     
+    result = aggregate(data)
+    m = result["metrics"]
     summary = ["📊 WEEKLY HEALTH SUMMARY", ""]
     
-    # Average sleep
-    sleep_scores = [d.get("sleep", {}).get("score", 0) for d in data if d.get("sleep")]
-    if sleep_scores:
-        avg_sleep = sum(sleep_scores) / len(sleep_scores)
-        summary.append(f"Avg Sleep Score: {avg_sleep:.0f}/100")
-    
-    # Average recovery
-    recovery_scores = [d.get("recovery", {}).get("recovery_percent", 0) for d in data if d.get("recovery")]
-    if recovery_scores:
-        avg_recovery = sum(recovery_scores) / len(recovery_scores)
-        summary.append(f"Avg Recovery: {avg_recovery:.0f}%")
-    
-    # Total workouts logged
-    total_workouts = sum(len(d.get("workouts", [])) for d in data)
-    summary.append(f"Workouts Logged: {total_workouts}")
+    if m["sleep"]["count"]:
+        summary.append(f"Avg Sleep Score: {m['sleep']['avg']:.0f}/100")
+    if m["recovery"]["count"]:
+        summary.append(f"Avg Recovery: {m['recovery']['avg']:.0f}%")
+    summary.append(f"Workouts Logged: {result['workouts']}")
     
     return "\n".join(summary)
 
+def summarize_range(days, end=None):
+    """Aggregate the last `days` days ending at end (default today) in one pass
+
+    Ranges reaching past the earliest representable date are clamped to it.
+    """
+    end = end or date.today()
+    days = min(days, (end - date.min).days + 1)
+    return aggregate(load_health_range(end - timedelta(days=days - 1), end))
+
+def format_period_summary(days):
+    """Format a last-N-days health summary"""
+    return format_range_summary(summarize_range(days), f"Last {days} days")
+
+def format_monthly_trend(days=365):
+    """Format month-over-month averages over the last `days` days"""
+    return format_month_over_month(summarize_range(days))
+
+def parse_range_query(message_lower):
+    """Days covered by a range query ('last 30 days', 'past year', ...), or None"""
+    match = RANGE_COUNT_RE.search(message_lower)
+    if match:
+        count = int(match.group(1))
+        unit = match.group(2)
+        return min(count * (7 if unit.startswith("week") else 30 if unit.startswith("month") else 1), MAX_RANGE_DAYS)
+    if RANGE_YEAR_RE.search(message_lower):
+        return 365
+    if RANGE_MONTH_RE.search(message_lower):
+        return 30
+    if RANGE_QUARTER_RE.search(message_lower):
+        return 90
+    return None
+
+def _log_workout(message):
+    workout = parse_workout_log(message)
+    save_workout(workout)
+    return f"✅ Logged: {workout['type']} {workout['duration_min']} min"
+
+def _today_response(formatter, missing):
+    """Handler that formats today's data, or returns missing without it"""
+    def handler(message):
+        today_data = load_daily_health()
+        return formatter(today_data) if today_data else missing
+    return handler
+
+def format_health_brief(data):
+    """Sleep, recovery and clearance lines for a daily record"""
+    parts = []
+    parts.append(format_sleep_response(data))
+    parts.append(format_recovery_response(data))
+    parts.append(format_training_clearance(data))
+    return "\n".join(parts)
+
+# Intent (see intent_router.INTENT_TABLE) -> handler(message)
+INTENT_HANDLERS = {
+    "log_workout": _log_workout,
+    "monthly_trend": lambda message: format_monthly_trend(),
+    "range_summary": lambda message: format_period_summary(parse_range_query(message.lower())),
+    "sleep": _today_response(format_sleep_response, "No sleep data available. Connect Garmin or Strava."),
+    "recovery": _today_response(format_recovery_response, "No recovery data available."),
+    "clearance": _today_response(format_training_clearance, "No data to determine training clearance."),
+    "weekly_summary": lambda message: format_weekly_summary(),
+    "brief": _today_response(format_health_brief, "No health data available today."),
+}
+
 def handle_query(message):
     """Handle natural language health query"""
-    message_lower = message.lower()
-    
-    # Check for workout logging first
-    workout = parse_workout_log(message)
-    if workout:
-        save_workout(workout)
-        return f"✅ Logged: {workout['type']} {workout['duration_min']} min"
-    
-    # Load today's data
-    today_data = load_daily_health()
-    
-    # Sleep queries
-    if "sleep" in message_lower:
-        if today_data:
-            return format_sleep_response(today_data)
-        return "No sleep data available. Connect Garmin or Strava."
-    
-    # Recovery / HRV queries
-    if "recovery" in message_lower or "hrv" in message_lower or "body battery" in message_lower:
-        if today_data:
-            return format_recovery_response(today_data)
-        return "No recovery data available."
-    
-    # Training clearance
-    if "clear" in message_lower or "train" in message_lower or "hard" in message_lower:
-        if today_data:
-            return format_training_clearance(today_data)
-        return "No data to determine training clearance."
-    
-    # Weekly summary
-    if "week" in message_lower or "weekly" in message_lower:
-        return format_weekly_summary()
-    
-    # General health brief
-    if "health" in message_lower or "brief" in message_lower or "how am i" in message_lower:
-        if today_data:
-            parts = []
-            parts.append(format_sleep_response(today_data))
-            parts.append(format_recovery_response(today_data))
-            parts.append(format_training_clearance(today_data))
-            return "\n".join(parts)
-        return "No health data available today."
-    
+    handler = INTENT_HANDLERS.get(classify(message))
+    if handler:
+        return handler(message)
     return "I didn't understand that. Try: 'how did I sleep?', 'what's my recovery?', 'log a 30 min run', or 'am I cleared for hard training?'"
 
 def run_health_check():
@@ -274,7 +364,22 @@ def run_health_check():
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2 and sys.argv[1] == "--import":
+        # Bulk workout import: --import FILE [DEFAULT_DATE], "-" reads stdin
+        default_date = None
+        if len(sys.argv) > 3:
+            try:
+                default_date = date.fromisoformat(sys.argv[3])
+            except ValueError:
+                raise SystemExit(f"[health-tracker] Invalid default date {sys.argv[3]!r}; expected YYYY-MM-DD")
+        source = sys.stdin if sys.argv[2] == "-" else open(sys.argv[2], "r", encoding="utf-8")
+        with source:
+            report = import_workout_log(source, default_date)
+        for line_no, line, reason in report["invalid"]:
+            log(f"⚠️ Line {line_no}: {reason}: {line}")
+        log(f"✅ Imported {report['imported']} workout(s) across {len(report['days'])} day(s), "
+            f"{len(report['invalid'])} invalid line(s)")
+    elif len(sys.argv) > 1:
         # Treat remaining args as query
         query = " ".join(sys.argv[1:])
         print(handle_query(query))
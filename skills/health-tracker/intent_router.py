@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Intent Router for Health Tracker Skill
+Classifies a chat message in one scan for trigger keywords from a priority-ordered intent table
+"""
+
+import re
+
+# Numbers are ASCII digits ([0-9], not \d) everywhere, matching the
+# log_workout triggers below: "٣٠ min run" is neither routed nor parsed as a workout.
+
+# Workout logging: "log a 30 min run", "logged 1 hour swim", "45 min bike"
+WORKOUT_PATTERNS = (
+    r"log(?:ged)?\s+(?:a\s+)?([0-9]+(?:\.[0-9]+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
+    r"([0-9]+(?:\.[0-9]+)?)\s*(min|minute|minutes|hour|hr|hours)\s+(\w+)",
+)
+
+# Multi-day ranges: "last 30 days", "past 2 weeks", "this year", "last quarter"
+RANGE_PATTERNS = (
+    r"(?:last|past)\s+0*([1-9][0-9]*)\s*(day|days|week|weeks|month|months)\b",
+    r"(?:last|past|this)\s+year|\byearly\b|\b365\b",
+    r"(?:last|past|this)\s+(?:month|30 days)",
+    r"(?:last|past)\s+quarter",
+)
+
+# (intent, trigger keywords, confirming pattern) in priority order: when
+# several intents match a message the first one listed wins, as in the
+# original if-chain of handle_query. An intent matches when a trigger occurs
+# in the lowercased message and, if a pattern is given, the pattern matches
+# starting at that trigger, so every match of the pattern must begin with one
+# of its triggers. A "log 30 min run" match always contains a "30 min run"
+# match, so the second workout pattern alone decides the intent.
+INTENT_TABLE = (
+    ("log_workout", tuple("0123456789"), WORKOUT_PATTERNS[1]),
+    ("monthly_trend", ("month over month", "monthly"), None),
+    ("range_summary", ("last", "past", "this", "yearly", "365"), "|".join(RANGE_PATTERNS)),
+    ("sleep", ("sleep",), None),
+    ("recovery", ("recovery", "hrv", "body battery"), None),
+    ("clearance", ("clear", "train", "hard"), None),
+    ("weekly_summary", ("week",), None),
+    ("brief", ("health", "brief", "how am i"), None),
+)
+UNKNOWN = "unknown"
+
+
+class IntentRouter:
+    """Trigger-keyword classifier over a priority-ordered intent table
+
+    All triggers are compiled into one alternation of literals, which the
+    regex engine scans with a first-character prefilter; each hit is mapped
+    to the (rank, pattern) rules of every trigger starting at that position.
+    """
+
+    def __init__(self, table=INTENT_TABLE):
+        self.intents = [intent for intent, _, _ in table]
+        rules = {}
+        for rank, (_, triggers, pattern) in enumerate(table):
+            compiled = re.compile(pattern) if pattern else None
+            for trigger in triggers:
+                rules.setdefault(trigger, []).append((rank, compiled))
+        # Longest first, so a hit reports the longest trigger at its position;
+        # the shorter triggers it starts with are checked through the hit too.
+        ordered = sorted(rules, key=len, reverse=True)
+        self.triggers = re.compile("|".join(re.escape(t) for t in ordered))
+        self.rules = {
+            t: sorted(rule for p in ordered if t.startswith(p) for rule in rules[p])
+            for t in ordered
+        }
+
+    def classify(self, message):
+        """Highest-priority intent matching message (case-insensitive), or UNKNOWN"""
+        text = message.lower()
+        best = len(self.intents)
+        search = self.triggers.search
+        hit = search(text)
+        while hit is not None:
+            pos = hit.start()
+            for rank, pattern in self.rules[hit.group()]:
+                if rank >= best:
+                    break
+                if pattern is None or pattern.match(text, pos):
+                    best = rank
+                    break
+            if best == 0:
+                break
+            # Restart one character later so overlapping triggers are seen too
+            hit = search(text, pos + 1)
+        return self.intents[best] if best < len(self.intents) else UNKNOWN
+
+
+_default_router = None
+
+
+def classify(message):
+    """Classify message with the default INTENT_TABLE router"""
+    global _default_router
+    if _default_router is None:
+        _default_router = IntentRouter()
+    return _default_router.classify(message)
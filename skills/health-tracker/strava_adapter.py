@@ -8,11 +8,18 @@ import json
 from datetime import date, timedelta
 from pathlib import Path
 
+from health_store import get_store
+from strava_index import get_index
+
 # Paths
 WORKSPACE = Path("/home/clawd/.openclaw/workspace")
 DATA_DIR = WORKSPACE / "data/strava"
 HEALTH_DIR = Path("/home/clawd/.openclaw/workspace-ceo/memory/health")
 
+# Lactate threshold heart rate for hrTSS when Strava has no Relative Effort
+THRESHOLD_HR = 165
+NOTE = "Strava data only. Connect Garmin for sleep/recovery."
+
 def load_strava_activities():
     """Load latest Strava activities"""
     latest = DATA_DIR / "activities_latest.json"
@@ -21,21 +28,34 @@ def load_strava_activities():
             return json.load(f)
     return []
 
-def parse_strava_health():
-    """Parse Strava data into health format"""
-    activities = load_strava_activities()
-    
-    if not activities:
+def load_strava_range(start, end):
+    """Strava activities that started between start and end inclusive (date-indexed)"""
+    return get_index().range(start, end)
+
+def parse_strava_health(target_date=None):
+    """Parse Strava data into health format (today by default)"""
+    index = get_index()
+    if not index.count():
         return None
     
-    today = date.today()
-    today_str = today.isoformat()
-    
-    # Find today's activities
-    today_activities = [
-        a for a in activities 
-        if a.get("start_date", "").startswith(today_str)
-    ]
+    day = target_date or date.today()
+    return build_strava_health(day, index.day(day))
+
+def training_load(activity, threshold_hr=THRESHOLD_HR):
+    """Training load of one activity: Strava's Relative Effort (suffer_score)
+    when present, else heart-rate TSS (hours x (avg HR / threshold)^2 x 100),
+    else 0"""
+    if activity.get("suffer_score") is not None:
+        return round(float(activity["suffer_score"]), 1)
+    hr = activity.get("average_heartrate")
+    if hr:
+        hours = (activity.get("moving_time", 0) or 0) / 3600
+        return round(hours * (hr / threshold_hr) ** 2 * 100, 1)
+    return 0.0
+
+def build_strava_health(day, day_activities):
+    """Health record for one day from the Strava activities that started on it"""
+    today_str = str(day)
     
     data = {
         "date": today_str,
@@ -50,8 +70,9 @@ def parse_strava_health():
     total_distance = 0
     total_duration = 0
     total_calories = 0
+    total_load = 0.0
     
-    for a in today_activities:
+    for a in day_activities:
         dist = a.get("distance", 0) or 0
         dur = a.get("moving_time", 0) or 0
         cal = a.get("calories", 0) or 0
@@ -59,6 +80,7 @@ def parse_strava_health():
         total_distance += dist
         total_duration += dur
         total_calories += cal
+        total_load += training_load(a)
         
         # Log as workout
         data["workouts"].append({
@@ -73,11 +95,12 @@ def parse_strava_health():
         "distance_meters": total_distance,
         "duration_seconds": total_duration,
         "calories": total_calories,
-        "activity_count": len(today_activities)
+        "activity_count": len(day_activities),
+        "training_load": round(total_load, 1)
     }
     
     # Note: Strava alone doesn't provide sleep/recovery
-    data["note"] = "Strava data only. Connect Garmin for sleep/recovery."
+    data["note"] = NOTE
     
     return data
 
@@ -111,7 +134,20 @@ def format_strava_brief(data):
     
     return "\n".join(brief)
 
+def save_strava_health(data):
+    """Store the Strava record for data['date'] alongside other sources
+
+    It becomes the day's "strava" source row; the merged daily record keeps
+    Garmin's sleep/recovery and dedupes workouts both sources recorded.
+    """
+    get_store().put(data)
+    return data
+
 # CLI test
 if __name__ == "__main__":
+    import sys
+
     data = parse_strava_health()
+    if data and "--save" in sys.argv:
+        save_strava_health(data)
     print(format_strava_brief(data))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Strava Activity Index for Health Tracker Skill
+Streams the Strava JSON export once into date-sorted JSON lines plus a day index, so lookups read only matching activities
+"""
+
+import bisect
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+
+# Paths
+SOURCE_FILE = Path("/home/clawd/.openclaw/workspace/data/strava/activities_latest.json")
+HEALTH_DIR = Path("/home/clawd/.openclaw/workspace-ceo/memory/health")
+LINES_FILE = HEALTH_DIR / "strava-activities.jsonl"
+INDEX_FILE = HEALTH_DIR / "strava-activities.idx.json"
+
+CHUNK_SIZE = 1 << 20
+
+
+def _day(value):
+    """Normalize a date, datetime or ISO string to 'YYYY-MM-DD'"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """Yield the objects of a top-level JSON array, reading chunk_size at a time
+
+    Only the current chunk and the object being decoded are held in memory.
+    Elements are expected to be objects or arrays (a bare number split at a
+    chunk boundary would decode short).
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, pos, eof = "", 0, False
+
+        def fill():
+            nonlocal buf, pos, eof
+            more = f.read(chunk_size)
+            eof = not more
+            buf, pos = buf[pos:] + more, 0
+            return not eof
+
+        def next_token(skip):
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in skip:
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return buf[pos] if pos < len(buf) else ""
+
+        if next_token(" \t\r\n") != "[":
+            raise ValueError(f"{path}: expected a JSON array")
+        pos += 1
+        while True:
+            token = next_token(" \t\r\n,")
+            if token == "]":
+                return
+            if not token:
+                raise ValueError(f"{path}: unterminated JSON array")
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            yield item
+            pos = end
+            if pos >= chunk_size:
+                buf, pos = buf[pos:], 0
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class StravaIndex:
+    """Date-indexed view of the Strava export
+
+    build() streams the export into lines_file, one activity per line sorted
+    by start date, and writes index_file with [day, start_offset, end_offset]
+    per active day plus the export's size/mtime. Lookups bisect the day list
+    and read one contiguous byte range. The index is rebuilt automatically
+    when the export changes.
+    """
+
+    def __init__(self, source=SOURCE_FILE, lines_file=LINES_FILE, index_file=INDEX_FILE):
+        self.source = Path(source)
+        self.lines_file = Path(lines_file)
+        self.index_file = Path(index_file)
+        self._index = None
+        self._keys = None
+
+    def _load(self):
+        """The current index, rebuilding it if the export changed; None without an export"""
+        if not self.source.exists():
+            return None
+        signature = _signature(self.source)
+        if self._index is None and self.index_file.exists():
+            with open(self.index_file, "r") as f:
+                self._index = json.load(f)
+        index = self._index
+        if (index is None or index["source"] != signature or not self.lines_file.exists()
+                or self.lines_file.stat().st_size != index["size"]):
+            index = self.build()
+        if self._keys is None:
+            self._keys = [entry[0] for entry in index["days"]]
+        return index
+
+    def build(self):
+        """Convert the export to sorted JSON lines and write the day index"""
+        self.lines_file.parent.mkdir(parents=True, exist_ok=True)
+        signature = _signature(self.source)
+        scratch = self.lines_file.with_suffix(".unsorted")
+        spans = []
+        with open(scratch, "wb") as out:
+            for activity in iter_json_array(self.source):
+                line = json.dumps(activity, separators=(",", ":")).encode("utf-8") + b"\n"
+                spans.append((activity.get("start_date") or "", out.tell(), len(line)))
+                out.write(line)
+
+        # Stable sort keeps export order within a start time
+        spans.sort(key=lambda span: span[0])
+        days = []
+        tmp = self.lines_file.with_suffix(".tmp")
+        with open(scratch, "rb") as src, open(tmp, "wb") as out:
+            for start_date, offset, length in spans:
+                day = start_date[:10]
+                position = out.tell()
+                if days and days[-1][0] == day:
+                    days[-1][2] = position + length
+                else:
+                    days.append([day, position, position + length])
+                src.seek(offset)
+                out.write(src.read(length))
+            size = out.tell()
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, self.lines_file)
+        scratch.unlink()
+
+        index = {"source": signature, "size": size, "count": len(spans), "days": days}
+        tmp = self.index_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp, self.index_file)
+        self._index, self._keys = index, None
+        return index
+
+    def dates(self):
+        """Days with at least one activity, oldest first"""
+        return list(self._keys) if self._load() else []
+
+    def count(self):
+        """Number of activities in the export, or None without an export"""
+        index = self._load()
+        return index["count"] if index else None
+
+    def iter_range(self, start, end):
+        """Yield activities with start <= start date <= end, oldest first, a line at a time"""
+        index = self._load()
+        if not index or not index["days"]:
+            return
+        days = index["days"]
+        lo = bisect.bisect_left(self._keys, _day(start))
+        hi = bisect.bisect_right(self._keys, _day(end))
+        if lo >= hi:
+            return
+        with open(self.lines_file, "rb") as f:
+            f.seek(days[lo][1])
+            remaining = days[hi - 1][2] - days[lo][1]
+            while remaining > 0:
+                line = f.readline()
+                remaining -= len(line)
+                yield json.loads(line)
+
+    def range(self, start, end):
+        """Activities with start <= start date <= end, oldest first"""
+        index = self._load()
+        if not index or not index["days"]:
+            return []
+        days = index["days"]
+        lo = bisect.bisect_left(self._keys, _day(start))
+        hi = bisect.bisect_right(self._keys, _day(end))
+        if lo >= hi:
+            return []
+        with open(self.lines_file, "rb") as f:
+            f.seek(days[lo][1])
+            chunk = f.read(days[hi - 1][2] - days[lo][1])
+        return [json.loads(line) for line in chunk.splitlines()]
+
+    def day(self, value):
+        """Activities that started on one day"""
+        return self.range(value, value)
+
+
+_default_index = None
+
+
+def get_index():
+    """Process-wide index over SOURCE_FILE"""
+    global _default_index
+    if _default_index is None:
+        _default_index = StravaIndex()
+    return _default_index
+
+
+# CLI: (re)build the index
+if __name__ == "__main__":
+    index = StravaIndex()
+    if not index.source.exists():
+        print(f"[strava-index] No export at {index.source}")
+    else:
+        built = index.build()
+        print(f"[strava-index] Indexed {built['count']} activities over {len(built['days'])} day(s) "
+              f"into {index.lines_file}")
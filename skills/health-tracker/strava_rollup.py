@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Strava Rollups for Health Tracker Skill
+Daily, weekly and per-activity-type totals (incl. training load) over a date range in one grouped pass
+"""
+
+from datetime import date, datetime, timedelta
+
+from strava_adapter import NOTE, training_load
+from strava_index import get_index
+
+
+def _totals():
+    return {"distance_meters": 0, "duration_seconds": 0, "calories": 0, "activity_count": 0, "training_load": 0.0}
+
+
+def _add(totals, dist, dur, cal, load):
+    totals["distance_meters"] += dist
+    totals["duration_seconds"] += dur
+    totals["calories"] += cal
+    totals["activity_count"] += 1
+    totals["training_load"] += load
+
+
+def _finish(totals):
+    totals["training_load"] = round(totals["training_load"], 1)
+    return totals
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+def _day_record(day, totals, workouts):
+    """Same schema as strava_adapter.build_strava_health"""
+    return {"date": day, "source": "strava", "sleep": {}, "recovery": {},
+            "activity": _finish(totals), "workouts": workouts, "note": NOTE}
+
+
+def rollup_activities(activities, start, end, include_empty=True):
+    """Roll up Strava activities over start..end in a single pass
+
+    activities must be ordered by start_date (as StravaIndex returns them);
+    those outside the range are skipped. Returns::
+
+        {"start", "end",
+         "days": [daily health records, as build_strava_health makes them],
+         "weeks": [{"week": "YYYY-Www", "start", "end", "activity": totals,
+                    "by_type": {type: totals}}],
+         "by_type": {type: totals},
+         "activity": totals over the whole range}
+
+    where totals are {distance_meters, duration_seconds, calories,
+    activity_count, training_load}. include_empty adds zero records for days
+    (and weeks) without activities, matching parse_strava_health on those
+    days.
+    """
+    first, last = _as_date(start), _as_date(end)
+    lo, hi = first.isoformat(), last.isoformat()
+    days, weeks, by_type, overall = [], [], {}, _totals()
+    current, day_totals, workouts = None, None, None
+    week, week_end = None, None
+
+    def open_week(day):
+        nonlocal week, week_end
+        iso = day.isocalendar()
+        week_start = day - timedelta(days=iso.weekday - 1)
+        week_end = week_start + timedelta(days=6)
+        week = {"week": f"{iso.year}-W{iso.week:02d}", "start": str(max(week_start, first)),
+                "end": str(min(week_end, last)), "activity": _totals(), "by_type": {}}
+        weeks.append(week)
+
+    def ensure_week(day):
+        if week is None or day > week_end:
+            open_week(day)
+
+    def fill_empty(until):
+        """Zero records from the day after current through until (include_empty only)"""
+        step = current + timedelta(days=1) if current is not None else first
+        while include_empty and step <= until:
+            ensure_week(step)
+            days.append(_day_record(step.isoformat(), _totals(), []))
+            step += timedelta(days=1)
+
+    def close_day():
+        if current is not None:
+            days.append(_day_record(current.isoformat(), day_totals, workouts))
+
+    for a in activities:
+        start_date = a.get("start_date", "")
+        key = start_date[:10]
+        if key < lo or key > hi:
+            continue
+        if current is None or key != current.isoformat():
+            day = date.fromisoformat(key)
+            close_day()
+            fill_empty(day - timedelta(days=1))
+            ensure_week(day)
+            current, day_totals, workouts = day, _totals(), []
+        dist = a.get("distance", 0) or 0
+        dur = a.get("moving_time", 0) or 0
+        cal = a.get("calories", 0) or 0
+        load = training_load(a)
+        kind = a.get("type", "Activity")
+        _add(day_totals, dist, dur, cal, load)
+        _add(week["activity"], dist, dur, cal, load)
+        _add(week["by_type"].setdefault(kind, _totals()), dist, dur, cal, load)
+        _add(by_type.setdefault(kind, _totals()), dist, dur, cal, load)
+        _add(overall, dist, dur, cal, load)
+        workouts.append({"type": kind, "duration_min": int(dur / 60), "distance": dist, "timestamp": start_date})
+    close_day()
+    fill_empty(last)
+
+    for w in weeks:
+        _finish(w["activity"])
+        for totals in w["by_type"].values():
+            _finish(totals)
+    for totals in by_type.values():
+        _finish(totals)
+    return {"start": lo, "end": hi, "days": days, "weeks": weeks, "by_type": by_type, "activity": _finish(overall)}
+
+
+def rollup_strava(start, end, include_empty=True):
+    """Rollups over start..end read from the date-indexed Strava export"""
+    return rollup_activities(get_index().iter_range(start, end), start, end, include_empty)
+
+
+def format_rollup(result):
+    """Weekly lines plus per-type totals for a rollup"""
+    lines = [f"🏃 STRAVA ROLLUP — {result['start']} to {result['end']}", ""]
+    for week in result["weeks"]:
+        a = week["activity"]
+        lines.append(f"{week['week']}: {a['activity_count']} activities | {a['distance_meters'] / 1000:.1f} km | "
+                     f"{a['duration_seconds'] / 3600:.1f} h | load {a['training_load']:.0f}")
+    lines.append("")
+    for kind, a in sorted(result["by_type"].items(), key=lambda item: -item[1]["training_load"]):
+        lines.append(f"{kind}: {a['activity_count']} | {a['distance_meters'] / 1000:.1f} km | "
+                     f"{a['duration_seconds'] / 3600:.1f} h | load {a['training_load']:.0f}")
+    total = result["activity"]
+    lines.append(f"Total: {total['activity_count']} activities | {total['distance_meters'] / 1000:.1f} km | "
+                 f"load {total['training_load']:.0f}")
+    return "\n".join(lines)
+
+
+# CLI: python3 strava_rollup.py [START [END]]  (default: last 28 days)
+if __name__ == "__main__":
+    import sys
+
+    end = sys.argv[2] if len(sys.argv) > 2 else date.today()
+    start = sys.argv[1] if len(sys.argv) > 1 else _as_date(end) - timedelta(days=27)
+    print(format_rollup(rollup_strava(start, end)))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Workout Journal for Health Tracker Skill
+Manually logged workouts in the health store's date-indexed workouts table (one INSERT per log, locked by SQLite)
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+from health_store import get_store
+
+# Paths
+WORKSPACE = Path("/home/clawd/.openclaw/workspace-ceo")
+DATA_DIR = WORKSPACE / "memory/health"
+# Append-only JSON-lines journal used before the workouts table; imported once on first use
+JOURNAL_FILE = DATA_DIR / "workouts.jsonl"
+
+
+def _day(day):
+    if isinstance(day, datetime):
+        day = day.date()
+    return str(day or date.today())
+
+
+def _store(store=None):
+    """store, else the process-wide store with the legacy journal imported into it"""
+    if store is not None:
+        return store
+    store = get_store()
+    import_journal(JOURNAL_FILE, store)
+    return store
+
+
+def append_workouts(workouts, day=None, store=None):
+    """Log several workouts for day (default today, or each workout's own "date") in one transaction"""
+    rows = [(_day(w.get("date", day)), {k: v for k, v in w.items() if k != "date"}) for w in workouts]
+    if rows:
+        _store(store).add_workouts(rows)
+
+
+def append_workout(workout, day=None, store=None):
+    """Log one workout for day (default today); one INSERT, never rewrites the day"""
+    append_workouts([workout], day, store)
+
+
+def read_workouts(start=None, end=None, store=None):
+    """Workouts grouped by date: {'YYYY-MM-DD': [workout, ...]} for start <= date <= end (one indexed query)"""
+    return _store(store).workouts(start, end)
+
+
+def _read_entries(path):
+    """Parsed journal entries in append order, skipping torn or invalid lines"""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and "date" in entry:
+                entries.append(entry)
+    return entries
+
+
+def import_journal(path, store=None):
+    """Copy a JSON-lines workout journal into the store, once per file
+
+    The file is left in place; the import is recorded in the store's meta
+    table in the same transaction, so running it again (or from two processes
+    at once) adds nothing. Returns the number of workouts imported.
+    """
+    store = store or get_store()
+    path = Path(path)
+    key = f"journal_imported:{path.resolve()}"
+    if store.get_meta(key) is not None:
+        return 0
+    entries = _read_entries(path) if path.exists() else []
+    return store.add_workouts([(entry.pop("date"), entry) for entry in entries], once=key)
+
+
+# CLI: import a JSON-lines journal
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "import":
+        path = Path(sys.argv[2]) if len(sys.argv) > 2 else JOURNAL_FILE
+        print(f"[health-tracker] Imported {import_journal(path)} workout(s) from {path}")
+    else:
+        print("Usage: python3 workout_journal.py import [JOURNAL]")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Opt-in stage profiling shared by the market brief and the Garmin sync.
+
+With profiling off (the default) a pipeline gets ``NULL``, whose
+``stage()`` returns one shared no-op context manager and whose ``calls()``
+hands back the function unchanged, so the only cost is a method call per
+stage. Each pipeline turns it on with its own flags or environment prefix
+(MARKET_PROFILE for market_analysis.py, HEALTH_PROFILE for garmin.py):
+
+    <PREFIX>=1                  JSON record on stderr
+    <PREFIX>=FILE               JSON record appended to FILE as one line
+    <PREFIX>_CPROFILE=F         also dump cProfile stats to F (python3 -m pstats F)
+
+The record holds wall time, entry counts and peak traced memory per stage,
+call counts and time for wrapped per-item functions, and the process's
+overall peak memory. Memory is traced with tracemalloc, which slows the run
+down; compare stage times between profiled runs, not against unprofiled ones.
+"""
+
+import cProfile
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+_NULL_STAGE = nullcontext()
+
+
+class NullProfiler:
+    """Profiling switched off: stages are a shared no-op context, calls() returns fn itself"""
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def calls(self, name, fn):
+        return fn
+
+    def finish(self, **fields):
+        return None
+
+
+class Profiler:
+    """Per-stage wall time, entry counts and peak traced memory for one pipeline run
+
+    stage(name) times a block; entering the same name again adds to its
+    totals. Stages may nest: an outer stage's peak includes its inner ones.
+    calls(name, fn) wraps a per-item function (a series job, a fetch) to count
+    and time its calls from any thread. finish() stops tracing and writes the
+    record to out ("-" for stderr, else appended to the file as one line);
+    cprofile_path, when set, profiles the whole run and dumps stats there.
+    """
+
+    enabled = True
+
+    def __init__(self, pipeline, out="-", cprofile_path=None, trace_memory=True):
+        self.pipeline = pipeline
+        self.out = out
+        self.cprofile_path = cprofile_path
+        self.trace_memory = trace_memory and not tracemalloc.is_tracing()
+        self.stages = {}
+        self.counters = {}
+        self._peaks = [0]
+        self._lock = threading.Lock()
+        self._started = datetime.now(timezone.utc)
+        if self.trace_memory:
+            tracemalloc.start()
+        self._cprofile = None
+        if cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._t0 = time.perf_counter()
+
+    def _peak(self):
+        return tracemalloc.get_traced_memory()[1] if self.trace_memory else 0
+
+    @contextmanager
+    def stage(self, name):
+        # Fold the peak so far into the enclosing stage, then measure this one from zero
+        self._peaks[-1] = max(self._peaks[-1], self._peak())
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self._peaks.append(0)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            peak = max(self._peaks.pop(), self._peak())
+            self._peaks[-1] = max(self._peaks[-1], peak)
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+            entry = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "peak_bytes": 0})
+            entry["calls"] += 1
+            entry["seconds"] += elapsed
+            entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+
+    def calls(self, name, fn):
+        counter = self.counters.setdefault(name, {"calls": 0, "seconds": 0.0})
+        lock = self._lock
+
+        def counted(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - t0
+                with lock:
+                    counter["calls"] += 1
+                    counter["seconds"] += elapsed
+        return counted
+
+    def record(self, **fields):
+        """The run so far as a JSON-ready dict; fields are added at the top level"""
+        return {
+            "pipeline": self.pipeline,
+            "started": self._started.isoformat(timespec="seconds"),
+            "seconds": time.perf_counter() - self._t0,
+            "peak_traced_bytes": max(self._peaks[0], self._peak()) if self.trace_memory else None,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "stages": [dict(name=name, **entry) for name, entry in self.stages.items()],
+            "calls": [dict(name=name, **entry) for name, entry in self.counters.items()],
+            "cprofile": self.cprofile_path,
+            **fields,
+        }
+
+    def finish(self, **fields):
+        """Stop profiling, write the record (and cProfile stats) and return the record"""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+        record = self.record(**fields)
+        if self.trace_memory:
+            tracemalloc.stop()
+        line = json.dumps(record, default=str)
+        if self.out == "-":
+            print(line, file=sys.stderr)
+        else:
+            with open(self.out, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return record
+
+
+NULL = NullProfiler()
+
+
+def _setting(value):
+    """None for unset or off ("", 0, false, no, off), else the value"""
+    return None if value is None or value.strip().lower() in ("", "0", "false", "no", "off") else value
+
+
+def get_profiler(pipeline, out=None, cprofile_path=None, env_prefix="PROFILE", environ=os.environ):
+    """A Profiler when asked for by argument or <env_prefix> / <env_prefix>_CPROFILE, else NULL"""
+    out = out or _setting(environ.get(env_prefix))
+    cprofile_path = cprofile_path or _setting(environ.get(f"{env_prefix}_CPROFILE"))
+    if not out and not cprofile_path:
+        return NULL
+    if out is None or out.lower() in ("1", "true", "yes", "on"):
+        out = "-"
+    return Profiler(pipeline, out, cprofile_path)
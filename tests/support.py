@@ -0,0 +1,60 @@
+"""
+Shared setup for the test suite.
+
+Puts the repo root (market modules), the health-tracker skill and the
+benchmarks directory (synthetic data generators, FakeGarminClient) on
+sys.path, the same way the benchmarks do.
+
+Run with: python3 -m unittest discover tests   (or: python3 -m pytest tests)
+"""
+
+import math
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT / "benchmarks", ROOT / "skills/health-tracker", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def assert_close(test, a, b, path="result"):
+    """Recursive equality, with floats compared to 1e-7 relative and NaN equal to NaN"""
+    if isinstance(a, dict):
+        test.assertEqual(a.keys(), b.keys(), path)
+        for k in a:
+            assert_close(test, a[k], b[k], f"{path}[{k!r}]")
+    elif isinstance(a, float) and isinstance(b, float):
+        test.assertTrue((math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=1e-7, abs_tol=1e-9),
+                        (path, a, b))
+    else:
+        test.assertEqual(a, b, path)
+
+
+def health_sandbox(test):
+    """Point the health store, journal and tracker paths at a temp dir for one test; returns the dir"""
+    import health_store
+    import health_tracker
+    import workout_journal
+
+    tmp = tempfile.TemporaryDirectory(prefix="test_health_")
+    test.addCleanup(tmp.cleanup)
+    directory = Path(tmp.name)
+    saved = [(module, name, getattr(module, name)) for module, name in (
+        (health_store, "DB_FILE"), (health_store, "DATA_DIR"), (health_store, "_default_store"),
+        (workout_journal, "JOURNAL_FILE"), (health_tracker, "DATA_DIR"), (health_tracker, "BASELINE_FILE"))]
+    health_store.DB_FILE = directory / "health.db"
+    health_store.DATA_DIR = directory
+    health_store._default_store = None
+    workout_journal.JOURNAL_FILE = directory / "workouts.jsonl"
+    health_tracker.DATA_DIR = directory
+    health_tracker.BASELINE_FILE = directory / "health-baseline.json"
+
+    def restore():
+        if health_store._default_store is not None:
+            health_store._default_store.close()
+        for module, name, value in saved:
+            setattr(module, name, value)
+    test.addCleanup(restore)
+    return directory
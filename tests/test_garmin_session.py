@@ -0,0 +1,122 @@
+"""GarminSession token cache across sync runs and threads"""
+
+import json
+import tempfile
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+
+import support  # noqa: F401  (sys.path)
+
+import garmin_session
+from bench_garmin_session import INTERVAL, TOKEN_TTL, Clock, make_factory
+from garmin_session import GarminSession, SessionClient
+
+CREDS = {"email": "me@example.com", "password": "pw"}
+
+
+class GarminSessionTest(unittest.TestCase):
+    def test_threads_share_one_client_and_login(self):
+        clock = Clock()
+        built = []
+        session = GarminSession(dict(CREDS), make_factory(clock, 0.02, built), clock=clock)
+        clients = []
+        workers = [threading.Thread(target=lambda: clients.append(session.client())) for _ in range(8)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        self.assertEqual(len(built), 1)
+        self.assertEqual(built[0].logins, 1)
+        self.assertTrue(all(c is built[0] for c in clients))
+
+        # Expiry inside a long-running process: the next call logs in again on the same client
+        clock.now += TOKEN_TTL
+        self.assertIs(session.client(), built[0])
+        self.assertEqual(built[0].logins, 2)
+
+    def sync_runs(self, runs, cached):
+        """Logins over runs fresh processes, each loading the credentials file and fetching one day"""
+        clock = Clock()
+        built = []
+        factory = make_factory(clock, 0, built)
+        with tempfile.TemporaryDirectory(prefix="test_session_") as tmp:
+            creds_file = Path(tmp) / "garmin-credentials.json"
+            creds_file.write_text(json.dumps(CREDS))
+
+            def save(creds):
+                creds_file.write_text(json.dumps(creds))
+
+            for _ in range(runs):
+                session = GarminSession(json.loads(creds_file.read_text()), factory,
+                                        save=save if cached else None, clock=clock)
+                before = len(built)
+                for fetch in ("get_daily_summary_data", "get_sleep_data", "get_stress_details"):
+                    getattr(session.client(), fetch)(date(2026, 2, 23))
+                self.assertEqual(len(built) - before, 1, "one client per process")
+                clock.now += INTERVAL
+        return sum(c.logins for c in built)
+
+    def test_cached_token_is_reused_until_expiry(self):
+        runs = 24
+        runs_per_token = -(-(TOKEN_TTL - garmin_session.EXPIRY_MARGIN) // INTERVAL)
+        self.assertEqual(self.sync_runs(runs, cached=False), runs)
+        self.assertEqual(self.sync_runs(runs, cached=True), -(-runs // runs_per_token))
+
+
+class AuthRetryTest(unittest.TestCase):
+    """Calls through SessionClient log in again and retry once when the API rejects the session"""
+
+    def setUp(self):
+        self.clock = Clock()
+        self.built = []
+        self.session = GarminSession(dict(CREDS), make_factory(self.clock, 0.02, self.built), clock=self.clock)
+        self.client = SessionClient(self.session)
+        self.client.get_sleep_data(date(2026, 2, 23))
+        # Revoked upstream while the cached session still looks valid
+        self.built[0].session["expires_at"] = self.clock()
+
+    def test_rejected_session_logs_in_again(self):
+        self.assertEqual(self.client.get_sleep_data(date(2026, 2, 23))["calendarDate"], "2026-02-23")
+        self.assertEqual(self.built[0].logins, 2)
+        self.assertEqual(self.session.logins, 2)
+
+    def test_concurrent_rejections_share_one_login(self):
+        results = []
+        workers = [threading.Thread(target=lambda: results.append(self.client.get_stress_details(date(2026, 2, 23))))
+                   for _ in range(8)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        self.assertEqual(len(results), 8)
+        self.assertEqual(self.built[0].logins, 2)
+
+    def test_other_errors_are_not_retried(self):
+        self.built[0].session["expires_at"] = self.clock() + TOKEN_TTL
+        self.built[0].fail_every = 1  # first attempt at a new day always times out
+        with self.assertRaises(ConnectionError):
+            self.client.get_sleep_data(date(2026, 2, 24))
+        self.assertEqual(self.built[0].logins, 1)
+
+    def test_client_without_login_is_rebuilt(self):
+        built = []
+
+        class Client:
+            def __init__(self, email, password):
+                built.append(self)
+                self.rejected = len(built) == 1
+
+            def get_sleep_data(self, day):
+                if self.rejected:
+                    raise PermissionError("401 Unauthorized")
+                return {"calendarDate": str(day)}
+
+        client = SessionClient(GarminSession(dict(CREDS), Client))
+        self.assertEqual(client.get_sleep_data(date(2026, 2, 23)), {"calendarDate": "2026-02-23"})
+        self.assertEqual(len(built), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Garmin backfill and conditional sync (garmin_sync) sharing the store's sync_state"""
+
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import support  # noqa: F401  (sys.path)
+
+import garmin_sync
+from bench_garmin_backfill import UNLIMITED, parse
+from fake_garmin import FakeGarminClient
+from health_store import HealthStore
+
+END = date.today()  # not settled yet when the backfill runs
+
+
+class BackfillSyncStateTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix="test_garmin_sync_")
+        self.addCleanup(tmp.cleanup)
+        self.store = HealthStore(Path(tmp.name) / "health.db")
+        self.addCleanup(self.store.close)
+        self.client = FakeGarminClient(latency=0, jitter=0, fail_every=0)
+        stats = garmin_sync.backfill(self.client, END - timedelta(days=3), END, parse, self.store,
+                                     workers=4, rate_limits=UNLIMITED, log=lambda m: None)
+        self.assertEqual(stats["saved"], 4)
+
+    def sync(self, day, now):
+        return garmin_sync.sync_day(self.client, day, self.store, parse, now=now, log=lambda m: None)
+
+    def test_backfill_records_payload_hashes(self):
+        state = self.store.sync_state(END)
+        self.assertEqual(set(state), set(garmin_sync.ENDPOINTS))
+        self.assertEqual(state["sleep"][0], garmin_sync.payload_hash(self.client.get_sleep_data(END)))
+
+    def test_sync_after_backfill_skips_unchanged(self):
+        record = self.store.get(END)
+        stats = self.sync(END, datetime.now())
+        self.assertEqual((stats["fetched"], stats["written"], stats["changed"]), (3, 0, []))
+        self.assertEqual(self.store.get(END), record)
+
+        self.client.revisions["sleep"] = 1
+        stats = self.sync(END, datetime.now())
+        self.assertEqual(stats["changed"], ["sleep"])
+
+    def test_settled_backfilled_day_is_not_fetched_again(self):
+        stats = self.sync(END - timedelta(days=3), datetime.now())
+        self.assertEqual(stats["fetch_skipped"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Multi-source merge (health_merge) and the store paths that apply it"""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+import support  # noqa: F401  (sys.path)
+
+from bench_health_merge import START, generate
+from health_merge import dedupe_workouts, merge_day
+from health_store import HealthStore
+
+DAYS = 240
+
+
+class MergeDayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.garmin, cls.strava, cls.sessions = generate(DAYS)
+        grouped = {}
+        for record in cls.garmin + cls.strava:
+            grouped.setdefault(record["date"], []).append(record)
+        cls.reference = [merge_day(grouped[d]) for d in sorted(grouped)]
+
+    def test_sessions_kept_once_with_precedence(self):
+        by_source = {"garmin": {r["date"]: r for r in self.garmin}, "strava": {r["date"]: r for r in self.strava}}
+        conflicts = 0
+        for record in self.reference:
+            day = record["date"]
+            g, s = by_source["garmin"].get(day), by_source["strava"].get(day)
+            ids = [w["id"] for w in record.get("workouts", [])]
+            expected = [sid for sid in self.sessions[day]
+                        if any(w["id"] == sid for r in (g, s) if r for w in r["workouts"])]
+            self.assertEqual(sorted(ids), sorted(expected), day)
+            if not (g and s):
+                self.assertEqual(record, g or s, day)
+                continue
+            conflicts += 1
+            self.assertEqual(record["source"], "garmin+strava")
+            self.assertNotIn("note", record)
+            self.assertEqual(record["sleep"], g["sleep"])
+            self.assertEqual(record["recovery"], g["recovery"])
+            self.assertEqual(record["activity"]["steps"], g["activity"]["steps"])
+            self.assertEqual(record["activity"]["calories"], g["activity"]["calories"])
+            self.assertEqual(record["activity"]["duration_seconds"], s["activity"]["duration_seconds"])
+            distance = g["activity"]["distance_meters"]
+            self.assertEqual(record["activity"]["distance_meters"],
+                             distance if distance is not None else s["activity"]["distance_meters"])
+            for w in record["workouts"]:
+                in_strava = any(x["id"] == w["id"] for x in s["workouts"])
+                self.assertEqual(w["source"], "strava" if in_strava else "garmin")
+                if in_strava and any(x["id"] == w["id"] for x in g["workouts"]):
+                    # filled from the dropped duplicate
+                    self.assertIn("calories", w)
+                    self.assertIn("distance", w)
+        self.assertGreater(conflicts, 0)
+
+    def test_store_write_paths_agree(self):
+        end = START + timedelta(days=DAYS - 1)
+        with tempfile.TemporaryDirectory(prefix="test_merge_") as tmp:
+            incremental = HealthStore(Path(tmp) / "incremental.db")
+            for record in self.garmin + self.strava:
+                incremental.put(record)
+            self.assertEqual(incremental.range(START, end), self.reference)
+            incremental.close()
+
+            bulk = HealthStore(Path(tmp) / "bulk.db")
+            bulk.put_many(self.garmin + self.strava)
+            self.assertEqual(bulk.range(START, end), self.reference)
+            with bulk.conn:
+                bulk.conn.execute("DELETE FROM daily_health")
+            self.assertEqual(bulk.merge_range(START, end), len(self.reference))
+            self.assertEqual(bulk.range(START, end), self.reference)
+            bulk.close()
+
+
+class LocalTimeTest(unittest.TestCase):
+    """Naive timestamps are local time, compared with Strava's UTC start_date"""
+
+    def setUp(self):
+        saved = os.environ.get("TZ")
+
+        def restore():
+            if saved is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = saved
+            time.tzset()
+        self.addCleanup(restore)
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+
+    def test_local_and_utc_times_of_one_session(self):
+        strava = {"type": "Run", "duration_min": 30, "timestamp": "2026-02-23T12:00:00Z"}
+        same_run = {"type": "Run", "duration_min": 31, "timestamp": "2026-02-23T07:01:00", "feel": "easy"}
+        later = {"type": "Run", "duration_min": 30, "timestamp": "2026-02-23T12:00:00"}
+        merged = dedupe_workouts([("strava", strava), ("manual", same_run), ("manual", later)])
+        self.assertEqual([w["source"] for w in merged], ["strava", "manual"])
+        self.assertEqual(merged[0]["feel"], "easy")
+
+
+if __name__ == "__main__":
+    unittest.main()
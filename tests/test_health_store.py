@@ -0,0 +1,40 @@
+"""HealthStore setup: first-use migration of per-day JSON files"""
+
+import contextlib
+import io
+import json
+import unittest
+
+from support import health_sandbox
+
+import health_store
+
+
+class GetStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = health_sandbox(self)
+
+    def test_unreadable_json_files_are_skipped(self):
+        (self.dir / "2026-02-21.json").write_text(json.dumps({"source": "garmin", "sleep": {"score": 80}}))
+        (self.dir / "2026-02-22.json").write_text('{"date": "2026-02-22", "sleep": {"sco')  # torn write
+        (self.dir / "2026-02-23.json").write_text("[]")
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            store = health_store.get_store()
+        self.assertEqual(store.dates(), ["2026-02-21"])
+        self.assertIn("2026-02-22.json", stderr.getvalue())
+        self.assertIn("2026-02-23.json", stderr.getvalue())
+        self.assertIsNotNone(store.get_meta("json_migrated"))
+
+        # The migration is done: a new process opens the store without retrying the bad files
+        store.close()
+        health_store._default_store = None
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(health_store.get_store().dates(), ["2026-02-21"])
+        self.assertEqual(stderr.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
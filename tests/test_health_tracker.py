@@ -0,0 +1,46 @@
+"""health_tracker loading: store records combined with journaled workouts"""
+
+import unittest
+from datetime import date
+
+from support import health_sandbox
+
+import health_tracker
+from health_store import get_store
+from workout_journal import append_workout
+
+DAY = date(2026, 2, 23)
+
+
+class JournaledWorkoutsTest(unittest.TestCase):
+    def setUp(self):
+        health_sandbox(self)
+        get_store().put({"date": str(DAY), "source": "garmin", "sleep": {"score": 80},
+                         "workouts": [{"type": "Run", "duration_min": 30, "timestamp": "2026-02-23T07:00:00",
+                                       "distance": 5000}]})
+        # The same run logged by hand, and an evening session only logged by hand
+        append_workout({"type": "Run", "duration_min": 28, "timestamp": "2026-02-23T07:03:00", "feel": "easy"}, DAY)
+        append_workout({"type": "Strength", "duration_min": 45, "timestamp": "2026-02-23T18:00:00"}, DAY)
+
+    def check(self, record):
+        workouts = record["workouts"]
+        self.assertEqual([(w["type"], w["source"]) for w in workouts], [("Run", "garmin"), ("Strength", "manual")])
+        self.assertEqual(workouts[0]["duration_min"], 30)
+        self.assertEqual(workouts[0]["feel"], "easy")  # filled in from the dropped manual duplicate
+
+    def test_load_daily_health_dedupes_manual_workouts(self):
+        self.check(health_tracker.load_daily_health(DAY))
+
+    def test_load_health_range_dedupes_manual_workouts(self):
+        (record,) = health_tracker.load_health_range(DAY, DAY)
+        self.check(record)
+
+    def test_journal_only_day(self):
+        append_workout({"type": "Swim", "duration_min": 40, "timestamp": "2026-02-22T12:00:00"}, "2026-02-22")
+        record = health_tracker.load_daily_health(date(2026, 2, 22))
+        self.assertEqual(record["source"], "manual")
+        self.assertEqual([w["type"] for w in record["workouts"]], ["Swim"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+"""IntentRouter (intent_router.classify) against the original handle_query if-chain"""
+
+import random
+import unittest
+
+from support import health_sandbox
+
+from bench_intent_router import legacy_classify, make_corpus
+from intent_router import classify
+
+
+class IntentRouterTest(unittest.TestCase):
+    def test_agrees_with_if_chain(self):
+        corpus = make_corpus(20_000, random.Random(14))
+        mismatches = [(m, legacy_classify(m), classify(m)) for m in corpus if legacy_classify(m) != classify(m)]
+        self.assertEqual(mismatches, [])
+
+    def test_router_and_parsers_agree_on_digits(self):
+        health_sandbox(self)
+        from health_tracker import parse_range_query, parse_workout_log
+
+        for message in ("30 min run", "٣٠ min run", "３０ min run", "log ٤٥ min bike", "log 45 min bike",
+                        "last 3 days", "last ٣ days", "past ２ weeks"):
+            intent = classify(message)
+            self.assertEqual(intent == "log_workout", parse_workout_log(message) is not None, message)
+            self.assertEqual(intent == "range_summary", parse_range_query(message.lower()) is not None, message)
+        self.assertEqual(classify("٣٠ min run"), "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""market_analysis --store runs: missing brief series and failed fetches"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (sys.path)
+
+import market_analysis
+from market_store import BRIEF_SERIES
+
+EMBEDDED = dict(zip(BRIEF_SERIES, (market_analysis.sp500_raw, market_analysis.nasdaq_raw,
+                                   market_analysis.djia_raw, market_analysis.vix_raw)))
+
+
+class StoreBriefTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix="test_brief_")
+        self.addCleanup(tmp.cleanup)
+        self.store = Path(tmp.name) / "store"
+        self.fixtures = Path(tmp.name) / "fixtures"
+        self.fixtures.mkdir()
+
+    def brief(self, *args):
+        """(stdout, stderr) of one market_analysis run against the temp store"""
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            market_analysis.main(["--store", str(self.store), "--fixtures", str(self.fixtures), *args])
+        return out.getvalue(), err.getvalue()
+
+    def test_missing_brief_series_exits_clearly(self):
+        (self.fixtures / "SP500.csv").write_text(EMBEDDED["SP500"])
+        with self.assertRaises(SystemExit) as raised:
+            self.brief()
+        self.assertIn("No NASDAQCOM, DJIA, VIXCLS history", str(raised.exception))
+        with self.assertRaises(SystemExit) as raised:
+            self.brief("--offline")
+        self.assertIn("run without --offline", str(raised.exception))
+
+    def test_failed_fetch_falls_back_to_stored_data(self):
+        for series_id, text in EMBEDDED.items():
+            (self.fixtures / f"{series_id}.csv").write_text(text)
+        first, err = self.brief()
+        self.assertIn("DGS10", first)  # default watchlist, fetched with the brief series
+        self.assertIn("could not update DGS10", err)
+
+        (self.fixtures / "VIXCLS.csv").unlink()
+        again, err = self.brief()
+        self.assertEqual(again, first)
+        self.assertIn("could not update VIXCLS, using stored data", err)
+        self.assertEqual(again, self.brief("--offline")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
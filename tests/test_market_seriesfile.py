@@ -0,0 +1,47 @@
+"""Series files (market_seriesfile): the all-time peak kept in the header"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import assert_close
+
+from bench_incremental import make_series
+from market_analysis import analyze_series
+from market_series import Series
+from market_seriesfile import append_series_file, load_series_file, open_series_file, write_series_file
+
+
+class HeaderPeakTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix="test_fser_")
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "SYNTH.fser"
+
+    def test_peak_follows_appends(self):
+        series = make_series(1200)
+        write_series_file(self.path, series[:100])
+        for start in range(100, len(series), 150):  # in place, then past capacity (rewrite)
+            chunk = series[start:start + 150]
+            append_series_file(self.path, chunk.ordinals, chunk.values)
+            expected = max(series.values[:start + len(chunk)])
+            self.assertEqual(open_series_file(self.path).peak, expected)
+            self.assertEqual(load_series_file(self.path).peak, expected)
+
+    def test_empty_file_has_no_peak(self):
+        write_series_file(self.path, Series())
+        self.assertIsNone(open_series_file(self.path).peak)
+        append_series_file(self.path, [730000], [5.0])
+        self.assertEqual(open_series_file(self.path).peak, 5.0)
+
+    def test_analyze_with_header_peak_matches_scan(self):
+        series = make_series(2000)
+        write_series_file(self.path, series)
+        mapped = open_series_file(self.path, "SYNTH")
+        self.assertIsNotNone(mapped.peak)
+        assert_close(self, analyze_series(mapped), analyze_series(series))
+        self.assertIsNone(series[:500].peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
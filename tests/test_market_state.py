@@ -0,0 +1,40 @@
+"""Incremental brief state (market_state) against a full analyze_series recompute"""
+
+import json
+import tempfile
+import unittest
+
+from support import assert_close
+
+from bench_incremental import make_series
+from market_analysis import analyze_series, analyze_stored_series
+from market_state import SeriesState, snapshot_stored_series
+from market_store import SeriesStore
+
+
+class SeriesStateTest(unittest.TestCase):
+    def test_replay_matches_full_recompute(self):
+        series = make_series(600)
+        state = SeriesState("SYNTH")
+        for i in range(len(series)):
+            state.append(series.ordinals[i], series.values[i])
+            if i % 100 == 0:
+                state = SeriesState.from_dict(json.loads(json.dumps(state.to_dict())))
+            assert_close(self, state.snapshot(), analyze_series(series[:i + 1]), f"close {i}")
+
+    def test_stored_snapshot_uses_shared_as_of(self):
+        # Brief jobs share SP500's last date as as_of; a lagging series must not use its own
+        series = make_series(400)
+        as_of = series.date_at(-1)
+        with tempfile.TemporaryDirectory(prefix="test_state_") as tmp:
+            store = SeriesStore(tmp)
+            store.append("SYNTH", series)
+            store.append("LAGGED", series[:len(series) - 5])
+            for series_id in ("SYNTH", "LAGGED"):
+                for attempt in ("fresh state", "saved state"):
+                    assert_close(self, snapshot_stored_series(tmp, series_id, as_of),
+                                 analyze_stored_series(tmp, series_id, as_of), f"{series_id} {attempt}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Workouts table (workout_journal): concurrent logging and the one-time journal import"""
+
+import json
+import multiprocessing
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+import support  # noqa: F401  (sys.path)
+
+import workout_journal
+from bench_workout_journal import DAY, garmin_writer, journal_read, reader, store_writer
+from health_store import HealthStore
+
+
+class WorkoutJournalTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix="test_journal_")
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_concurrent_appends_are_all_kept(self):
+        processes, per_process = 4, 50
+        db_path = self.tmp / "health.db"
+        HealthStore(db_path).close()
+        stop = multiprocessing.Event()
+        background = [multiprocessing.Process(target=reader, args=(db_path, stop)),
+                      multiprocessing.Process(target=garmin_writer, args=(db_path, stop))]
+        writers = [multiprocessing.Process(target=store_writer, args=(db_path, w, per_process))
+                   for w in range(processes)]
+        for p in background + writers:
+            p.start()
+        for p in writers:
+            p.join()
+        stop.set()
+        for p in background:
+            p.join()
+
+        store = HealthStore(db_path)
+        self.addCleanup(store.close)
+        logged = [w["id"] for w in workout_journal.read_workouts(DAY, DAY, store).get(DAY, [])]
+        self.assertEqual(sorted(logged), sorted(f"{w}-{i}" for w in range(processes) for i in range(per_process)))
+
+    def test_import_journal_once(self):
+        days = [(date(2026, 2, 23) - timedelta(days=i)).isoformat() for i in range(30)]
+        journal = self.tmp / "workouts.jsonl"
+        with open(journal, "w", encoding="utf-8") as f:
+            for i in range(300):
+                f.write(json.dumps({"date": days[i % 30], "type": "Run", "duration_min": 30, "id": i}) + "\n")
+        store = HealthStore(self.tmp / "health.db")
+        self.addCleanup(store.close)
+
+        self.assertEqual(workout_journal.import_journal(journal, store), 300)
+        self.assertEqual(workout_journal.import_journal(journal, store), 0)
+        self.assertEqual(workout_journal.read_workouts(days[7], days[7], store), journal_read(journal, days[7]))
+
+
+
+if __name__ == "__main__":
+    unittest.main()